@@ -1,8 +1,14 @@
 """In-memory repository implementation for Merchant entities."""
+from typing import Optional
 from uuid import UUID
 
 from app.accounts.entities.merchant import Merchant
 from app.accounts.interfaces.merchant_repo import MerchantRepository
+from app.common.adapters.db.in_memory.group_index import (
+    GroupIndex,
+    SortedGroupIndex,
+)
+from app.common.adapters.db.in_memory.name_index import NameIndex
 from app.common.adapters.db.in_memory.repository import InMemoryRepository
 
 
@@ -17,8 +23,38 @@ class InMemoryMerchantRepository(InMemoryRepository[Merchant], MerchantRepositor
         MerchantRepository: Interface defining merchant-specific operations
     """
 
+    INDEXED_FIELDS = {"organization_id": SortedGroupIndex, "status": GroupIndex}
+
+    def __init__(self):
+        """Initializes an empty repository with organization and name indexes."""
+        super().__init__()
+        # The organization field index is sorted by ID, so it also serves
+        # keyset listing by organization
+        self._by_org: SortedGroupIndex = self._field_indexes["organization_id"]
+        self._name_index = NameIndex()
+
+    def _index(self, merchant: Merchant) -> None:
+        """Index a stored merchant by name.
+
+        Args:
+            merchant (Merchant): Merchant that was just saved
+        """
+        self._name_index.add(merchant.id, merchant.name)
+
+    def _unindex(self, id: UUID) -> None:
+        """Remove a deleted merchant from the name index.
+
+        Args:
+            id (UUID): ID of the merchant that was deleted
+        """
+        self._name_index.remove(id)
+
     def list_by_organization(
-        self, org_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[Merchant]:
         """Retrieve merchants belonging to a specific organization.
 
@@ -26,13 +62,17 @@ class InMemoryMerchantRepository(InMemoryRepository[Merchant], MerchantRepositor
             org_id (UUID): The organization ID to filter merchants
             limit (int): Maximum number of merchants to return. Defaults to 100
             offset (int): Number of merchants to skip. Defaults to 0
+            after_id (Optional[UUID]): Keyset cursor; only merchants with a
+                greater ID are returned. Defaults to None
 
         Returns:
             list[Merchant]: Paginated list of merchants for the organization,
-                ordered by storage insertion order
+                ordered by ID
         """
-        merchants = [m for m in self._storage.values() if m.organization_id == org_id]
-        return merchants[offset : offset + limit]
+        merchant_ids = self._by_org.get(
+            org_id, limit=limit, offset=offset, after=after_id
+        )
+        return [self._storage[m_id] for m_id in merchant_ids]
 
     def search_by_name(self, name: str) -> list[Merchant]:
         """Search merchants by name using case-insensitive partial matching.
@@ -43,4 +83,4 @@ class InMemoryMerchantRepository(InMemoryRepository[Merchant], MerchantRepositor
         Returns:
             list[Merchant]: All merchants whose names contain the search term
         """
-        return [m for m in self._storage.values() if name.lower() in m.name.lower()]
+        return [self._storage[m_id] for m_id in self._name_index.search(name)]
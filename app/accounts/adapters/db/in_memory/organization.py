@@ -1,9 +1,13 @@
 """In-memory repository implementation for Organization entities."""
-from typing import Optional
+from itertools import islice
+from typing import Dict, Optional, Tuple
+from uuid import UUID
 
 from app.accounts.entities.organization import Organization
 from app.accounts.interfaces.organization_repo import OrganizationRepository
-from app.common.adapters.in_memory.repository import InMemoryRepository
+from app.common.adapters.db.in_memory.group_index import GroupIndex
+from app.common.adapters.db.in_memory.name_index import NameIndex
+from app.common.adapters.db.in_memory.repository import InMemoryRepository
 
 
 class InMemoryOrganizationRepository(
@@ -18,6 +22,50 @@ class InMemoryOrganizationRepository(
         OrganizationRepository: Interface defining organization-specific operations
     """
 
+    INDEXED_FIELDS = {"status": GroupIndex}
+
+    def __init__(self):
+        """Initializes an empty repository with case-insensitive lookup indexes."""
+        super().__init__()
+        self._name_ci: Dict[str, UUID] = {}
+        self._domain_ci: Dict[str, UUID] = {}
+        self._ci_keys: Dict[UUID, Tuple[str, str]] = {}
+        self._search_index = NameIndex()
+
+    def _index(self, org: Organization) -> None:
+        """Record the casefolded name and domain of a stored organization.
+
+        Args:
+            org (Organization): Organization that was just saved
+        """
+        keys = (org.name.casefold(), org.domain.casefold())
+        previous = self._ci_keys.get(org.id)
+        if previous is not None and previous != keys:
+            self._drop_keys(org.id, previous)
+        self._name_ci[keys[0]] = org.id
+        self._domain_ci[keys[1]] = org.id
+        self._ci_keys[org.id] = keys
+        self._search_index.add(org.id, org.name, org.domain)
+
+    def _unindex(self, id: UUID) -> None:
+        """Remove a deleted organization from the lookup indexes.
+
+        Args:
+            id (UUID): ID of the organization that was deleted
+        """
+        keys = self._ci_keys.pop(id, None)
+        if keys is not None:
+            self._drop_keys(id, keys)
+        self._search_index.remove(id)
+
+    def _drop_keys(self, id: UUID, keys: Tuple[str, str]) -> None:
+        """Drop index entries for the given keys if they still point at ``id``."""
+        name_ci, domain_ci = keys
+        if self._name_ci.get(name_ci) == id:
+            del self._name_ci[name_ci]
+        if self._domain_ci.get(domain_ci) == id:
+            del self._domain_ci[domain_ci]
+
     def get_by_domain(self, domain: str) -> Optional[Organization]:
         """Find an organization by its domain using case-insensitive matching.
 
@@ -27,14 +75,8 @@ class InMemoryOrganizationRepository(
         Returns:
             Optional[Organization]: Matching organization or None if not found
         """
-        return next(
-            (
-                org
-                for org in self._storage.values()
-                if org.domain.lower() == domain.lower()
-            ),
-            None,
-        )
+        org_id = self._domain_ci.get(domain.casefold())
+        return self._storage.get(org_id) if org_id else None
 
     def get_by_name(self, name: str) -> Optional[Organization]:
         """Find an organization by exact name match (case-insensitive).
@@ -45,10 +87,8 @@ class InMemoryOrganizationRepository(
         Returns:
             Optional[Organization]: Matching organization or None if not found
         """
-        return next(
-            (org for org in self._storage.values() if org.name.lower() == name.lower()),
-            None,
-        )
+        org_id = self._name_ci.get(name.casefold())
+        return self._storage.get(org_id) if org_id else None
 
     def list_by_type(
         self, org_type: str, limit: int = 100, offset: int = 0
@@ -63,8 +103,8 @@ class InMemoryOrganizationRepository(
         Returns:
             list[Organization]: Paginated list of organizations of specified type
         """
-        orgs = [org for org in self._storage.values() if org.type == org_type]
-        return orgs[offset : offset + limit]
+        orgs = (org for org in self._storage.values() if org.type == org_type)
+        return list(islice(orgs, offset, offset + limit))
 
     def search(
         self, query: str, limit: int = 100, offset: int = 0
@@ -79,10 +119,5 @@ class InMemoryOrganizationRepository(
         Returns:
             list[Organization]: Paginated list of matching organizations
         """
-        query = query.lower()
-        orgs = [
-            org
-            for org in self._storage.values()
-            if query in org.name.lower() or query in org.domain.lower()
-        ]
-        return orgs[offset : offset + limit]
+        org_ids = self._search_index.search(query)
+        return [self._storage[org_id] for org_id in org_ids[offset : offset + limit]]
@@ -0,0 +1,124 @@
+"""Test suite for InMemoryMerchantRepository."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.accounts.adapters.db.in_memory.merchant import InMemoryMerchantRepository
+from app.accounts.entities.merchant import Merchant, MerchantStatus
+
+
+@pytest.fixture
+def merchant_repo():
+    """Fixture providing an empty in-memory merchant repository."""
+    return InMemoryMerchantRepository()
+
+
+def make_merchant(name: str, org_id=None) -> Merchant:
+    """Build a merchant with the given name and organization."""
+    return Merchant(
+        name=name,
+        organization_id=org_id or uuid4(),
+        country_code="US",
+        currency="USD",
+    )
+
+
+class TestInMemoryMerchantRepository:
+    """Test cases for InMemoryMerchantRepository."""
+
+    def test_search_by_name(self, merchant_repo):
+        """Test case-insensitive partial name search."""
+        acme = merchant_repo.save(make_merchant("Acme Corp"))
+        subsidiary = merchant_repo.save(make_merchant("Acme Subsidiaries"))
+        merchant_repo.save(make_merchant("Other Corp"))
+
+        assert merchant_repo.search_by_name("acme") == [acme, subsidiary]
+        assert merchant_repo.search_by_name("SUBSID") == [subsidiary]
+        assert merchant_repo.search_by_name("NonExistent") == []
+
+    def test_search_by_name_follows_updates_and_deletes(self, merchant_repo):
+        """Test renamed and deleted merchants leave the search index."""
+        acme = merchant_repo.save(make_merchant("Acme Corp"))
+        other = merchant_repo.save(make_merchant("Other Corp"))
+
+        acme.name = "Globex"
+        merchant_repo.save(acme)
+        merchant_repo.delete(other.id)
+
+        assert merchant_repo.search_by_name("acme") == []
+        assert merchant_repo.search_by_name("corp") == []
+        assert merchant_repo.search_by_name("globex") == [acme]
+
+    def test_list_by_organization(self, merchant_repo):
+        """Test organization listing paginates in ID order."""
+        org_id = uuid4()
+        merchants = [make_merchant(f"Merchant {i}", org_id) for i in range(3)]
+        merchant_repo.bulk_save(merchants)
+        merchants.sort(key=lambda merchant: merchant.id)
+        merchant_repo.save(make_merchant("Elsewhere"))
+
+        assert merchant_repo.list_by_organization(org_id) == merchants
+        assert merchant_repo.list_by_organization(org_id, limit=1, offset=1) == [
+            merchants[1]
+        ]
+        assert merchant_repo.list_by_organization(uuid4()) == []
+
+    def test_list_by_organization_keyset(self, merchant_repo):
+        """Test pages resume after the cursor, even once it has been deleted."""
+        org_id = uuid4()
+        merchants = [make_merchant(f"Merchant {i}", org_id) for i in range(4)]
+        merchant_repo.bulk_save(merchants)
+        merchants.sort(key=lambda merchant: merchant.id)
+
+        first_page = merchant_repo.list_by_organization(org_id, limit=2)
+        merchant_repo.delete(first_page[-1].id)
+
+        assert first_page == merchants[:2]
+        assert (
+            merchant_repo.list_by_organization(
+                org_id, limit=2, after_id=first_page[-1].id
+            )
+            == merchants[2:]
+        )
+
+    def test_list_by_organization_follows_moves_and_deletes(self, merchant_repo):
+        """Test merchants moved or deleted leave their old organization bucket."""
+        org_id, new_org_id = uuid4(), uuid4()
+        moved = merchant_repo.save(make_merchant("Moved", org_id))
+        deleted = merchant_repo.save(make_merchant("Deleted", org_id))
+
+        moved.organization_id = new_org_id
+        merchant_repo.save(moved)
+        merchant_repo.delete(deleted.id)
+
+        assert merchant_repo.list_by_organization(org_id) == []
+        assert merchant_repo.list_by_organization(new_org_id) == [moved]
+
+    def test_filters_follow_indexed_field_changes(self, merchant_repo):
+        """Test filtered queries see re-saved status and organization changes."""
+        org_id = uuid4()
+        active = merchant_repo.save(make_merchant("Active", org_id))
+        suspended = merchant_repo.save(make_merchant("Suspended", org_id))
+        merchant_repo.save(make_merchant("Elsewhere"))
+
+        suspended.suspend()
+        merchant_repo.save(suspended)
+        filters = {"organization_id": org_id, "status": MerchantStatus.SUSPENDED}
+
+        assert merchant_repo.list_all(filters=filters) == [suspended]
+        assert merchant_repo.count(filters={"organization_id": org_id}) == 2
+        assert merchant_repo.find_one({"status": "active", "name": "Active"}) is active
+        assert merchant_repo.bulk_delete(filters) == 1
+        assert not merchant_repo.exists(filters)
+
+    def test_list_page_returns_page_and_total(self, merchant_repo):
+        """Test a page is returned with the count of every match."""
+        org_id = uuid4()
+        merchants = [merchant_repo.save(make_merchant(name, org_id)) for name in "ABC"]
+        merchant_repo.save(make_merchant("Elsewhere"))
+        filters = {"organization_id": org_id}
+        merchants.sort(key=lambda merchant: merchant.id)
+
+        assert merchant_repo.list_page(limit=2, filters=filters) == (merchants[:2], 3)
+        assert merchant_repo.list_page(offset=5, filters=filters) == ([], 3)
@@ -0,0 +1,62 @@
+"""Test suite for InMemoryOrganizationRepository."""
+
+import pytest
+
+from app.accounts.adapters.db.in_memory.organization import (
+    InMemoryOrganizationRepository,
+)
+from app.accounts.entities.organization import Organization
+
+
+@pytest.fixture
+def org_repo():
+    """Fixture providing an empty in-memory organization repository."""
+    return InMemoryOrganizationRepository()
+
+
+@pytest.fixture
+def acme(org_repo):
+    """Fixture providing a saved organization."""
+    return org_repo.save(Organization(name="Acme Corp", domain="acme.com"))
+
+
+class TestInMemoryOrganizationRepository:
+    """Test cases for InMemoryOrganizationRepository."""
+
+    def test_get_by_domain_is_case_insensitive(self, org_repo, acme):
+        """Test domain lookup ignores case."""
+        assert org_repo.get_by_domain("ACME.com") is acme
+        assert org_repo.get_by_domain("other.com") is None
+
+    def test_get_by_name_is_case_insensitive(self, org_repo, acme):
+        """Test name lookup ignores case."""
+        assert org_repo.get_by_name("acme corp") is acme
+        assert org_repo.get_by_name("Acme") is None
+
+    def test_indexes_follow_updates(self, org_repo, acme):
+        """Test renamed organizations are only found under their new keys."""
+        acme.name = "Acme Holdings"
+        acme.domain = "acme.io"
+        org_repo.save(acme)
+
+        assert org_repo.get_by_name("Acme Corp") is None
+        assert org_repo.get_by_domain("acme.com") is None
+        assert org_repo.get_by_name("acme holdings") is acme
+        assert org_repo.get_by_domain("acme.io") is acme
+
+    def test_indexes_follow_deletes(self, org_repo, acme):
+        """Test deleted organizations are no longer found."""
+        org_repo.delete(acme.id)
+
+        assert org_repo.get_by_name("Acme Corp") is None
+        assert org_repo.get_by_domain("acme.com") is None
+        assert org_repo.search("acme") == []
+
+    def test_search_matches_name_or_domain(self, org_repo, acme):
+        """Test search matches either field and paginates."""
+        other = org_repo.save(Organization(name="Globex", domain="globex-acme.com"))
+        org_repo.save(Organization(name="Initech", domain="initech.com"))
+
+        assert org_repo.search("ACME") == [acme, other]
+        assert org_repo.search("acme", limit=1, offset=1) == [other]
+        assert org_repo.search("missing") == []
@@ -0,0 +1,73 @@
+"""Test suite for InMemoryUserRepository."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.accounts.adapters.db.in_memory.user import InMemoryUserRepository
+from app.accounts.entities.user import User
+from app.common.value_objects.email import Email
+
+
+@pytest.fixture
+def user_repo():
+    """Fixture providing an empty in-memory user repository."""
+    return InMemoryUserRepository()
+
+
+def make_user(email: str, org_id=None) -> User:
+    """Build a user with the given email and organization."""
+    return User(
+        email=Email(email),
+        organization_id=org_id or uuid4(),
+        hashed_password="hashed_secret",
+    )
+
+
+class TestInMemoryUserRepository:
+    """Test cases for InMemoryUserRepository."""
+
+    def test_get_by_email_is_case_insensitive(self, user_repo):
+        """Test email lookup ignores case and accepts Email value objects."""
+        user = user_repo.save(make_user("John.Doe@example.com"))
+
+        assert user_repo.get_by_email("john.doe@EXAMPLE.com") is user
+        assert user_repo.get_by_email(Email("john.doe@example.com")) is user
+        assert user_repo.get_by_email("jane@example.com") is None
+
+    def test_get_by_email_returns_first_match(self, user_repo):
+        """Test an address shared across organizations resolves to the oldest user."""
+        first = user_repo.save(make_user("shared@example.com"))
+        second = user_repo.save(make_user("SHARED@example.com"))
+
+        assert user_repo.get_by_email("shared@example.com") is first
+        user_repo.delete(first.id)
+        assert user_repo.get_by_email("shared@example.com") is second
+
+    def test_get_by_email_follows_updates(self, user_repo):
+        """Test users are only found under their current email."""
+        user = user_repo.save(make_user("old@example.com"))
+
+        user.email = Email("new@example.com")
+        user_repo.save(user)
+
+        assert user_repo.get_by_email("old@example.com") is None
+        assert user_repo.get_by_email("new@example.com") is user
+
+    def test_update_login_time(self, user_repo):
+        """Test recording a login stamps the stored user."""
+        user = user_repo.save(make_user("john@example.com"))
+
+        user_repo.update_login_time(user.id)
+
+        assert user_repo.get(user.id).last_login is not None
+
+    def test_create_skips_email_taken_in_organization(self, user_repo):
+        """Test create refuses a duplicate email only within one organization."""
+        org_id = uuid4()
+        user = user_repo.create(make_user("john@example.com", org_id))
+
+        assert user is not None
+        assert user_repo.create(make_user("John@example.com", org_id)) is None
+        assert user_repo.create(make_user("john@example.com")) is not None
+        assert user_repo.create(user) is None
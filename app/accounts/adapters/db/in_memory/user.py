@@ -1,11 +1,16 @@
 """In-memory repository implementation for User entities."""
-from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from app.accounts.entities.user import User
 from app.accounts.interfaces.user_repo import UserRepository
-from app.common.adapters.in_memory.repository import InMemoryRepository
+from app.common.adapters.db.in_memory.group_index import (
+    GroupIndex,
+    SortedGroupIndex,
+)
+from app.common.adapters.db.in_memory.name_index import NameIndex
+from app.common.adapters.db.in_memory.repository import InMemoryRepository
+from app.common.value_objects.email import Email
 
 
 class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
@@ -18,6 +23,49 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
         UserRepository: Interface defining user-specific operations
     """
 
+    INDEXED_FIELDS = {"organization_id": SortedGroupIndex, "status": GroupIndex}
+
+    def __init__(self):
+        """Initializes an empty repository with email, organization and name indexes."""
+        super().__init__()
+        self._by_email = GroupIndex()
+        # The organization field index is sorted by ID, so it also serves
+        # keyset listing by organization
+        self._by_org: SortedGroupIndex = self._field_indexes["organization_id"]
+        self._name_index = NameIndex()
+
+    def _index(self, user: User) -> None:
+        """Index a stored user by casefolded email and name.
+
+        Args:
+            user (User): User that was just saved
+        """
+        self._by_email.add(Email.lookup_key(user.email), user.id)
+        self._name_index.add(user.id, user.name)
+
+    def _unindex(self, id: UUID) -> None:
+        """Remove a deleted user from the email and name indexes.
+
+        Args:
+            id (UUID): ID of the user that was deleted
+        """
+        self._by_email.remove(id)
+        self._name_index.remove(id)
+
+    def _conflicts(self, user: User) -> bool:
+        """Check whether the organization already has a user with this email.
+
+        Args:
+            user (User): User about to be created
+
+        Returns:
+            bool: True if the email is taken within the user's organization
+        """
+        return any(
+            self._storage[id].organization_id == user.organization_id
+            for id in self._by_email.get(Email.lookup_key(user.email))
+        )
+
     def get_by_email(self, email: str) -> Optional[User]:
         """Retrieve a user by their email address (case-insensitive).
 
@@ -27,17 +75,15 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
         Returns:
             Optional[User]: User with matching email or None if not found
         """
-        return next(
-            (
-                user
-                for user in self._storage.values()
-                if user.email.lower() == email.lower()
-            ),
-            None,
-        )
+        user_ids = self._by_email.get(Email.lookup_key(email), limit=1)
+        return self._storage[user_ids[0]] if user_ids else None
 
     def get_by_organization(
-        self, org_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[User]:
         """List users belonging to a specific organization with pagination.
 
@@ -45,14 +91,15 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
             org_id (UUID): Organization ID to filter users
             limit (int): Maximum results to return. Defaults to 100
             offset (int): Number of records to skip. Defaults to 0
+            after_id (Optional[UUID]): Keyset cursor; only users with a greater
+                ID are returned. Defaults to None
 
         Returns:
-            list[User]: Paginated list of users in the specified organization
+            list[User]: Paginated list of users in the specified organization,
+                ordered by ID
         """
-        users = [
-            user for user in self._storage.values() if user.organization_id == org_id
-        ]
-        return users[offset : offset + limit]
+        user_ids = self._by_org.get(org_id, limit=limit, offset=offset, after=after_id)
+        return [self._storage[user_id] for user_id in user_ids]
 
     def search_by_name(self, name: str) -> list[User]:
         """Search users by name using case-insensitive partial matching.
@@ -63,9 +110,7 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
         Returns:
             list[User]: All users whose names contain the search term
         """
-        return [
-            user for user in self._storage.values() if name.lower() in user.name.lower()
-        ]
+        return [self._storage[user_id] for user_id in self._name_index.search(name)]
 
     def update_login_time(self, user_id: UUID) -> None:
         """Update the last login timestamp for a specified user.
@@ -78,5 +123,5 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
         """
         user = self.get(user_id)
         if user:
-            user.last_login_at = datetime.now()
+            user.record_login()
             self.save(user)
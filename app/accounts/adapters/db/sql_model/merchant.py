@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Any, Iterator, Mapping, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from app.accounts.adapters.db.sql_model.models import MerchantORM
 from app.accounts.entities.merchant import Merchant
@@ -34,48 +34,92 @@ class SQLModelMerchantRepository(
         super().__init__(session, MerchantORM)
 
     def list_by_organization(
-        self, org_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[Merchant]:
         """
         List merchants by the organization.
 
         This method retrieves a list of merchants associated with a given
-        organization, with support for pagination using limit and offset.
+        organization, with support for offset or keyset pagination.
 
         Args:
             org_id (UUID): The ID of the organization to filter merchants by.
             limit (int): The maximum number of merchants to return. Defaults to 100.
             offset (int): The number of merchants to skip. Defaults to 0.
+            after_id (Optional[UUID]): Keyset cursor; only merchants with a
+                greater ID are included. Defaults to None.
 
         Returns:
             list[Merchant]: A list of `Merchant` domain entities.
         """
+        return list(
+            self.iter_by_organization(
+                org_id, limit=limit, offset=offset, after_id=after_id
+            )
+        )
+
+    def iter_by_organization(
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
+    ) -> Iterator[Merchant]:
+        """
+        Lazily iterate merchants by organization.
+
+        Unlike `list_by_organization`, rows are streamed from the database
+        and converted one at a time without ORM hydration, keeping memory
+        flat for large pages.
+        Results are ordered by ID so pages walk the ``(organization_id, id)``
+        index without a sort.
+
+        Args:
+            org_id (UUID): The ID of the organization to filter merchants by.
+            limit (int): The maximum number of merchants to yield. Defaults to 100.
+            offset (int): The number of merchants to skip. Defaults to 0.
+            after_id (Optional[UUID]): Keyset cursor; only merchants with a
+                greater ID are included. Defaults to None.
+
+        Yields:
+            Merchant: The `Merchant` domain entities of the organization.
+        """
         stmt = (
-            select(self.model)
+            self._select_columns()
             .where(self.model.organization_id == org_id)
+            .order_by(self.model.id)
             .limit(limit)
             .offset(offset)
         )
-        result = self.session.exec(stmt)
-        return [self._to_entity(model) for model in result.all()]
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        return self._stream(stmt)
 
-    def search_by_name(self, name: str) -> Optional[Merchant]:
+    def search_by_name(self, name: str) -> list[Merchant]:
         """
-        Get a merchant by its name.
+        Search merchants by name.
 
-        This method retrieves a merchant based on the provided name.
+        This method performs a case-insensitive partial match on merchant
+        names, served by the ``lower(name)`` trigram index on PostgreSQL.
 
         Args:
-            name (str): The name of the merchant to search for.
+            name (str): The search term to match against merchant names.
 
         Returns:
-            Optional[Merchant]: The `Merchant` domain entity if found,
-                                 otherwise `None`.
+            list[Merchant]: The `Merchant` domain entities whose names contain
+                            the search term, oldest first.
         """
-        stmt = select(self.model).where(self.model.name == name)
-        result = self.session.execute(stmt)
-        db_model = result.scalar_one_or_none()
-        return self._to_entity(db_model) if db_model else None
+        stmt = (
+            select(self.model)
+            .where(func.lower(self.model.name).contains(name.lower(), autoescape=True))
+            .order_by(self.model.created_at, self.model.id)
+        )
+        result = self.session.exec(stmt)
+        return [self._to_entity(model) for model in result.all()]
 
     def _to_model(self, merchant: Merchant) -> MerchantORM:
         """
@@ -116,3 +160,16 @@ class SQLModelMerchantRepository(
             created_at=model.created_at,
             status=model.status,
         )
+
+    @staticmethod
+    def _row_to_entity(row: Mapping[str, Any]) -> Merchant:
+        """
+        Convert a row of `MerchantORM` column values to a `Merchant` domain entity.
+
+        Args:
+            row (Mapping[str, Any]): Column values keyed by column name.
+
+        Returns:
+            Merchant: The corresponding `Merchant` domain entity.
+        """
+        return Merchant(**row)
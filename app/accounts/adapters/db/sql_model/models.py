@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import DDL, Index, event, func, text
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
 from app.accounts.entities.user import UserStatus
@@ -51,6 +52,8 @@ class UserORM(SQLModel, table=True):
         id (UUID): The unique identifier for the user.
         name (str): The name of the user.
         email (str): The email address of the user.
+        email_normalized (str): The casefolded address used for lookups and
+            uniqueness, see `Email.lookup_key`.
         hashed_password (str): The hashed password of the user.
         last_login_at (datetime | None): The timestamp of the user's last login.
         organization_id (UUID): The ID of the organization the user belongs to.
@@ -62,12 +65,15 @@ class UserORM(SQLModel, table=True):
     __tablename__ = "accounts_users"
 
     __table_args__ = (
-        UniqueConstraint("email", "organization_id", name="unique_org_user"),
+        UniqueConstraint("email_normalized", "organization_id", name="unique_org_user"),
+        Index("ix_accounts_users_org_id", "organization_id", "id"),
+        Index("ix_accounts_users_org_status", "organization_id", "status"),
     )
 
     id: UUID = Field(default=None, primary_key=True)
     name: str = Field(default=None)
-    email: str = Field(index=True)
+    email: str
+    email_normalized: str = Field(index=True)
     hashed_password: str
     last_login_at: datetime | None
     organization_id: UUID = Field(default=None, foreign_key="accounts_organizations.id")
@@ -97,6 +103,19 @@ class MerchantORM(SQLModel, table=True):
 
     __tablename__ = "accounts_merchants"
 
+    __table_args__ = (
+        Index("ix_accounts_merchants_org_id", "organization_id", "id"),
+        Index("ix_accounts_merchants_org_status", "organization_id", "status"),
+        # Partial index for the common active-only listing
+        Index(
+            "ix_accounts_merchants_org_active",
+            "organization_id",
+            "id",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'"),
+        ),
+    )
+
     id: UUID = Field(default=None, primary_key=True)
     name: str = Field(index=True)
     status: str
@@ -109,3 +128,20 @@ class MerchantORM(SQLModel, table=True):
 
     # Relationships
     organization: OrganizationORM | None = Relationship(back_populates="merchants")
+
+
+# Case-insensitive substring search on merchant names (``lower(name) LIKE '%x%'``).
+# On PostgreSQL this is a trigram GIN index; other dialects get a plain index
+# on the expression.
+Index(
+    "ix_accounts_merchants_name_trgm",
+    func.lower(MerchantORM.name).label("lower_name"),
+    postgresql_using="gin",
+    postgresql_ops={"lower_name": "gin_trgm_ops"},
+)
+
+event.listen(
+    MerchantORM.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,21 @@
+"""Shared fixtures for the SQLModel repository tests."""
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.accounts.adapters.db.sql_model.models  # noqa: F401  (registers tables)
+
+
+@pytest.fixture
+def session():
+    """Fixture providing a session on a fresh in-memory SQLite database."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
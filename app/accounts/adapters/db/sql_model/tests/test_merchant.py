@@ -0,0 +1,90 @@
+"""Test suite for SQLModelMerchantRepository."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.accounts.adapters.db.sql_model.merchant import SQLModelMerchantRepository
+from app.accounts.entities.merchant import Merchant
+
+
+@pytest.fixture
+def merchant_repo(session):
+    """Fixture providing a merchant repository bound to the test session."""
+    return SQLModelMerchantRepository(session)
+
+
+def make_merchant(name: str, org_id=None) -> Merchant:
+    """Build a merchant with the given name and organization."""
+    return Merchant(
+        organization_id=org_id or uuid4(),
+        name=name,
+        country_code="US",
+        currency="USD",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+class TestSQLModelMerchantRepository:
+    """Test cases for SQLModelMerchantRepository."""
+
+    def test_create_inserts_entity(self, merchant_repo):
+        """Test that create writes the row and returns the entity."""
+        merchant = make_merchant("Acme")
+
+        created = merchant_repo.create(merchant)
+
+        assert created == merchant
+        assert merchant_repo.get(merchant.id).name == "Acme"
+
+    def test_create_duplicate_returns_none(self, merchant_repo):
+        """Test that inserting an existing ID reports a conflict."""
+        merchant = make_merchant("Acme")
+        merchant_repo.create(merchant)
+
+        duplicate = merchant_repo.create(merchant.model_copy(update={"name": "Other"}))
+
+        assert duplicate is None
+        assert merchant_repo.count() == 1
+        assert merchant_repo.get(merchant.id).name == "Acme"
+
+    def test_list_page_returns_page_and_total(self, merchant_repo):
+        """Test that a page carries the total count of all matches."""
+        org_id = uuid4()
+        merchant_repo.create_many(
+            [make_merchant(f"Merchant {i}", org_id=org_id) for i in range(5)],
+            now=datetime.now(timezone.utc),
+        )
+        merchant_repo.create(make_merchant("Elsewhere"))
+
+        page, total = merchant_repo.list_page(
+            limit=2, offset=1, sort_by="name", filters={"organization_id": org_id}
+        )
+
+        assert [merchant.name for merchant in page] == ["Merchant 1", "Merchant 2"]
+        assert total == 5
+
+    def test_list_page_without_matches_is_empty(self, merchant_repo):
+        """Test that a filter matching nothing returns no rows and a zero total."""
+        merchant_repo.create(make_merchant("Acme"))
+
+        page, total = merchant_repo.list_page(filters={"organization_id": uuid4()})
+
+        assert page == []
+        assert total == 0
+
+    def test_list_page_past_the_end_still_counts(self, merchant_repo):
+        """Test that an offset past the last match falls back to a count."""
+        org_id = uuid4()
+        merchant_repo.create_many(
+            [make_merchant(f"Merchant {i}", org_id=org_id) for i in range(3)],
+            now=datetime.now(timezone.utc),
+        )
+
+        page, total = merchant_repo.list_page(
+            limit=10, offset=10, filters={"organization_id": org_id}
+        )
+
+        assert page == []
+        assert total == 3
@@ -0,0 +1,122 @@
+"""Test suite for SQLModelUserRepository."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, update
+from sqlmodel import Session
+
+from app.accounts.adapters.db.sql_model.models import UserORM
+from app.accounts.adapters.db.sql_model.user import SQLModelUserRepository
+from app.accounts.entities.user import User
+from app.common.value_objects.email import Email
+
+
+@pytest.fixture
+def user_repo(session):
+    """Fixture providing a user repository bound to the test session."""
+    return SQLModelUserRepository(session)
+
+
+def make_user(email: str, org_id=None, created_at=None) -> User:
+    """Build a user with the given email, organization and creation time."""
+    return User(
+        email=Email(email),
+        organization_id=org_id or uuid4(),
+        hashed_password="hashed_secret",
+        name="Test User",
+        created_at=created_at or datetime.now(timezone.utc),
+    )
+
+
+class TestSQLModelUserRepository:
+    """Test cases for SQLModelUserRepository."""
+
+    def test_get_by_email_in_several_organizations_returns_oldest(self, user_repo):
+        """Test that an address shared across organizations resolves to one user."""
+        now = datetime.now(timezone.utc)
+        newer = user_repo.create(make_user("Shared@example.com", created_at=now))
+        older = user_repo.create(
+            make_user("shared@example.com", created_at=now - timedelta(days=1))
+        )
+
+        found = user_repo.get_by_email("SHARED@example.com")
+
+        assert found.id == older.id
+        assert found.id != newer.id
+
+    def test_get_by_email_repeated_lookup_skips_database(self, user_repo, session):
+        """Test that a second lookup in the session is served from the cache."""
+        user = user_repo.create(make_user("cached@example.com"))
+        user_repo.get_by_email("cached@example.com")
+        statements = []
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        found = user_repo.get_by_email("CACHED@example.com")
+
+        assert found.id == user.id
+        assert statements == []
+
+    def test_get_by_email_cache_is_dropped_on_commit(self, user_repo, session):
+        """Test that a commit makes the next lookup read the database again."""
+        user = user_repo.create(make_user("stale@example.com"))
+        user_repo.get_by_email("stale@example.com")
+        session.execute(
+            update(UserORM).where(UserORM.id == user.id).values(name="Renamed")
+        )
+        cached = user_repo.get_by_email("stale@example.com")
+
+        session.commit()
+        found = user_repo.get_by_email("stale@example.com")
+
+        assert cached.name == "Test User"
+        assert found.name == "Renamed"
+
+    def test_create_same_email_in_organization_returns_none(self, user_repo):
+        """Test that the per-organization email constraint reports a conflict."""
+        org_id = uuid4()
+        user_repo.create(make_user("taken@example.com", org_id=org_id))
+
+        duplicate = user_repo.create(make_user("TAKEN@example.com", org_id=org_id))
+
+        assert duplicate is None
+        assert user_repo.count() == 1
+
+    def test_create_same_email_in_other_organization(self, user_repo):
+        """Test that an address can be reused in another organization."""
+        user_repo.create(make_user("taken@example.com"))
+
+        created = user_repo.create(make_user("taken@example.com"))
+
+        assert created is not None
+        assert user_repo.count() == 2
+
+    def test_row_conversions_are_cached_per_session(
+        self, user_repo, session, monkeypatch
+    ):
+        """Test that converted rows are reused in a session but not across."""
+        user_repo.create(make_user("memo@example.com"))
+        conversions = []
+        row_to_entity = SQLModelUserRepository._row_to_entity
+
+        def counting_row_to_entity(row):
+            conversions.append(row["email"])
+            return row_to_entity(row)
+
+        monkeypatch.setattr(
+            SQLModelUserRepository,
+            "_row_to_entity",
+            staticmethod(counting_row_to_entity),
+        )
+
+        user_repo.get_by_email("memo@example.com")
+        user_repo.get_by_email("memo@example.com")
+        with Session(session.get_bind()) as other_session:
+            SQLModelUserRepository(other_session).get_by_email("memo@example.com")
+
+        assert conversions == ["memo@example.com", "memo@example.com"]
@@ -1,16 +1,20 @@
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterator, Mapping, Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlmodel import Session
+from sqlalchemy import event
+from sqlmodel import Session, update
 
 from app.accounts.adapters.db.sql_model.models import UserORM
 from app.accounts.entities.user import User
 from app.accounts.interfaces.user_repo import UserRepository
+from app.common import clock
 from app.common.adapters.db.sql_model import SQLModelRepository
+from app.common.exceptions import RecordNotFoundError, RepositoryError
 from app.common.value_objects.email import Email
 
+# Key of the per-session email lookup cache in ``Session.info``
+_EMAIL_CACHE_KEY = "accounts_users_by_email"
+
 
 class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
     """
@@ -38,6 +42,11 @@ class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
         Get a user by email address.
 
         This method retrieves a user entity based on the provided email address.
+        Matching is case-insensitive: the address is folded with
+        `Email.lookup_key` and compared against the indexed
+        ``email_normalized`` column. Rows found are remembered for the rest
+        of the session, so repeated lookups within a request skip the
+        database; the cache is dropped on every commit.
 
         Args:
             email (str): The email address of the user to search for.
@@ -45,51 +54,139 @@ class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
         Returns:
             Optional[User]: The `User` domain entity if found, otherwise `None`.
         """
-        stmt = select(self.model).where(self.model.email == email)
-        result = self.session.execute(stmt)
-        db_model = result.scalar_one_or_none()
-        return self._to_entity(db_model) if db_model else None
+        key = Email.lookup_key(email)
+        cache = self._email_cache()
+        row = cache.get(key)
+        if row is None:
+            # The address is only unique per organization; like the
+            # in-memory repository, the oldest match wins.
+            stmt = (
+                self._select_columns()
+                .where(self.model.email_normalized == key)
+                .order_by(self.model.created_at, self.model.id)
+                .limit(1)
+            )
+            row = self.session.execute(stmt).mappings().first()
+            if row is None:
+                return None
+            cache[key] = row
+        return self._cached_row_to_entity(row)
+
+    def _email_cache(self) -> Dict[str, Mapping[str, Any]]:
+        """
+        Get the email lookup cache of the current session.
+
+        The cache lives in ``Session.info`` so it is shared by every user
+        repository on the session, and is cleared after each commit since
+        any write may have changed the cached rows.
+
+        Returns:
+            Dict[str, Mapping[str, Any]]: User rows keyed by normalized email.
+        """
+        cache = self.session.info.get(_EMAIL_CACHE_KEY)
+        if cache is None:
+            cache = self.session.info[_EMAIL_CACHE_KEY] = {}
+            event.listen(self.session, "after_commit", lambda _: cache.clear())
+        return cache
 
     def list_by_organization(
-        self, org_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> list[User]:
         """
         List users by organization.
 
         This method retrieves a list of users associated with a given
-        organization, with support for pagination using limit and offset.
+        organization, with support for offset or keyset pagination.
 
         Args:
             org_id (UUID): The ID of the organization to filter users by.
             limit (int): The maximum number of users to return. Defaults to 100.
             offset (int): The number of users to skip. Defaults to 0.
+            after_id (Optional[UUID]): Keyset cursor; only users with a
+                greater ID are included. Defaults to None.
 
         Returns:
             list[User]: A list of `User` domain entities.
         """
+        return list(
+            self.iter_by_organization(
+                org_id, limit=limit, offset=offset, after_id=after_id
+            )
+        )
+
+    def iter_by_organization(
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
+    ) -> Iterator[User]:
+        """
+        Lazily iterate users by organization.
+
+        Unlike `list_by_organization`, rows are streamed from the database
+        and converted one at a time without ORM hydration, keeping memory
+        flat for large pages.
+        Results are ordered by ID so pages walk the ``(organization_id, id)``
+        index without a sort.
+
+        Args:
+            org_id (UUID): The ID of the organization to filter users by.
+            limit (int): The maximum number of users to yield. Defaults to 100.
+            offset (int): The number of users to skip. Defaults to 0.
+            after_id (Optional[UUID]): Keyset cursor; only users with a
+                greater ID are included. Defaults to None.
+
+        Yields:
+            User: The `User` domain entities of the organization.
+        """
         stmt = (
-            select(self.model)
+            self._select_columns()
             .where(self.model.organization_id == org_id)
+            .order_by(self.model.id)
             .limit(limit)
             .offset(offset)
         )
-        result = self.session.execute(stmt)
-        return [self._to_entity(model) for model in result.scalars()]
+        if after_id is not None:
+            stmt = stmt.where(self.model.id > after_id)
+        return self._stream(stmt)
 
-    async def update_login_time(self, user_id: UUID) -> None:
+    def update_login_time(self, user_id: UUID) -> None:
         """
         Update the last login time for a user.
 
-        This method updates the `last_login_at` attribute of the user identified
-        by the provided user ID to the current timestamp.
+        This method sets the `last_login_at` column of the user identified
+        by the provided user ID to the current timestamp with a single
+        UPDATE statement, without loading the user first.
 
         Args:
             user_id (UUID): The ID of the user whose login time will be updated.
+
+        Raises:
+            RecordNotFoundError: If no user has the given ID.
+            RepositoryError: If a database error occurs.
         """
-        user = await self.get(user_id)
-        if user:
-            user.last_login_at = datetime.now()
-            self.save(user)
+        stmt = (
+            update(self.model)
+            .where(self.model.id == user_id)
+            .values(last_login_at=clock.now())
+        )
+        try:
+            result = self.session.execute(stmt)
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise RepositoryError(
+                f"Failed to update login time for user {user_id}"
+            ) from e
+        if result.rowcount == 0:
+            raise RecordNotFoundError(
+                entity_type=self.model.__name__, identifier=user_id
+            )
 
     def _to_model(self, user: User) -> UserORM:
         """
@@ -103,7 +200,8 @@ class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
         """
         return UserORM(
             id=user.id,
-            email=user.email.email_address,
+            email=user.email.value,
+            email_normalized=Email.lookup_key(user.email),
             name=user.name,
             status=user.status.value,
             hashed_password=user.hashed_password,
@@ -125,7 +223,7 @@ class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
         """
         return User(
             id=model.id,
-            email=Email(model.email),
+            email=Email.from_trusted(model.email),
             name=model.name,
             hashed_password=model.hashed_password,
             organization_id=model.organization_id,
@@ -133,3 +231,20 @@ class SQLModelUserRepository(SQLModelRepository[User, UserORM], UserRepository):
             last_login=model.last_login_at,
             # metadata=model.metadata,
         )
+
+    @staticmethod
+    def _row_to_entity(row: Mapping[str, Any]) -> User:
+        """
+        Convert a row of `UserORM` column values to a `User` domain entity.
+
+        Args:
+            row (Mapping[str, Any]): Column values keyed by column name.
+
+        Returns:
+            User: The corresponding `User` domain entity.
+        """
+        fields = dict(row)
+        fields["email"] = Email.from_trusted(fields["email"])
+        del fields["email_normalized"]
+        fields["last_login"] = fields.pop("last_login_at")
+        return User(**fields)
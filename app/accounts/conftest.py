@@ -1,8 +1,8 @@
 """Shared test fixtures for the accounts domain."""
 
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from uuid import uuid4
-from unittest.mock import Mock
 
 import pytest
 
@@ -10,141 +10,169 @@ from app.accounts.entities.merchant import Merchant, MerchantStatus
 from app.accounts.entities.organization import Organization, OrganizationStatus
 from app.accounts.entities.user import User, UserStatus
 from app.accounts.entities.token_data import TokenData
-from app.accounts.schemas.user_schemas import UserResponse
 from app.common.value_objects.email import Email
 from app.common.value_objects.domain_name import DomainName
 
 
-# Mock Services
-@pytest.fixture
-def mock_auth_service():
-    """Mock authentication service."""
-    return Mock()
-
-@pytest.fixture
-def mock_user_service():
-    """Mock user service."""
-    return Mock()
-
-@pytest.fixture
-def mock_organization_service():
-    """Mock organization service."""
-    return Mock()
-
-@pytest.fixture
-def mock_merchant_service():
-    """Mock merchant service."""
-    return Mock()
+def _construct(entity_type, data):
+    """Build an entity from trusted fixture data without running its validators."""
+    return entity_type.model_construct(**data)
 
 # Base Data
-@pytest.fixture
+_ALT_ORG_ID = uuid4()
+_ALT_USER_ID = uuid4()
+
+@pytest.fixture(scope="session")
 def valid_org_id():
     """Fixture providing a consistent organization ID."""
     return uuid4()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_user_id():
     """Fixture providing a consistent user ID."""
     return uuid4()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_merchant_id():
     """Fixture providing a consistent merchant ID."""
     return uuid4()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_email() -> Email:
     """Fixture providing a valid Email value object."""
     return Email("test@example.com")
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_domain() -> DomainName:
     """Fixture providing a valid domain name value object."""
     return DomainName("test-org.com")
 
 # Organization Fixtures
-@pytest.fixture
-def valid_org_data():
-    """Fixture providing valid organization test data."""
-    return {
+_ORG_VARIANTS = {
+    "primary": {
         "name": "Test Organization",
         "domain": "test-org.com",
         "status": OrganizationStatus.ACTIVE,
         "metadata": {},
-    }
-
-@pytest.fixture
-def valid_organization(valid_org_data):
-    """Fixture providing a valid Organization entity."""
-    return Organization(**valid_org_data)
-
-@pytest.fixture
-def alternate_org_data():
-    """Fixture providing alternate organization test data."""
-    return {
-        "id": uuid4(),
+    },
+    "alternate": {
+        "id": _ALT_ORG_ID,
         "name": "Another Organization",
         "domain": "another-org.com",
         "status": OrganizationStatus.PENDING,
         "created_at": datetime(2024, 1, 2, 0, 0, 0),
         "updated_at": datetime(2024, 1, 2, 0, 0, 0),
         "metadata": {"type": "subsidiary"},
-    }
+    },
+}
+
+@pytest.fixture(params=list(_ORG_VARIANTS))
+def org_data(request):
+    """Fixture providing organization test data for each variant.
+
+    Select a single variant with ``indirect=True`` parametrization. A fresh
+    copy is returned so tests may mutate it.
+    """
+    data = _ORG_VARIANTS[request.param]
+    return {**data, "metadata": dict(data["metadata"])}
+
+@pytest.fixture(scope="session")
+def valid_org_data():
+    """Fixture providing read-only valid organization test data."""
+    return MappingProxyType(_ORG_VARIANTS["primary"])
 
-# User Fixtures
 @pytest.fixture
-def valid_user_data(valid_org_id, valid_user_id, valid_email):
-    """Fixture providing valid user test data."""
+def valid_organization(valid_org_data):
+    """Fixture providing a valid Organization entity."""
+    return _construct(Organization, {**valid_org_data, "metadata": {}})
+
+# User Fixtures
+@pytest.fixture(scope="session")
+def user_variants(valid_org_id, valid_user_id, valid_email):
+    """Fixture providing the user test data variants, built once per session."""
     return {
-        "id": valid_user_id,
-        "email": valid_email,
-        "organization_id": valid_org_id,
-        "hashed_password": "hashed_secret_password_123",
-        "name": "Test User",
-        "status": UserStatus.ACTIVE,
-        "created_at": datetime(2024, 1, 1, 0, 0, 0),
-        "last_login": None,
+        "primary": {
+            "id": valid_user_id,
+            "email": valid_email,
+            "organization_id": valid_org_id,
+            "hashed_password": "hashed_secret_password_123",
+            "name": "Test User",
+            "status": UserStatus.ACTIVE,
+            "created_at": datetime(2024, 1, 1, 0, 0, 0),
+            "last_login": None,
+        },
+        "alternate": {
+            "id": _ALT_USER_ID,
+            "email": Email("another.user@another-org.com"),
+            "organization_id": _ALT_ORG_ID,
+            "hashed_password": "different_hashed_password_456",
+            "name": "Another User",
+            "status": UserStatus.ACTIVE,
+            "created_at": datetime(2024, 1, 2, 0, 0, 0),
+            "last_login": datetime(2024, 1, 2, 1, 0, 0),
+        },
     }
 
+@pytest.fixture(params=["primary", "alternate"])
+def user_data(request, user_variants):
+    """Fixture providing user test data for each variant.
+
+    Select a single variant with ``indirect=True`` parametrization. A fresh
+    copy is returned so tests may mutate it.
+    """
+    return dict(user_variants[request.param])
+
+@pytest.fixture(scope="session")
+def valid_user_data(user_variants):
+    """Fixture providing read-only valid user test data."""
+    return MappingProxyType(user_variants["primary"])
+
 @pytest.fixture
-def valid_user(valid_user_data):
-    """Fixture providing a valid User entity."""
-    return User(**valid_user_data)
+def valid_user_data_mut(valid_user_data):
+    """Fixture providing a mutable copy of the valid user test data."""
+    return dict(valid_user_data)
 
 @pytest.fixture
-def alternate_user_data(alternate_org_data):
-    """Fixture providing alternate user test data."""
-    return {
-        "id": uuid4(),
-        "email": Email("another.user@another-org.com"),
-        "organization_id": alternate_org_data["id"],
-        "hashed_password": "different_hashed_password_456",
-        "name": "Another User",
-        "status": UserStatus.ACTIVE,
-        "created_at": datetime(2024, 1, 2, 0, 0, 0),
-        "last_login": datetime(2024, 1, 2, 1, 0, 0),
-    }
+def valid_user(valid_user_data):
+    """Fixture providing a valid User entity."""
+    return _construct(User, valid_user_data)
 
 # Merchant Fixtures
+@pytest.fixture(scope="session")
+def valid_merchant_request_data(valid_org_id):
+    """Fixture providing read-only valid merchant test data."""
+    return MappingProxyType(
+        {
+            "organization_id": str(valid_org_id),
+            "name": "Test Merchant",
+            "description": "Test merchant description",
+            "country_code": "US",
+            "currency": "USD",
+            "status": MerchantStatus.ACTIVE,
+            "payment_methods": [],
+            "api_keys": [],
+            "metadata": {},
+        }
+    )
+
 @pytest.fixture
-def valid_merchant_request_data(valid_org_id, valid_merchant_id):
-    """Fixture providing valid merchant test data."""
-    return {
-        "organization_id": str(valid_org_id),
-        "name": "Test Merchant",
-        "description": "Test merchant description",
-        "country_code": "US",
-        "currency": "USD",
-        "status": MerchantStatus.ACTIVE,
-        "payment_methods": [],
-        "api_keys": [],
-        "metadata": {},
-    }
+def valid_merchant_request_data_mut(valid_merchant_request_data):
+    """Fixture providing a mutable copy of the valid merchant test data."""
+    return dict(valid_merchant_request_data)
 
 @pytest.fixture
-def valid_merchant(valid_merchant_request_data):
+def valid_merchant(valid_merchant_request_data, valid_org_id):
     """Fixture providing a valid Merchant entity."""
-    return Merchant(**valid_merchant_request_data)
+    return _construct(
+        Merchant,
+        {
+            **valid_merchant_request_data,
+            "organization_id": valid_org_id,
+            "payment_methods": [],
+            "api_keys": [],
+            "metadata": {},
+        },
+    )
 
 @pytest.fixture
 def valid_merchant_response_data(valid_merchant_id):
@@ -183,24 +211,21 @@ def valid_user_response_data(valid_user_data):
 @pytest.fixture
 def valid_user_response(valid_user_response_data):
     """Fixture providing valid user response."""
+    # Imported here so collecting non-schema tests skips the schema modules.
+    from app.accounts.schemas.user_schemas import UserResponse
+
     return UserResponse(**valid_user_response_data)
 
 # Utility Fixtures
 @pytest.fixture
 def mock_datetime(monkeypatch):
-    """Fixture to mock datetime for consistent timestamps."""
-    class MockDateTime:
-        @staticmethod
-        def now():
-            return datetime(2024, 1, 1, 0, 0, 0)
-
-    monkeypatch.setattr("app.accounts.entities.organization.datetime", MockDateTime)
-    monkeypatch.setattr("app.accounts.entities.user.datetime", MockDateTime)
-    monkeypatch.setattr("app.accounts.entities.merchant.datetime", MockDateTime)
-    return MockDateTime
+    """Fixture freezing the entity clock for consistent timestamps."""
+    frozen = datetime(2024, 1, 1, 0, 0, 0)
+    monkeypatch.setattr("app.accounts.entities._time.now", lambda: frozen)
+    return frozen
 
 
 @pytest.fixture
 def user(valid_user_data):
     """Fixture providing a valid User instance."""
-    return User(**valid_user_data)
\ No newline at end of file
+    return _construct(User, valid_user_data)
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Clock used by the accounts entities for their timestamps."""
+
+from datetime import datetime
+
+from app.common import clock
+
+
+def now() -> datetime:
+    """Return the current time, shared across the current request.
+
+    Entities read the clock through this function, so tests can freeze every
+    entity timestamp by patching this one attribute.
+
+    Returns:
+        datetime: The request start time when serving a request, otherwise
+            the current local time.
+    """
+    return clock.now()
@@ -1,9 +1,13 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import Any, Iterable, List, Optional, Set
+from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+from app.accounts.entities import _time
+from app.common.ids import uuid7
+from app.common.iso_codes import COUNTRY_CODES, CURRENCY_CODES
 
 
 class MerchantStatus(str, Enum):
@@ -23,6 +27,9 @@ class MerchantStatus(str, Enum):
     UNDER_REVIEW = "under_review"
 
 
+_ACTIVE = MerchantStatus.ACTIVE
+
+
 class Merchant(BaseModel):
     """Root entity representing a business that processes financial transactions.
 
@@ -38,7 +45,7 @@ class Merchant(BaseModel):
         country_code: ISO 3166-1 alpha-2 country code (e.g., 'US').
         currency: ISO 4217 transaction currency code (e.g., 'USD').
         created_at: Timestamp of entity creation.
-        updated_at: Timestamp of last modification.
+        updated_at: Timestamp of last modification, defaults to created_at.
         status: Current operational state from MerchantStatus.
         payment_methods: List of enabled payment processor codes.
         api_keys: List of active API authentication credentials.
@@ -56,22 +63,35 @@ class Merchant(BaseModel):
         <MerchantStatus.ACTIVE>
     """
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     organization_id: UUID
     name: str
     description: Optional[str] = None
     country_code: str
     currency: str
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: _time.now())
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])
     status: MerchantStatus = MerchantStatus.ACTIVE
     payment_methods: List[str] = Field(default_factory=list)
     api_keys: List[UUID] = Field(default_factory=list)
     metadata: dict = Field(default_factory=dict)
 
+    _payment_methods_index: Set[str] = PrivateAttr(default_factory=set)
+    _api_keys_index: Set[UUID] = PrivateAttr(default_factory=set)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the membership indexes over payment methods and API keys.
+
+        The lists keep their order for API responses, while the mutators check
+        duplicates against these sets. Runs for ``model_construct`` as well as
+        validated construction.
+        """
+        self._payment_methods_index = set(self.payment_methods)
+        self._api_keys_index = set(self.api_keys)
+
     @field_validator("country_code")
     def validate_country_code(cls, v: str) -> str:
-        """Validate country code format.
+        """Validate country code against the assigned ISO 3166-1 codes.
 
         Args:
             v: Country code to validate.
@@ -80,15 +100,16 @@ class Merchant(BaseModel):
             Validated uppercase country code.
 
         Raises:
-            ValueError: If code is not 2 letters.
+            ValueError: If code is not an assigned alpha-2 code.
         """
-        if not v.isalpha() or len(v) != 2:
+        code = v.upper()
+        if code not in COUNTRY_CODES:
             raise ValueError("Country code must be ISO 3166-1 alpha-2 format")
-        return v.upper()
+        return code
 
     @field_validator("currency")
     def validate_currency(cls, v: str) -> str:
-        """Validate currency code format.
+        """Validate currency code against the active ISO 4217 codes.
 
         Args:
             v: Currency code to validate.
@@ -97,11 +118,12 @@ class Merchant(BaseModel):
             Validated uppercase currency code.
 
         Raises:
-            ValueError: If code is not 3 letters.
+            ValueError: If code is not an active ISO 4217 code.
         """
-        if not v.isalpha() or len(v) != 3:
+        code = v.upper()
+        if code not in CURRENCY_CODES:
             raise ValueError("Currency must be ISO 4217 format")
-        return v.upper()
+        return code
 
     def suspend(self) -> None:
         """Suspend merchant operations immediately.
@@ -110,7 +132,7 @@ class Merchant(BaseModel):
         Suspended merchants cannot process transactions or modify configuration.
         """
         self.status = MerchantStatus.SUSPENDED
-        self.updated_at = datetime.now()
+        self._touch()
 
     def activate(self) -> None:
         """Restore merchant to active operational state.
@@ -119,7 +141,7 @@ class Merchant(BaseModel):
         Requires compliance checks to be current before activation.
         """
         self.status = MerchantStatus.ACTIVE
-        self.updated_at = datetime.now()
+        self._touch()
 
     def put_under_review(self) -> None:
         """Initiate compliance review process.
@@ -128,7 +150,7 @@ class Merchant(BaseModel):
         Automatic system checks and manual verification will be triggered.
         """
         self.status = MerchantStatus.UNDER_REVIEW
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_payment_method(self, method: str) -> None:
         """Enable a new payment processing capability.
@@ -139,10 +161,37 @@ class Merchant(BaseModel):
         Raises:
             ValueError: If method already enabled.
         """
-        if method in self.payment_methods:
+        method = method.lower()
+        if method in self._payment_methods_index:
             raise ValueError(f"Payment method {method} already exists")
-        self.payment_methods.append(method.lower())
-        self.updated_at = datetime.now()
+        self.payment_methods.append(method)
+        self._payment_methods_index.add(method)
+        self._touch()
+
+    def bulk_add_payment_methods(self, methods: Iterable[str]) -> None:
+        """Enable several payment processing capabilities at once.
+
+        Either every method is added or, if any is rejected, none is.
+
+        Args:
+            methods: Payment processor codes to enable.
+
+        Raises:
+            ValueError: If a method is already enabled or repeated in the batch.
+        """
+        new_methods: List[str] = []
+        seen: Set[str] = set()
+        for method in methods:
+            method = method.lower()
+            if method in self._payment_methods_index or method in seen:
+                raise ValueError(f"Payment method {method} already exists")
+            seen.add(method)
+            new_methods.append(method)
+        if not new_methods:
+            return
+        self.payment_methods.extend(new_methods)
+        self._payment_methods_index.update(seen)
+        self._touch()
 
     def remove_payment_method(self, method: str) -> None:
         """Disable a payment processing capability.
@@ -153,10 +202,12 @@ class Merchant(BaseModel):
         Raises:
             ValueError: If method not currently enabled.
         """
-        if method not in self.payment_methods:
+        method = method.lower()
+        if method not in self._payment_methods_index:
             raise ValueError(f"Payment method {method} not found")
-        self.payment_methods.remove(method.lower())
-        self.updated_at = datetime.now()
+        self.payment_methods.remove(method)
+        self._payment_methods_index.discard(method)
+        self._touch()
 
     def add_api_key(self, api_key: UUID) -> None:
         """Issue new API access credential.
@@ -167,10 +218,35 @@ class Merchant(BaseModel):
         Raises:
             ValueError: If key already exists.
         """
-        if api_key in self.api_keys:
+        if api_key in self._api_keys_index:
             raise ValueError(f"API key {api_key} already exists")
         self.api_keys.append(api_key)
-        self.updated_at = datetime.now()
+        self._api_keys_index.add(api_key)
+        self._touch()
+
+    def bulk_add_api_keys(self, api_keys: Iterable[UUID]) -> None:
+        """Issue several API access credentials at once.
+
+        Either every key is added or, if any is rejected, none is.
+
+        Args:
+            api_keys: UUIDs generated by the authentication system.
+
+        Raises:
+            ValueError: If a key already exists or is repeated in the batch.
+        """
+        new_keys: List[UUID] = []
+        seen: Set[UUID] = set()
+        for api_key in api_keys:
+            if api_key in self._api_keys_index or api_key in seen:
+                raise ValueError(f"API key {api_key} already exists")
+            seen.add(api_key)
+            new_keys.append(api_key)
+        if not new_keys:
+            return
+        self.api_keys.extend(new_keys)
+        self._api_keys_index.update(seen)
+        self._touch()
 
     def remove_api_key(self, api_key: UUID) -> None:
         """Revoke API access credential.
@@ -181,10 +257,15 @@ class Merchant(BaseModel):
         Raises:
             ValueError: If key not found.
         """
-        if api_key not in self.api_keys:
+        if api_key not in self._api_keys_index:
             raise ValueError(f"API key {api_key} not found")
         self.api_keys.remove(api_key)
-        self.updated_at = datetime.now()
+        self._api_keys_index.discard(api_key)
+        self._touch()
+
+    def _touch(self) -> None:
+        """Record a modification by stamping ``updated_at``."""
+        self.updated_at = _time.now()
 
     @property
     def is_active(self) -> bool:
@@ -193,4 +274,4 @@ class Merchant(BaseModel):
         Returns:
             True if status is ACTIVE, False otherwise.
         """
-        return self.status == MerchantStatus.ACTIVE
+        return self.status is _ACTIVE
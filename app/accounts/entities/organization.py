@@ -1,10 +1,13 @@
 from datetime import datetime
 from enum import Enum
 from typing import Dict
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.accounts.entities import _time
+from app.common.ids import uuid7
+
 
 class OrganizationStatus(str, Enum):
     """Organization operational status enumeration.
@@ -20,6 +23,9 @@ class OrganizationStatus(str, Enum):
     PENDING = "pending"
 
 
+_ACTIVE = OrganizationStatus.ACTIVE
+
+
 class Organization(BaseModel):
     """Organization aggregate root representing a business entity.
 
@@ -31,7 +37,7 @@ class Organization(BaseModel):
         name: Official organization name.
         domain: Primary email domain for the organization.
         created_at: Timestamp of organization creation.
-        updated_at: Timestamp of last modification.
+        updated_at: Timestamp of last modification, defaults to created_at.
         status: Current operational status.
         metadata: Additional organization context data.
 
@@ -45,11 +51,11 @@ class Organization(BaseModel):
         <OrganizationStatus.ACTIVE>
     """
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     name: str
     domain: str
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: _time.now())
+    updated_at: datetime = Field(default_factory=lambda data: data["created_at"])
     status: OrganizationStatus = OrganizationStatus.PENDING
     metadata: Dict = Field(default_factory=dict)
 
@@ -77,7 +83,7 @@ class Organization(BaseModel):
         Only active organizations can access system services.
         """
         self.status = OrganizationStatus.ACTIVE
-        self.updated_at = datetime.now()
+        self.updated_at = _time.now()
 
     def suspend(self) -> None:
         """Suspend the organization.
@@ -86,7 +92,7 @@ class Organization(BaseModel):
         Suspended organizations cannot access any system services.
         """
         self.status = OrganizationStatus.SUSPENDED
-        self.updated_at = datetime.now()
+        self.updated_at = _time.now()
 
     @property
     def is_active(self) -> bool:
@@ -95,4 +101,4 @@ class Organization(BaseModel):
         Returns:
             True if status is ACTIVE, False otherwise.
         """
-        return self.status == OrganizationStatus.ACTIVE
+        return self.status is _ACTIVE
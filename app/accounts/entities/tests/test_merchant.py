@@ -1,23 +1,36 @@
 from datetime import datetime
+from types import MappingProxyType
+from unittest.mock import Mock
 from uuid import UUID, uuid4
 
 import pytest
 
+from app.accounts.entities import _time
 from app.accounts.entities.merchant import Merchant, MerchantStatus
 
 
+_MERCHANT_DATA = MappingProxyType(
+    {
+        "name": "Test Merchant",
+        "organization_id": uuid4(),
+        "country_code": "US",
+        "currency": "USD",
+    }
+)
+
+
 class TestMerchant:
     """Test suite for Merchant entity."""
 
     @pytest.fixture
     def valid_merchant_request_data(self):
-        """Fixture providing valid merchant test data."""
-        return {
-            "name": "Test Merchant",
-            "organization_id": uuid4(),
-            "country_code": "US",
-            "currency": "USD",
-        }
+        """Fixture providing read-only valid merchant test data."""
+        return _MERCHANT_DATA
+
+    @pytest.fixture
+    def valid_merchant_request_data_mut(self):
+        """Fixture providing a mutable copy of the valid merchant test data."""
+        return dict(_MERCHANT_DATA)
 
     @pytest.fixture
     def merchant(self, valid_merchant_request_data):
@@ -29,65 +42,63 @@ class TestMerchant:
         merchant = Merchant(**valid_merchant_request_data)
 
         assert isinstance(merchant.id, UUID)
-        assert merchant.name == valid_merchant_request_data["name"]
-        assert merchant.organization_id == valid_merchant_request_data["organization_id"]
-        assert merchant.country_code == "US"
-        assert merchant.currency == "USD"
-        assert merchant.status == MerchantStatus.ACTIVE
         assert isinstance(merchant.created_at, datetime)
-        assert isinstance(merchant.updated_at, datetime)
-        assert merchant.payment_methods == []
-        assert merchant.api_keys == []
-        assert merchant.metadata == {}
-
-    def test_country_code_validation(self, valid_merchant_request_data):
-        """Test country code validation rules."""
-        # Test invalid country codes
-        with pytest.raises(
-            ValueError, match="Country code must be ISO 3166-1 alpha-2 format"
-        ):
-            valid_merchant_request_data["country_code"] = "USA"
-            Merchant(**valid_merchant_request_data)
+        assert dict(merchant) == {
+            **valid_merchant_request_data,
+            "id": merchant.id,
+            "description": None,
+            "created_at": merchant.created_at,
+            "updated_at": merchant.updated_at,
+            "status": MerchantStatus.ACTIVE,
+            "payment_methods": [],
+            "api_keys": [],
+            "metadata": {},
+        }
 
+    @pytest.mark.parametrize("country_code", ["USA", "1", "XX"])
+    def test_invalid_country_code(self, valid_merchant_request_data_mut, country_code):
+        """Test country codes must be ISO 3166-1 alpha-2."""
+        valid_merchant_request_data_mut["country_code"] = country_code
         with pytest.raises(
             ValueError, match="Country code must be ISO 3166-1 alpha-2 format"
         ):
-            valid_merchant_request_data["country_code"] = "1"
-            Merchant(**valid_merchant_request_data)
+            Merchant(**valid_merchant_request_data_mut)
 
-        # Test valid country code gets uppercased
-        valid_merchant_request_data["country_code"] = "us"
-        merchant = Merchant(**valid_merchant_request_data)
+    def test_country_code_is_uppercased(self, valid_merchant_request_data_mut):
+        """Test valid country code gets uppercased."""
+        valid_merchant_request_data_mut["country_code"] = "us"
+        merchant = Merchant(**valid_merchant_request_data_mut)
         assert merchant.country_code == "US"
 
-    def test_currency_validation(self, valid_merchant_request_data):
-        """Test currency code validation rules."""
-        # Test invalid currency codes
-        with pytest.raises(ValueError, match="Currency must be ISO 4217 format"):
-            valid_merchant_request_data["currency"] = "USDD"
-            Merchant(**valid_merchant_request_data)
-
+    @pytest.mark.parametrize("currency", ["USDD", "US", "ABC"])
+    def test_invalid_currency(self, valid_merchant_request_data_mut, currency):
+        """Test currency codes must be ISO 4217."""
+        valid_merchant_request_data_mut["currency"] = currency
         with pytest.raises(ValueError, match="Currency must be ISO 4217 format"):
-            valid_merchant_request_data["currency"] = "US"
-            Merchant(**valid_merchant_request_data)
+            Merchant(**valid_merchant_request_data_mut)
 
-        # Test valid currency code gets uppercased
-        valid_merchant_request_data["currency"] = "usd"
-        merchant = Merchant(**valid_merchant_request_data)
+    def test_currency_is_uppercased(self, valid_merchant_request_data_mut):
+        """Test valid currency code gets uppercased."""
+        valid_merchant_request_data_mut["currency"] = "usd"
+        merchant = Merchant(**valid_merchant_request_data_mut)
         assert merchant.currency == "USD"
 
-    def test_status_transitions(self, merchant):
+    @pytest.mark.parametrize(
+        "start, method, expected",
+        [
+            (MerchantStatus.ACTIVE, "suspend", MerchantStatus.SUSPENDED),
+            (MerchantStatus.ACTIVE, "put_under_review", MerchantStatus.UNDER_REVIEW),
+            (MerchantStatus.SUSPENDED, "activate", MerchantStatus.ACTIVE),
+            (MerchantStatus.UNDER_REVIEW, "activate", MerchantStatus.ACTIVE),
+        ],
+    )
+    def test_status_transitions(self, merchant, start, method, expected):
         """Test merchant status transition methods."""
-        assert merchant.status == MerchantStatus.ACTIVE
+        merchant.status = start
 
-        merchant.suspend()
-        assert merchant.status == MerchantStatus.SUSPENDED
+        getattr(merchant, method)()
 
-        merchant.put_under_review()
-        assert merchant.status == MerchantStatus.UNDER_REVIEW
-
-        merchant.activate()
-        assert merchant.status == MerchantStatus.ACTIVE
+        assert merchant.status is expected
 
     def test_payment_method_management(self, merchant):
         """Test payment method addition and removal."""
@@ -109,6 +120,28 @@ class TestMerchant:
         with pytest.raises(ValueError, match="Payment method stripe not found"):
             merchant.remove_payment_method(method)
 
+    def test_payment_methods_are_case_insensitive(self, merchant):
+        """Test payment methods are matched after lowercasing."""
+        merchant.add_payment_method("Stripe")
+
+        with pytest.raises(ValueError, match="Payment method stripe already exists"):
+            merchant.add_payment_method("STRIPE")
+
+        merchant.remove_payment_method("STRIPE")
+        assert merchant.payment_methods == []
+
+    def test_existing_methods_and_keys_are_indexed(self, merchant):
+        """Test duplicates are detected for values present at construction."""
+        api_key = uuid4()
+        data = merchant.model_dump()
+        data.update(payment_methods=["paypal"], api_keys=[api_key])
+        loaded = Merchant.model_construct(**data)
+
+        with pytest.raises(ValueError, match="Payment method paypal already exists"):
+            loaded.add_payment_method("paypal")
+        with pytest.raises(ValueError, match=f"API key {api_key} already exists"):
+            loaded.add_api_key(api_key)
+
     def test_api_key_management(self, merchant):
         """Test API key addition and removal."""
         api_key = uuid4()
@@ -129,6 +162,54 @@ class TestMerchant:
         with pytest.raises(ValueError, match=f"API key {api_key} not found"):
             merchant.remove_api_key(api_key)
 
+    def test_bulk_add_payment_methods(self, merchant, monkeypatch):
+        """Test several payment methods are added with a single timestamp."""
+        merchant.add_payment_method("stripe")
+        stamp = datetime(2024, 1, 1)
+        now = Mock(return_value=stamp)
+        monkeypatch.setattr(_time, "now", now)
+
+        merchant.bulk_add_payment_methods(["PayPal", "adyen"])
+
+        assert merchant.payment_methods == ["stripe", "paypal", "adyen"]
+        assert merchant.updated_at == stamp
+        now.assert_called_once_with()
+
+    @pytest.mark.parametrize("methods", [["paypal", "Stripe"], ["paypal", "PAYPAL"]])
+    def test_bulk_add_payment_methods_rejects_duplicates(self, merchant, methods):
+        """Test a duplicate rejects the whole batch."""
+        merchant.add_payment_method("stripe")
+
+        with pytest.raises(ValueError, match="already exists"):
+            merchant.bulk_add_payment_methods(methods)
+        assert merchant.payment_methods == ["stripe"]
+
+    def test_bulk_add_api_keys(self, merchant, monkeypatch):
+        """Test several API keys are added, rejecting duplicate batches."""
+        keys = [uuid4(), uuid4()]
+        stamp = datetime(2024, 1, 1)
+        now = Mock(return_value=stamp)
+        monkeypatch.setattr(_time, "now", now)
+
+        merchant.bulk_add_api_keys(keys)
+        assert merchant.api_keys == keys
+        assert merchant.updated_at == stamp
+        now.assert_called_once_with()
+
+        with pytest.raises(ValueError, match=f"API key {keys[0]} already exists"):
+            merchant.bulk_add_api_keys([uuid4(), keys[0]])
+        assert merchant.api_keys == keys
+
+    def test_timestamps_follow_entity_clock(
+        self, valid_merchant_request_data, mock_datetime
+    ):
+        """Test creation and mutation timestamps come from the entity clock."""
+        merchant = Merchant(**valid_merchant_request_data)
+        merchant.suspend()
+
+        assert merchant.created_at == mock_datetime
+        assert merchant.updated_at == mock_datetime
+
     def test_is_active_property(self, merchant):
         """Test is_active property behavior."""
         assert merchant.is_active is True
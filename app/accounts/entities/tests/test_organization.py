@@ -9,41 +9,56 @@ from app.accounts.entities.organization import Organization, OrganizationStatus
 class TestOrganization:
     """Test suite for Organization entity."""
 
-    def test_create_organization_with_valid_data(self, valid_org_data):
+    def test_create_organization_with_valid_data(self, org_data):
         """Test organization creation with valid data."""
-        org = Organization(**valid_org_data)
+        org = Organization(**org_data)
 
         assert isinstance(org.id, UUID)
-        assert org.name == valid_org_data["name"]
-        assert org.domain == valid_org_data["domain"]
-        assert org.status == valid_org_data["status"]
         assert isinstance(org.created_at, datetime)
-        assert isinstance(org.updated_at, datetime)
-        assert org.metadata == {}
+        assert dict(org) == {
+            "id": org.id,
+            "created_at": org.created_at,
+            "updated_at": org.updated_at,
+            **org_data,
+        }
 
-    def test_domain_validation(self, valid_org_data):
-        """Test domain validation rules."""
-        # Test invalid domains
-        with pytest.raises(ValueError, match="Invalid domain format"):
-            valid_org_data["domain"] = "invalid"
-            Organization(**valid_org_data)
+    @pytest.mark.parametrize("org_data", ["primary"], indirect=True)
+    def test_new_organization_timestamps_match(self, org_data):
+        """Test a new organization is stamped from a single clock reading."""
+        org = Organization(**org_data)
+
+        assert org.updated_at == org.created_at
 
+    @pytest.mark.parametrize("org_data", ["primary"], indirect=True)
+    @pytest.mark.parametrize("domain", ["invalid", ""])
+    def test_invalid_domain(self, org_data, domain):
+        """Test malformed domains are rejected."""
+        org_data["domain"] = domain
         with pytest.raises(ValueError, match="Invalid domain format"):
-            valid_org_data["domain"] = ""
-            Organization(**valid_org_data)
+            Organization(**org_data)
 
-        # Test domain gets lowercased
-        valid_org_data["domain"] = "TEST.COM"
-        org = Organization(**valid_org_data)
+    @pytest.mark.parametrize("org_data", ["primary"], indirect=True)
+    def test_domain_is_lowercased(self, org_data):
+        """Test domain gets lowercased."""
+        org_data["domain"] = "TEST.COM"
+        org = Organization(**org_data)
         assert org.domain == "test.com"
 
-    def test_status_transitions(self, valid_organization):
+    @pytest.mark.parametrize(
+        "start, method, expected",
+        [
+            (OrganizationStatus.PENDING, "activate", OrganizationStatus.ACTIVE),
+            (OrganizationStatus.SUSPENDED, "activate", OrganizationStatus.ACTIVE),
+            (OrganizationStatus.ACTIVE, "suspend", OrganizationStatus.SUSPENDED),
+        ],
+    )
+    def test_status_transitions(self, valid_organization, start, method, expected):
         """Test organization status transition methods."""
-        valid_organization.activate()
-        assert valid_organization.status == OrganizationStatus.ACTIVE
+        valid_organization.status = start
 
-        valid_organization.suspend()
-        assert valid_organization.status == OrganizationStatus.SUSPENDED
+        getattr(valid_organization, method)()
+
+        assert valid_organization.status is expected
 
     def test_is_active_property(self, valid_organization):
         """Test is_active property behavior."""
@@ -38,6 +38,23 @@ class TestTokenData:
         difference = abs((token.expires_at - expected_expiry).total_seconds())
         assert difference < 1  # Allow 1 second tolerance
 
+    def test_create_token_from_reference_time(self, valid_email):
+        """Test expiry is measured from a caller-supplied issue time."""
+        now = datetime(2024, 1, 1, 0, 0, 0)
+
+        token = TokenData.create_token(
+            user_id=uuid4(), email=valid_email, expires_in=timedelta(hours=1), now=now
+        )
+
+        assert token.expires_at == datetime(2024, 1, 1, 1, 0, 0)
+
+    def test_token_is_immutable_and_hashable(self, valid_token):
+        """Test tokens cannot be modified and can be used as cache keys."""
+        with pytest.raises(ValueError):
+            valid_token.expires_at = datetime.now()
+
+        assert {valid_token: True}[valid_token]
+
     def test_is_expired_property(self, valid_email):
         """Test is_expired property behavior."""
         user_id = uuid4()
@@ -63,9 +80,9 @@ class TestTokenData:
         assert "email" in json_data
         assert "user_id" in json_data
 
-    def test_invalid_email_type(self, valid_user_data):
+    def test_invalid_email_type(self, valid_user_data_mut):
         """Test token creation with invalid email type."""
-        valid_user_data["email"] = "test@example.com"  # str instead of Email
+        valid_user_data_mut["email"] = "test@example.com"  # str instead of Email
 
         with pytest.raises(ValueError):
-            TokenData(**valid_user_data)
+            TokenData(**valid_user_data_mut)
@@ -1,5 +1,4 @@
 from datetime import datetime
-from uuid import UUID
 
 import pytest
 
@@ -10,49 +9,51 @@ from app.common.value_objects.email import Email
 class TestUser:
     """Test suite for User entity."""
 
-    def test_create_user_with_valid_data(self, valid_user_data):
+    def test_create_user_with_valid_data(self, user_data):
         """Test user creation with valid data."""
-        user = User(**valid_user_data)
+        user = User(**user_data)
 
-        assert isinstance(user.id, UUID)
         assert isinstance(user.email, Email)
-        assert user.email.value == valid_user_data["email"].value
-        assert user.organization_id == valid_user_data["organization_id"]
-        assert user.hashed_password == valid_user_data["hashed_password"]
-        assert user.name == valid_user_data["name"]
-        assert user.status == UserStatus.ACTIVE
-        assert isinstance(user.created_at, datetime)
-        assert user.last_login is None
-
-    def test_name_validation(self, valid_user_data):
+        assert dict(user) == user_data
+
+    def test_email_serializes_as_string(self, valid_user):
+        """Test dumped users carry the plain email address."""
+        assert valid_user.model_dump()["email"] == str(valid_user.email)
+
+    @pytest.mark.parametrize("user_data", ["primary"], indirect=True)
+    def test_name_validation(self, user_data):
         """Test name validation rules."""
         # Test empty string
         with pytest.raises(ValueError, match="Name cannot be empty string"):
-            valid_user_data["name"] = "   "
-            User(**valid_user_data)
+            user_data["name"] = "   "
+            User(**user_data)
 
         # Test None is allowed
-        valid_user_data["name"] = None
-        user = User(**valid_user_data)
+        user_data["name"] = None
+        user = User(**user_data)
         assert user.name is None
 
         # Test whitespace is stripped
-        valid_user_data["name"] = "  Test User  "
-        user = User(**valid_user_data)
+        user_data["name"] = "  Test User  "
+        user = User(**user_data)
         assert user.name == "Test User"
 
-    def test_status_transitions(self, valid_user):
+    @pytest.mark.parametrize(
+        "start, method, expected",
+        [
+            (UserStatus.ACTIVE, "deactivate", UserStatus.INACTIVE),
+            (UserStatus.ACTIVE, "suspend", UserStatus.SUSPENDED),
+            (UserStatus.SUSPENDED, "activate", UserStatus.ACTIVE),
+            (UserStatus.INACTIVE, "activate", UserStatus.ACTIVE),
+        ],
+    )
+    def test_status_transitions(self, valid_user, start, method, expected):
         """Test user status transition methods."""
-        assert valid_user.status == UserStatus.ACTIVE
-
-        valid_user.deactivate()
-        assert valid_user.status == UserStatus.INACTIVE
+        valid_user.status = start
 
-        valid_user.suspend()
-        assert valid_user.status == UserStatus.SUSPENDED
+        getattr(valid_user, method)()
 
-        valid_user.activate()
-        assert valid_user.status == UserStatus.ACTIVE
+        assert valid_user.status is expected
 
     def test_record_login(self, valid_user):
         """Test login recording functionality."""
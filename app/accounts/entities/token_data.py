@@ -1,10 +1,12 @@
 """TokenData entity for managing authentication tokens."""
 
 from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, field_serializer
 
+from app.accounts.entities import _time
 from app.common.value_objects.email import Email
 
 
@@ -34,6 +36,8 @@ class TokenData(BaseModel):
     email: Email
     expires_at: datetime
 
+    model_config = ConfigDict(frozen=True)
+
     @field_serializer('email')
     def serialize_email(self, email: Email, _info):
         return str(email)
@@ -49,14 +53,26 @@ class TokenData(BaseModel):
 
     @classmethod
     def create_token(
-        cls, user_id: UUID, email: Email, expires_in: timedelta
+        cls,
+        user_id: UUID,
+        email: Email,
+        expires_in: timedelta,
+        *,
+        now: Optional[datetime] = None,
     ) -> "TokenData":
         """Create a new token with specified expiration.
 
+        This is the trusted-path factory: the arguments come from in-process
+        entities, so the token is built without re-running validation. Data
+        from outside, such as a decoded JWT, should go through the constructor.
+
         Args:
             user_id: ID of the user to create token for.
             email: User's email as Email value object.
             expires_in: Token validity duration.
+            now: Issue time the expiry is measured from. Callers issuing a
+                batch of tokens can read the clock once and pass it to each
+                call. Defaults to the current time.
 
         Returns:
             New token instance.
@@ -70,8 +86,8 @@ class TokenData(BaseModel):
             ...     expires_in=timedelta(hours=1)
             ... )
         """
-        return cls(
+        return cls.model_construct(
             user_id=user_id,
             email=email,
-            expires_at=datetime.now() + expires_in,
+            expires_at=(now or _time.now()) + expires_in,
         )
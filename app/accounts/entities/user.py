@@ -1,11 +1,12 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
-from app.accounts.value_objects.password import Password
+from app.accounts.entities import _time
+from app.common.ids import uuid7
 from app.common.value_objects.email import Email
 
 
@@ -23,11 +24,16 @@ class UserStatus(str, Enum):
     SUSPENDED = "suspended"
 
 
+# Bound once: looking a member up on the enum class is a slow attribute access.
+_ACTIVE = UserStatus.ACTIVE
+
+
 class User(BaseModel):
     """User aggregate root representing an authenticated system user.
 
     This entity manages user authentication state and profile data.
-    It uses Email and Password value objects for secure credential handling.
+    Only the password hash is stored; raw passwords are validated and hashed
+    by the user service before a User is built.
 
     Args:
         id: Unique identifier for the user.
@@ -35,7 +41,6 @@ class User(BaseModel):
         organization_id: Reference to parent organization.
         hashed_password: Securely hashed password string.
         name: User's full name.
-        password: Optional raw password for creation/updates.
         status: Current account status.
         created_at: Timestamp of account creation.
         last_login: Timestamp of most recent login.
@@ -51,14 +56,13 @@ class User(BaseModel):
         'john.doe@example.com'
     """
 
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     email: Email
     organization_id: UUID
     hashed_password: str
     name: Optional[str] = None
-    password: Optional[Password] = None
     status: UserStatus = UserStatus.ACTIVE
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=lambda: _time.now())
     last_login: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -66,10 +70,6 @@ class User(BaseModel):
     @field_serializer('email')
     def serialize_email(self, email: Email, _info):
         return str(email)
-    
-    @field_serializer('password')
-    def serialize_email(self, password: Password, _info):
-        return str(password)
 
     @field_validator("name")
     def validate_name(cls, v: Optional[str]) -> Optional[str]:
@@ -93,28 +93,38 @@ class User(BaseModel):
 
         Transitions status to ACTIVE allowing system access.
         """
-        self.status = UserStatus.ACTIVE
+        self._set_trusted("status", UserStatus.ACTIVE)
 
     def deactivate(self) -> None:
         """Deactivate the user account.
 
         Transitions status to INACTIVE preventing system access.
         """
-        self.status = UserStatus.INACTIVE
+        self._set_trusted("status", UserStatus.INACTIVE)
 
     def suspend(self) -> None:
         """Suspend the user account.
 
         Transitions status to SUSPENDED due to possible violations.
         """
-        self.status = UserStatus.SUSPENDED
+        self._set_trusted("status", UserStatus.SUSPENDED)
 
     def record_login(self) -> None:
         """Record a successful login attempt.
 
         Updates the last_login timestamp to current time.
         """
-        self.last_login = datetime.now()
+        self._set_trusted("last_login", _time.now())
+
+    def _set_trusted(self, name: str, value: object) -> None:
+        """Assign a field from a trusted internal mutation.
+
+        Validation is intentionally skipped: the mutators only assign enum
+        members and clock readings. The field is still marked as set, as
+        pydantic's own assignment would do.
+        """
+        self.__dict__[name] = value
+        self.__pydantic_fields_set__.add(name)
 
     @property
     def is_active(self) -> bool:
@@ -123,4 +133,4 @@ class User(BaseModel):
         Returns:
             True if status is ACTIVE, False otherwise.
         """
-        return self.status == UserStatus.ACTIVE
+        return self.status is _ACTIVE
@@ -19,7 +19,7 @@ class TokenError(DomainError):
     but rather through one of its more specific child classes.
     """
 
-    pass
+    code = "TOKEN_ERROR"
 
 
 class InvalidTokenError(TokenError):
@@ -31,7 +31,7 @@ class InvalidTokenError(TokenError):
         - Token signature verification fails
     """
 
-    pass
+    code = "INVALID_TOKEN"
 
 
 class ExpiredTokenError(TokenError):
@@ -42,7 +42,7 @@ class ExpiredTokenError(TokenError):
         - Token refresh attempt after expiry
     """
 
-    pass
+    code = "EXPIRED_TOKEN"
 
 
 class AuthenticationError(DomainError):
@@ -62,13 +62,13 @@ class AuthenticationError(DomainError):
         ```
     """
 
-    pass
+    code = "AUTHENTICATION_FAILED"
 
 
 class UserError(DomainError):
     """Base exception for user-related errors."""
 
-    pass
+    code = "USER_ERROR"
 
 
 class UserNotFoundError(UserError, RecordNotFoundError):
@@ -86,7 +86,8 @@ class UserNotFoundError(UserError, RecordNotFoundError):
         >>> raise UserNotFoundError(identifier="123e4567-e89b-12d3-a456-426614174000")
     """
 
-    pass
+    code = "USER_NOT_FOUND"
+    entity_type = "User"
 
 
 class InactiveUserError(UserError):
@@ -97,13 +98,13 @@ class InactiveUserError(UserError):
         - Action attempt by deactivated user
     """
 
-    pass
+    code = "INACTIVE_USER"
 
 
 class OrganizationError(DomainError):
     """Base exception for organization-related errors."""
 
-    pass
+    code = "ORGANIZATION_ERROR"
 
 
 class OrganizationNotFoundError(OrganizationError, RecordNotFoundError):
@@ -114,7 +115,8 @@ class OrganizationNotFoundError(OrganizationError, RecordNotFoundError):
         - Domain not registered
     """
 
-    pass
+    code = "ORGANIZATION_NOT_FOUND"
+    entity_type = "Organization"
 
 
 class DomainAlreadyExistsError(OrganizationError):
@@ -125,7 +127,7 @@ class DomainAlreadyExistsError(OrganizationError):
         - Updating organization to use taken domain
     """
 
-    pass
+    code = "DOMAIN_ALREADY_EXISTS"
 
 
 class InvalidOrganizationStateError(OrganizationError):
@@ -136,4 +138,4 @@ class InvalidOrganizationStateError(OrganizationError):
         - Reactivating a non-suspended organization
     """
 
-    pass
+    code = "INVALID_ORGANIZATION_STATE"
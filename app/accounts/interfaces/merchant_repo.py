@@ -5,7 +5,7 @@ extending the base repository interface with merchant-specific functionality.
 """
 
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.accounts.entities.merchant import Merchant
@@ -26,16 +26,27 @@ class MerchantRepository(RepositoryInterface[Merchant]):
         ...     print(merchant.name)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def list_by_organization(
-        self, org_id: UUID, limit: int = 100, offset: int = 0
+        self,
+        org_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_id: Optional[UUID] = None,
     ) -> List[Merchant]:
-        """List merchants belonging to an organization.
+        """List merchants belonging to an organization, ordered by ID.
+
+        Pages can be fetched by offset or, preferably for deep pages, by
+        keyset: pass the ID of the last merchant of the previous page as
+        ``after_id``.
 
         Args:
             org_id: Organization's unique identifier.
             limit: Maximum number of merchants to return.
             offset: Number of merchants to skip.
+            after_id: Only return merchants with an ID greater than this one.
 
         Returns:
             List of merchants for the organization.
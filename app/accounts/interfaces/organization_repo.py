@@ -22,3 +22,5 @@ class OrganizationRepository(RepositoryInterface[Organization]):
         >>> org.activate()
         >>> repo.save(org)
     """
+
+    __slots__ = ()
@@ -1,8 +1,8 @@
 """Mock repository implementations for testing."""
 
-from copy import deepcopy
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, TypeVar
 from uuid import UUID
 
 from app.accounts.entities.merchant import Merchant
@@ -13,30 +13,65 @@ from app.accounts.interfaces import (
     OrganizationRepository,
     UserRepository,
 )
+from app.common.adapters.db.in_memory import GroupIndex, NameIndex
 from app.common.value_objects.email import Email
 
+T = TypeVar("T", Merchant, Organization, User)
+
+
+def _clone(entity: Optional[T]) -> Optional[T]:
+    """Copy a stored entity without re-running validation.
+
+    Containers are copied one level deep so callers cannot mutate the stored
+    instance; value objects such as Email are immutable and shared.
+    """
+    if entity is None:
+        return None
+    fields = {
+        name: value.copy() if isinstance(value, (list, dict, set)) else value
+        for name, value in entity.__dict__.items()
+    }
+    return type(entity).model_construct(
+        _fields_set=set(entity.model_fields_set), **fields
+    )
+
 
 class MockMerchantRepository(MerchantRepository):
     """Mock implementation of MerchantRepository for testing."""
 
+    __slots__ = ("merchants", "_by_org", "_names")
+
     def __init__(self) -> None:
         self.merchants: Dict[UUID, Merchant] = {}
+        self._by_org = GroupIndex()
+        self._names = NameIndex()
 
     def get_by_id(self, id: UUID) -> Optional[Merchant]:
-        return deepcopy(self.merchants.get(id))
+        return _clone(self.merchants.get(id))
 
     def list(self, limit: int = 100, offset: int = 0) -> List[Merchant]:
-        merchants = list(self.merchants.values())
-        return deepcopy(merchants[offset : offset + limit])
+        merchants = islice(self.merchants.values(), offset, offset + limit)
+        return [_clone(m) for m in merchants]
 
     def save(self, merchant: Merchant) -> Merchant:
-        self.merchants[merchant.id] = deepcopy(merchant)
-        return deepcopy(merchant)
+        self.merchants[merchant.id] = _clone(merchant)
+        self._by_org.add(merchant.organization_id, merchant.id)
+        self._names.add(merchant.id, merchant.name)
+        return merchant
+
+    def bulk_save(self, merchants: List[Merchant]) -> List[Merchant]:
+        self.merchants.update((m.id, _clone(m)) for m in merchants)
+        for m in merchants:
+            self._by_org.add(m.organization_id, m.id)
+            self._names.add(m.id, m.name)
+        return merchants
 
     def delete(self, id: UUID) -> None:
         if id not in self.merchants:
             raise ValueError("Merchant not found")
         del self.merchants[id]
+        self._by_org.remove(id)
+        self._names.remove(id)
 
     def count(self) -> int:
         return len(self.merchants)
@@ -44,31 +79,35 @@ class MockMerchantRepository(MerchantRepository):
     def list_by_organization(
         self, org_id: UUID, limit: int = 100, offset: int = 0
     ) -> List[Merchant]:
-        merchants = [m for m in self.merchants.values() if m.organization_id == org_id]
-        return deepcopy(merchants[offset : offset + limit])
+        ids = self._by_org.get(org_id, limit=limit, offset=offset)
+        return [_clone(self.merchants[id]) for id in ids]
 
     def search_by_name(self, name: str) -> List[Merchant]:
-        return deepcopy(
-            [m for m in self.merchants.values() if name.lower() in m.name.lower()]
-        )
+        return [_clone(self.merchants[id]) for id in self._names.search(name)]
 
 
 class MockOrganizationRepository(OrganizationRepository):
     """Mock implementation of OrganizationRepository for testing."""
 
+    __slots__ = ("organizations",)
+
     def __init__(self) -> None:
         self.organizations: Dict[UUID, Organization] = {}
 
     def get_by_id(self, id: UUID) -> Optional[Organization]:
-        return deepcopy(self.organizations.get(id))
+        return _clone(self.organizations.get(id))
 
     def list(self, limit: int = 100, offset: int = 0) -> List[Organization]:
-        orgs = list(self.organizations.values())
-        return deepcopy(orgs[offset : offset + limit])
+        orgs = islice(self.organizations.values(), offset, offset + limit)
+        return [_clone(o) for o in orgs]
 
     def save(self, organization: Organization) -> Organization:
-        self.organizations[organization.id] = deepcopy(organization)
-        return deepcopy(organization)
+        self.organizations[organization.id] = _clone(organization)
+        return organization
+
+    def bulk_save(self, organizations: List[Organization]) -> List[Organization]:
+        self.organizations.update((o.id, _clone(o)) for o in organizations)
+        return organizations
 
     def delete(self, id: UUID) -> None:
         if id not in self.organizations:
@@ -82,33 +121,42 @@ class MockOrganizationRepository(OrganizationRepository):
 class MockUserRepository(UserRepository):
     """Mock implementation of UserRepository for testing."""
 
+    __slots__ = ("users", "_by_email")
+
     def __init__(self) -> None:
         self.users: Dict[UUID, User] = {}
+        self._by_email = GroupIndex()
 
     def get_by_id(self, id: UUID) -> Optional[User]:
-        return deepcopy(self.users.get(id))
+        return _clone(self.users.get(id))
 
     def list(self, limit: int = 100, offset: int = 0) -> List[User]:
-        users = list(self.users.values())
-        return deepcopy(users[offset : offset + limit])
+        users = islice(self.users.values(), offset, offset + limit)
+        return [_clone(u) for u in users]
 
     def save(self, user: User) -> User:
-        self.users[user.id] = deepcopy(user)
-        return deepcopy(user)
+        self.users[user.id] = _clone(user)
+        self._by_email.add(user.email, user.id)
+        return user
+
+    def bulk_save(self, users: List[User]) -> List[User]:
+        self.users.update((u.id, _clone(u)) for u in users)
+        for u in users:
+            self._by_email.add(u.email, u.id)
+        return users
 
     def delete(self, id: UUID) -> None:
         if id not in self.users:
             raise ValueError("User not found")
         del self.users[id]
+        self._by_email.remove(id)
 
     def count(self) -> int:
         return len(self.users)
 
     def get_by_email(self, email: Email) -> Optional[User]:
-        for user in self.users.values():
-            if user.email == email:
-                return deepcopy(user)
-        return None
+        ids = self._by_email.get(email, limit=1)
+        return _clone(self.users[ids[0]]) if ids else None
 
     def update_login_time(self, user_id: UUID) -> None:
         if user_id not in self.users:
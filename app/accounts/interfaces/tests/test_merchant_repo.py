@@ -50,8 +50,7 @@ class TestMerchantRepository:
             )
             for i in range(5)
         ]
-        for merchant in merchants:
-            merchant_repo.save(merchant)
+        merchant_repo.bulk_save(merchants)
 
         # Test pagination
         page_1 = merchant_repo.list(limit=2, offset=0)
@@ -101,8 +100,7 @@ class TestMerchantRepository:
             for i in range(2)
         ]
 
-        for merchant in org_merchants + other_merchants:
-            merchant_repo.save(merchant)
+        merchant_repo.bulk_save(org_merchants + other_merchants)
 
         # Test listing by organization
         result = merchant_repo.list_by_organization(org_id)
@@ -132,8 +130,7 @@ class TestMerchantRepository:
                 currency="USD",
             ),
         ]
-        for merchant in merchants:
-            merchant_repo.save(merchant)
+        merchant_repo.bulk_save(merchants)
 
         # Test search
         results = merchant_repo.search_by_name("Acme")
@@ -44,8 +44,7 @@ class TestOrganizationRepository:
             Organization(name=f"Organization {i}", domain=f"org{i}.com")
             for i in range(5)
         ]
-        for org in organizations:
-            org_repo.save(org)
+        org_repo.bulk_save(organizations)
 
         # Test pagination
         page_1 = org_repo.list(limit=2, offset=0)
@@ -78,8 +77,7 @@ class TestOrganizationRepository:
         organizations = [
             Organization(name=f"Org {i}", domain=f"org{i}.com") for i in range(3)
         ]
-        for org in organizations:
-            org_repo.save(org)
+        org_repo.bulk_save(organizations)
 
         assert org_repo.count() == 3
 
@@ -89,8 +89,7 @@ class TestUserRepository:
             )
             for i in range(5)
         ]
-        for user in users:
-            user_repo.save(user)
+        user_repo.bulk_save(users)
 
         # Test pagination
         page_1 = user_repo.list(limit=2, offset=0)
@@ -26,6 +26,8 @@ class UserRepository(RepositoryInterface[User]):
         >>> repo.update_login_time(user.id)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_by_email(self, email: Email) -> Optional[User]:
         """Retrieve a user by their email address.
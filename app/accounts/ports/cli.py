@@ -1,34 +1,90 @@
+import functools
+import inspect
+from typing import Callable, Type, TypeVar
+
+import pydantic
+import typer
 from typer import Typer
 from rich import print_json
+from sqlmodel import Session
 
 from app.accounts.ports.rest.dependencies import (
     get_organization_service,
     get_user_service,
 )
-from app.accounts.schemas.organization_schemas import OrganizationResponse
-from app.accounts.schemas.user_schemas import UserListResponse, UserResponse
-from app.accounts.value_objects.password import Password
-from app.common.exceptions import ValidationError
-from app.common.value_objects.email import Email
+from app.accounts.schemas.organization_schemas import (
+    OrganizationCreateRequest,
+    OrganizationResponse,
+)
+from app.accounts.schemas.user_schemas import UserCreateRequest, UserResponse
+from app.common.adapters.db.sql_model.config import engine
 
 accounts_app = Typer()
 
+RequestT = TypeVar("RequestT", bound=pydantic.BaseModel)
+
+
+def schema_options(
+    model: Type[RequestT],
+) -> Callable[[Callable[[RequestT], None]], Callable[..., None]]:
+    """Derive a command's options from a request schema.
+
+    Each schema field becomes a ``--field`` option, required unless the field
+    has a default, with the field description as its help text. Options are
+    read as plain strings and the command receives one validated request, so
+    the CLI and the REST endpoints share the schema's validation.
+
+    Args:
+        model: Request schema whose fields become the command's options.
+
+    Returns:
+        A decorator turning ``func(request)`` into a Typer command callback.
+
+    Example:
+        >>> @accounts_app.command()
+        ... @schema_options(OrganizationCreateRequest)
+        ... def create_organization(request: OrganizationCreateRequest): ...
+    """
+
+    def decorator(func: Callable[[RequestT], None]) -> Callable[..., None]:
+        parameters = [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=str,
+                default=typer.Option(
+                    ... if field.is_required() else field.default,
+                    help=field.description,
+                ),
+            )
+            for name, field in model.model_fields.items()
+        ]
+
+        @functools.wraps(func)
+        def command(**options: str) -> None:
+            try:
+                request = model.model_validate(options)
+            except pydantic.ValidationError as exc:
+                raise typer.BadParameter(str(exc)) from exc
+            return func(request)
+
+        command.__signature__ = inspect.Signature(parameters)
+        return command
+
+    return decorator
+
 
 @accounts_app.command()
-def create_user(
-    email: str,
-    password: str,
-    organization_id: str,
-):
+@schema_options(UserCreateRequest)
+def create_user(request: UserCreateRequest):
     """Create a new user account via CLI.
 
     Creates a user with the provided email and password, then displays
     the created user details in JSON format.
 
     Args:
-        email: Email address for the new user account.
-        password: Password for the new user account.
-        organization_id: Organization for the new user account.
+        request: Email, password and organization for the new user account,
+            taken from the ``UserCreateRequest`` options.
 
     Returns:
         Prints JSON response containing user details:
@@ -39,44 +95,36 @@ def create_user(
             - last_login: Last login timestamp (null for new users)
 
     Example:
-        $ python -m app create-user --email=user@example.com --password=secret123
+        $ python -m app create-user --email=user@example.com --password=secret123 \
+            --organization-id=123e4567-e89b-12d3-a456-426614174000
 
     Note:
         Password is sent as plaintext in CLI arguments. For better security,
         consider adding interactive password prompt in production.
     """
-    user_service = get_user_service()
-
-    user = user_service.create_user(
-        email_address=email,
-        plain_password=password,
-        organization_id=organization_id,
-    )
-
-    response = UserResponse(
-        id=user.id,
-        email=user.email,
-        status=user.status,
-        created_at=user.created_at,
-        last_login=user.last_login,
-    )
+    with Session(engine) as session:
+        user_service = get_user_service(session=session)
+        user = user_service.create_user(
+            email_address=request.email,
+            plain_password=request.password,
+            organization_id=request.organization_id,
+        )
+        response = UserResponse.model_validate(user)
 
     return print_json(response.model_dump_json())
 
 
 @accounts_app.command()
-def create_organization(
-    name: str,
-    domain: str,
-):
+@schema_options(OrganizationCreateRequest)
+def create_organization(request: OrganizationCreateRequest):
     """Create a new organization account via CLI.
 
     Creates an organization with the provided name and domain, then displays
     the created organization details in JSON format.
 
     Args:
-        name: Email address for the new user account.
-        domain_name: Password for the new user account.
+        request: Name and domain for the new organization, taken from the
+            ``OrganizationCreateRequest`` options.
 
     Returns:
         Prints JSON response containing organization details:
@@ -88,28 +136,17 @@ def create_organization(
             - last_login: Last login timestamp (null for new users)
 
     Example:
-        $ python -m app create-organization --email=user@example.com --password=secret123
+        $ python -m app create-organization --name="Acme Corporation" --domain=acme.com
 
     Note:
         Password is sent as plaintext in CLI arguments. For better security,
         consider adding interactive password prompt in production.
     """
-    organization_service = get_organization_service()
-
-    try:
+    with Session(engine) as session:
+        organization_service = get_organization_service(session=session)
         organization = organization_service.create_organization(
-            name=name, domain=domain
+            name=request.name, domain=request.domain
         )
-    except ValidationError as exc:
-        print(exc.details)
-
-    response = OrganizationResponse(
-        id=organization.id,
-        name=organization.name,
-        status=organization.status,
-        domain_name=organization.domain_name,
-        created_at=organization.created_at,
-        last_login=organization.last_login,
-    )
+        response = OrganizationResponse.model_validate(organization)
 
     return print_json(response.model_dump_json())
@@ -7,16 +7,20 @@ OAuth2 standards with JWT tokens for authentication.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.accounts.exceptions import AuthenticationError, UserNotFoundError
+from app.accounts.exceptions import (
+    AuthenticationError,
+    InactiveUserError,
+    UserNotFoundError,
+)
 from app.accounts.ports.rest.dependencies import get_auth_service, get_user_service
-from app.accounts.schemas.auth_schemas import TokenResponse
+from app.accounts.schemas.auth_schemas import LoginRequest, TokenResponse
 from app.accounts.schemas.user_schemas import UserCreateRequest, UserResponse
 from app.accounts.services.auth_service import AuthService
 from app.accounts.services.user_service import UserService
-from app.common.exceptions import ValidationError
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -43,22 +47,73 @@ def oauth_login(
         JWT access token response.
 
     Raises:
-        HTTPException(401): If credentials are invalid.
+        AuthenticationError: If credentials are invalid (401).
 
     Note:
         This endpoint is compatible with standard OAuth2 clients.
     """
+    return _issue_token(auth_service, form_data.username, form_data.password)
+
+
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    responses={401: {"description": "Invalid credentials"}},
+)
+def login(
+    credentials: LoginRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+):
+    """JSON token endpoint.
+
+    Same as `/token`, but takes credentials as a JSON body, so the request
+    skips form parsing.
+
+    Args:
+        credentials: Email and password to authenticate with.
+        auth_service: Injectable authentication service.
+
+    Returns:
+        JWT access token response.
+
+    Raises:
+        AuthenticationError: If credentials are invalid (401).
+
+    Example:
+        ```http
+        POST /auth/login
+        {
+            "email": "user@example.com",
+            "password": "SecurePass123!"
+        }
+        ```
+    """
+    return _issue_token(auth_service, credentials.email, credentials.password)
+
+
+def _issue_token(
+    auth_service: AuthService, email: str, password: str
+) -> ORJSONResponse:
+    """Authenticate a user and create their access token.
+
+    The body is built as a plain dict matching `TokenResponse`; returning a
+    response directly skips FastAPI's response_model validation, while the
+    route's response_model still documents the schema.
+
+    Raises:
+        AuthenticationError: If credentials are invalid or the account is not
+            active. An unknown email gets the same message as a wrong password,
+            so the response does not reveal which accounts exist.
+    """
     try:
-        user = auth_service.authenticate_user(form_data.username, form_data.password)
-        token = auth_service.create_access_token(user)
-        return TokenResponse(access_token=token, token_type="bearer")
+        user = auth_service.authenticate_user(email, password)
+    except UserNotFoundError as e:
+        raise AuthenticationError("Invalid email or password") from e
+    except InactiveUserError as e:
+        raise AuthenticationError(str(e)) from e
 
-    except (UserNotFoundError, AuthenticationError) as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    token = auth_service.create_access_token(user)
+    return ORJSONResponse({"access_token": token, "token_type": "bearer"})
 
 
 @router.post(
@@ -87,8 +142,7 @@ def register_user(
         Created user profile.
 
     Raises:
-        HTTPException(400): If user already exists.
-        HTTPException(422): If validation fails.
+        ValidationError: If the user already exists (422).
 
     Example:
         ```http
@@ -100,17 +154,9 @@ def register_user(
         }
         ```
     """
-    try:
-        user = user_service.create_user(
-            email_address=request.email,
-            plain_password=request.password,
-            organization_id=request.organization_id,
-        )
-        return UserResponse.model_validate(user)
-
-    except UserNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
-        )
+    user = user_service.create_user(
+        email_address=request.email,
+        plain_password=request.password,
+        organization_id=request.organization_id,
+    )
+    return UserResponse.model_validate(user)
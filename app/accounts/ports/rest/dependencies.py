@@ -1,7 +1,7 @@
 from functools import lru_cache
-from typing import Annotated
+from typing import Any, Dict
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlmodel import Session
 
@@ -10,6 +10,8 @@ from app.accounts.adapters.db.sql_model.organization import (
     SQLModelOrganizationRepository,
 )
 from app.accounts.adapters.db.sql_model.user import SQLModelUserRepository
+from app.accounts.entities.user import User
+from app.accounts.exceptions import InactiveUserError, TokenError, UserNotFoundError
 from app.accounts.services.auth_service import AuthService
 from app.accounts.services.merchant_service import MerchantService
 from app.accounts.services.organization_service import OrganizationService
@@ -17,29 +19,35 @@ from app.accounts.services.user_service import UserService
 from app.common.adapters.cryptography.argon import Argon2PasswordHasher
 from app.common.adapters.cryptography.jwt import JWTManager
 from app.common.adapters.db.sql_model.session import get_session
-from app.settings import Settings, settings
+from app.common.exceptions import TokenError as TokenDecodeError
+from app.settings import settings
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="accounts/auth/token")
 
 
-@lru_cache
-def get_settings():
-    return settings
-
-
+@lru_cache(maxsize=1)
 def get_password_hasher():
     """Create password hashing service.
 
+    A single instance is shared: building its CryptContext on every request
+    is comparatively costly, and its concurrency cap only bounds the whole
+    process when every caller goes through the same hasher.
+
+    Cost parameters come from settings, so they can be tuned per deployment
+    through the environment.
+
     Returns:
-        Configured BCryptPasswordHasher instance for password operations.
+        Configured Argon2PasswordHasher instance for password operations.
     """
-    return Argon2PasswordHasher()
+    return Argon2PasswordHasher(
+        max_concurrency=settings.argon2_max_concurrency,
+        time_cost=settings.argon2_time_cost,
+        memory_cost=settings.argon2_memory_cost,
+        parallelism=settings.argon2_parallelism,
+    )
 
 
-def get_auth_service(
-    settings: Annotated[Settings, Depends(get_settings)],
-    session: Session = Depends(get_session),
-):
+def get_auth_service(session: Session = Depends(get_session)):
     """Create and configure the authentication service.
 
     Creates an AuthService instance with all required dependencies including
@@ -53,7 +61,7 @@ def get_auth_service(
 
     return AuthService(
         user_repo=repo,
-        token_manager=get_token_manager(settings),
+        token_manager=get_token_manager(),
         password_hasher=password_hasher,
         access_token_expire_minutes=30,
     )
@@ -68,7 +76,6 @@ def get_user_service(session: Session = Depends(get_session)):
     Returns:
         Configured UserService instance.
     """
-    session = get_session()
     repo = SQLModelUserRepository(session=session)
     password_hasher = get_password_hasher()
 
@@ -104,7 +111,8 @@ def get_merchant_service(session: Session = Depends(get_session)):
     return MerchantService(repo)
 
 
-def get_token_manager(settings: Annotated[Settings, Depends(get_settings)]):
+@lru_cache(maxsize=1)
+def get_token_manager():
     """Create JWT token manager.
 
     Returns:
@@ -118,3 +126,64 @@ def get_token_manager(settings: Annotated[Settings, Depends(get_settings)]):
         secret_key=settings.jwt.secret_key,
         algorithm=settings.jwt.algorithm,
     )
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    """Build the 401 raised when a bearer token is not accepted."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def get_token_claims(
+    request: Request, token: str = Depends(oauth2_scheme)
+) -> Dict[str, Any]:
+    """Verify the request's bearer token and return its claims.
+
+    The claims are memoized on `request.state`, so the token signature is
+    verified once per request even when several dependencies resolve them
+    separately (FastAPI only de-duplicates identical dependency calls, not
+    e.g. `Security` dependencies declared with different scopes).
+
+    Args:
+        request: Current request, whose state holds the memoized claims.
+        token: Bearer token extracted by `oauth2_scheme`.
+
+    Returns:
+        Decoded token claims.
+
+    Raises:
+        HTTPException(401): If the token is invalid or expired.
+    """
+    claims = getattr(request.state, "claims", None)
+    if claims is None:
+        try:
+            claims = get_token_manager().decode_token(token)
+        except TokenDecodeError as e:
+            raise _unauthorized(str(e))
+        request.state.claims = claims
+    return claims
+
+
+def get_current_user(
+    claims: Dict[str, Any] = Depends(get_token_claims),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> User:
+    """Resolve the user the request's bearer token was issued to.
+
+    Args:
+        claims: Verified claims of the request's bearer token.
+        auth_service: Injectable authentication service.
+
+    Returns:
+        Authenticated, active user entity.
+
+    Raises:
+        HTTPException(401): If the token no longer identifies an active user.
+    """
+    try:
+        return auth_service.get_user_from_claims(claims)
+    except (TokenError, UserNotFoundError, InactiveUserError) as e:
+        raise _unauthorized(str(e))
@@ -0,0 +1,91 @@
+"""Translation of domain exceptions into HTTP error responses.
+
+Endpoints raise domain exceptions directly; the handlers registered here
+turn them into JSON error responses in one place, so every endpoint reports
+the same error the same way.
+"""
+
+import logging
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.accounts.exceptions import AuthenticationError
+from app.common.exceptions import (
+    DomainError,
+    RecordNotFoundError,
+    RepositoryError,
+    ValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _error_response(
+    exc: DomainError, status_code: int, headers: dict | None = None
+) -> ORJSONResponse:
+    """Build the JSON error body shared by all domain error handlers."""
+    return ORJSONResponse(
+        status_code=status_code,
+        content={"code": exc.code, "detail": str(exc)},
+        headers=headers,
+    )
+
+
+async def authentication_error_handler(
+    request: Request, exc: AuthenticationError
+) -> ORJSONResponse:
+    """Respond 401 with a bearer challenge for failed authentication."""
+    return _error_response(
+        exc, status.HTTP_401_UNAUTHORIZED, headers={"WWW-Authenticate": "Bearer"}
+    )
+
+
+async def validation_error_handler(
+    request: Request, exc: ValidationError
+) -> ORJSONResponse:
+    """Respond 422 for requests rejected by domain validation."""
+    return _error_response(exc, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
+async def record_not_found_handler(
+    request: Request, exc: RecordNotFoundError
+) -> ORJSONResponse:
+    """Respond 404 for lookups of records that do not exist."""
+    return _error_response(exc, status.HTTP_404_NOT_FOUND)
+
+
+async def repository_error_handler(
+    request: Request, exc: RepositoryError
+) -> ORJSONResponse:
+    """Respond 500 for storage failures without exposing their message.
+
+    The failure is a server fault, not a client error, and its message names
+    internal models, so it is logged rather than returned.
+    """
+    logger.error("Repository error: %s", exc, exc_info=exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"code": RepositoryError.code, "detail": "Internal server error"},
+    )
+
+
+async def domain_error_handler(request: Request, exc: DomainError) -> ORJSONResponse:
+    """Respond 400 for any other domain error."""
+    return _error_response(exc, status.HTTP_400_BAD_REQUEST)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register the domain exception handlers on an application.
+
+    Starlette picks the handler of the closest class in the exception's MRO,
+    so the specific handlers take precedence over the `DomainError` fallback.
+
+    Args:
+        app: Application to register the handlers on.
+    """
+    app.add_exception_handler(AuthenticationError, authentication_error_handler)
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(RecordNotFoundError, record_not_found_handler)
+    app.add_exception_handler(RepositoryError, repository_error_handler)
+    app.add_exception_handler(DomainError, domain_error_handler)
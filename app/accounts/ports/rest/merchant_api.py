@@ -3,13 +3,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.accounts.ports.rest.dependencies import get_merchant_service
+from app.accounts.ports.rest.responses import page_response
 from app.accounts.schemas.merchant_schemas import (
     MerchantCreateRequest,
     MerchantListResponse,
     MerchantResponse,
 )
 from app.accounts.services.merchant_service import MerchantService
-from app.common.exceptions import ValidationError
 
 router = APIRouter(prefix="/organizations/{org_id}/merchants", tags=["Merchants"])
 
@@ -51,11 +51,11 @@ def list_merchants(
         merchants, total = service.list_merchants(
             limit=limit, offset=offset, status=status, org_id=org_id
         )
-
-        return {"data": merchants, "total": total, "limit": limit, "offset": offset}
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
 
+    return page_response(MerchantListResponse, merchants, total, limit, offset)
+
 
 @router.post("/", response_model=MerchantResponse, status_code=status.HTTP_201_CREATED)
 def create_merchant(
@@ -78,8 +78,8 @@ def create_merchant(
         MerchantResponse containing the created merchant's details.
 
     Raises:
-        HTTPException(400): If merchant creation fails due to invalid data
-            or business rule violations.
+        ValidationError: If merchant creation fails due to invalid data
+            or business rule violations (422).
 
     Example:
         ```
@@ -91,13 +91,9 @@ def create_merchant(
         }
         ```
     """
-    try:
-        merchant = service.create_merchant(
-            org_id=org_id,
-            name=data.name,
-            country_code=data.country_code,
-            currency=data.currency,
-        )
-        return merchant
-    except ValidationError as e:
-        raise HTTPException(422, detail=str(e))
+    return service.create_merchant(
+        org_id=org_id,
+        name=data.name,
+        country_code=data.country_code,
+        currency=data.currency,
+    )
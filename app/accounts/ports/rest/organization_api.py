@@ -3,13 +3,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.accounts.ports.rest.dependencies import get_organization_service
+from app.accounts.ports.rest.responses import page_response
 from app.accounts.schemas.organization_schemas import (
     OrganizationCreateRequest,
     OrganizationListResponse,
     OrganizationResponse,
 )
 from app.accounts.services.organization_service import OrganizationService
-from app.common.exceptions import ValidationError
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
@@ -50,11 +50,11 @@ def list_organizations(
         organizations, total = service.list_organizations(
             limit=limit, offset=offset, status=status
         )
-
-        return {"data": organizations, "total": total, "limit": limit, "offset": offset}
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
 
+    return page_response(OrganizationListResponse, organizations, total, limit, offset)
+
 
 @router.post("/", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
 def create_organization(
@@ -73,8 +73,8 @@ def create_organization(
         OrganizationResponse containing the created organization's details.
 
     Raises:
-        HTTPException(400): If organization creation fails due to invalid data
-            or business rule violations.
+        ValidationError: If organization creation fails due to invalid data
+            or business rule violations (422).
 
     Example:
         ```
@@ -84,10 +84,7 @@ def create_organization(
         }
         ```
     """
-    try:
-        return service.create_organization(name=data.name, domain=data.domain)
-    except ValidationError as e:
-        raise HTTPException(422, detail=str(e))
+    return service.create_organization(name=data.name, domain=data.domain)
 
 
 @router.post("/{org_id}/suspend", response_model=OrganizationResponse)
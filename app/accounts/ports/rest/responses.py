@@ -0,0 +1,37 @@
+"""Response helpers shared by the accounts REST endpoints."""
+
+from typing import Any, Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def page_response(
+    schema: Type[BaseModel],
+    items: Sequence[Any],
+    total: int,
+    limit: int,
+    offset: int,
+) -> Response:
+    """Build the JSON response for one page of a list endpoint.
+
+    The page is validated in one pass and serialized straight to JSON bytes.
+    Returning a `Response` skips the ``jsonable_encoder`` and
+    ``response_model`` round trip FastAPI would otherwise make; the route's
+    ``response_model`` still documents the body in the OpenAPI schema.
+
+    Args:
+        schema: The list response schema of the endpoint.
+        items: The entities on the page.
+        total: Total number of matches across all pages.
+        limit: Maximum number of items per page.
+        offset: Number of items skipped before the page.
+
+    Returns:
+        Response: The serialized page.
+    """
+    page = schema.model_validate(
+        {"data": items, "total": total, "limit": limit, "offset": offset},
+        from_attributes=True,
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
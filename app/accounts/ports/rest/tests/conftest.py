@@ -1,5 +1,7 @@
 """Test fixtures specific to REST API endpoints."""
 
+from unittest.mock import Mock
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -10,24 +12,69 @@ from app.accounts.ports.rest.dependencies import (
     get_merchant_service,
     get_organization_service
 )
+from app.accounts.ports.rest.exception_handlers import register_exception_handlers
 from app.accounts.ports.rest.router import accounts_router
 
 
+# Mock Services
+_SHARED_MOCKS = {
+    name: Mock()
+    for name in (
+        "auth_service",
+        "user_service",
+        "organization_service",
+        "merchant_service",
+    )
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks():
+    """Reset calls and configuration of the shared service mocks after each test."""
+    yield
+    for mock in _SHARED_MOCKS.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
 @pytest.fixture
-def app(mock_auth_service, mock_user_service, mock_merchant_service, mock_organization_service):
-    """Test app fixture with dependency overrides."""
+def mock_auth_service():
+    """Mock authentication service."""
+    return _SHARED_MOCKS["auth_service"]
+
+@pytest.fixture
+def mock_user_service():
+    """Mock user service."""
+    return _SHARED_MOCKS["user_service"]
+
+@pytest.fixture
+def mock_organization_service():
+    """Mock organization service."""
+    return _SHARED_MOCKS["organization_service"]
+
+@pytest.fixture
+def mock_merchant_service():
+    """Mock merchant service."""
+    return _SHARED_MOCKS["merchant_service"]
+
+@pytest.fixture(scope="module")
+def app():
+    """Test app fixture with dependency overrides.
+
+    Module-scoped: the overrides point at the shared mocks, which are reset
+    between tests, so the app and its routes are wired once per module.
+    """
     app = FastAPI()
     app.include_router(accounts_router)
+    register_exception_handlers(app)
 
     app.dependency_overrides = {
-        get_auth_service: lambda: mock_auth_service,
-        get_user_service: lambda: mock_user_service,
-        get_merchant_service: lambda: mock_merchant_service,
-        get_organization_service: lambda: mock_organization_service,
+        get_auth_service: lambda: _SHARED_MOCKS["auth_service"],
+        get_user_service: lambda: _SHARED_MOCKS["user_service"],
+        get_merchant_service: lambda: _SHARED_MOCKS["merchant_service"],
+        get_organization_service: lambda: _SHARED_MOCKS["organization_service"],
     }
     return app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     """Test client fixture."""
     return TestClient(app)
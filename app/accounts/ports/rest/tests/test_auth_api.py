@@ -1,9 +1,12 @@
 """Test suite for authentication API endpoints."""
 
 from unittest.mock import patch
-from uuid import UUID
 
-from app.accounts.exceptions import AuthenticationError
+from app.accounts.exceptions import (
+    AuthenticationError,
+    InactiveUserError,
+    UserNotFoundError,
+)
 from app.common.exceptions import ValidationError
 
 
@@ -11,7 +14,7 @@ class TestAuthAPI:
     """Test cases for authentication endpoints."""
 
     def test_register_user_success(
-        self, client, mock_user_service, valid_register_data, valid_user
+        self, client, mock_user_service, valid_register_data, valid_user, valid_org_id
     ):
         """Test successful user registration."""
         # Setup
@@ -30,7 +33,7 @@ class TestAuthAPI:
         mock_user_service.create_user.assert_called_once_with(
             email_address=valid_register_data["email"],
             plain_password=valid_register_data["password"],
-            organization_id=UUID(valid_register_data["organization_id"]),
+            organization_id=valid_org_id,
         )
 
     def test_register_user_already_exists(
@@ -116,3 +119,70 @@ class TestAuthAPI:
         # Assert
         assert response.status_code == 401
         assert "Invalid credentials" in response.json()["detail"]
+
+    def test_login_json_success(
+        self, client, mock_auth_service, valid_user, valid_login_data
+    ):
+        """Test successful token request with JSON credentials."""
+        # Setup
+        mock_auth_service.authenticate_user.return_value = valid_user
+        mock_auth_service.create_access_token.return_value = "test.jwt.token"
+
+        # Execute
+        response = client.post("/accounts/auth/login", json=valid_login_data)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["access_token"] == "test.jwt.token"
+        mock_auth_service.authenticate_user.assert_called_once_with(
+            valid_login_data["email"], valid_login_data["password"]
+        )
+
+    def test_login_json_invalid_credentials(
+        self, client, mock_auth_service, valid_login_data
+    ):
+        """Test JSON token request with invalid credentials."""
+        # Setup
+        mock_auth_service.authenticate_user.side_effect = AuthenticationError(
+            "Invalid credentials"
+        )
+
+        # Execute
+        response = client.post("/accounts/auth/login", json=valid_login_data)
+
+        # Assert
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    def test_login_unknown_email_matches_wrong_password(
+        self, client, mock_auth_service, valid_login_data
+    ):
+        """Test that an unknown email is indistinguishable from a bad password."""
+        # Setup
+        mock_auth_service.authenticate_user.side_effect = [
+            UserNotFoundError(identifier=valid_login_data["email"]),
+            AuthenticationError("Invalid email or password"),
+        ]
+
+        # Execute
+        unknown = client.post("/accounts/auth/login", json=valid_login_data)
+        wrong = client.post("/accounts/auth/login", json=valid_login_data)
+
+        # Assert
+        assert unknown.status_code == wrong.status_code == 401
+        assert unknown.json() == wrong.json()
+        assert valid_login_data["email"] not in unknown.text
+
+    def test_login_inactive_user(self, client, mock_auth_service, valid_login_data):
+        """Test that logging in to an inactive account is rejected with 401."""
+        # Setup
+        mock_auth_service.authenticate_user.side_effect = InactiveUserError(
+            "User account is not active"
+        )
+
+        # Execute
+        response = client.post("/accounts/auth/login", json=valid_login_data)
+
+        # Assert
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
@@ -0,0 +1,152 @@
+"""Test suite for REST dependency wiring."""
+
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI, Security
+from fastapi.testclient import TestClient
+
+from app.accounts.exceptions import InactiveUserError, TokenError, UserNotFoundError
+from app.accounts.ports.rest import dependencies
+from app.accounts.ports.rest.dependencies import (
+    get_auth_service,
+    get_current_user,
+    get_password_hasher,
+    get_token_claims,
+    get_token_manager,
+    get_user_service,
+)
+from app.common.adapters.db.sql_model.session import get_session
+from app.settings import settings
+
+
+class TestDependencies:
+    """Test cases for service dependency factories."""
+
+    def test_services_share_one_session_per_request(self):
+        """Test that one request opens a single session for all services."""
+        # Setup
+        sessions = []
+
+        def counting_session():
+            session = Mock()
+            sessions.append(session)
+            yield session
+
+        app = FastAPI()
+        app.dependency_overrides[get_session] = counting_session
+
+        @app.get("/")
+        def route(
+            auth_service=Depends(get_auth_service),
+            user_service=Depends(get_user_service),
+        ):
+            return {
+                "shared": auth_service.user_repo.session
+                is user_service.user_repo.session
+            }
+
+        # Execute
+        response = TestClient(app).get("/")
+
+        # Assert
+        assert response.json() == {"shared": True}
+        assert len(sessions) == 1
+
+    def test_token_claims_are_decoded_once_per_request(self, monkeypatch):
+        """Test that claims are memoized across differently scoped dependencies."""
+        # Setup
+        token_manager = get_token_manager()
+        token = token_manager.create_access_token({"user_id": "123"})
+        decode = Mock(wraps=token_manager.decode_token)
+        monkeypatch.setattr(token_manager, "decode_token", decode)
+
+        app = FastAPI()
+
+        @app.get("/")
+        def route(
+            read=Security(get_token_claims, scopes=["read"]),
+            write=Security(get_token_claims, scopes=["write"]),
+        ):
+            return {"same": read is write, "user_id": read["user_id"]}
+
+        # Execute
+        response = TestClient(app).get(
+            "/", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        # Assert
+        assert response.json() == {"same": True, "user_id": "123"}
+        decode.assert_called_once_with(token)
+
+    def test_invalid_token_claims_are_rejected(self):
+        """Test that an undecodable bearer token yields 401 with a challenge."""
+        # Setup
+        app = FastAPI()
+
+        @app.get("/")
+        def route(claims=Depends(get_token_claims)):
+            return claims
+
+        # Execute
+        response = TestClient(app).get(
+            "/", headers={"Authorization": "Bearer not-a-jwt"}
+        )
+
+        # Assert
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            TokenError("Token user ID mismatch"),
+            UserNotFoundError(identifier="test@example.com"),
+            InactiveUserError("User account is not active"),
+        ],
+    )
+    def test_current_user_errors_are_unauthorized(self, exc):
+        """Test that claims no longer naming an active user yield 401."""
+        # Setup
+        auth_service = Mock()
+        auth_service.get_user_from_claims.side_effect = exc
+
+        app = FastAPI()
+        app.dependency_overrides[get_token_claims] = lambda: {"user_id": "123"}
+        app.dependency_overrides[get_auth_service] = lambda: auth_service
+
+        @app.get("/")
+        def route(user=Depends(get_current_user)):
+            return {}
+
+        # Execute
+        response = TestClient(app).get("/")
+
+        # Assert
+        assert response.status_code == 401
+        assert response.json() == {"detail": str(exc)}
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+        auth_service.get_user_from_claims.assert_called_once_with({"user_id": "123"})
+
+    def test_password_hasher_is_configured_from_settings(self, monkeypatch):
+        """Test that the shared hasher takes its cost and cap from settings."""
+        # Setup
+        hasher_class = Mock()
+        monkeypatch.setattr(dependencies, "Argon2PasswordHasher", hasher_class)
+        monkeypatch.setattr(settings, "argon2_max_concurrency", 3)
+        monkeypatch.setattr(settings, "argon2_time_cost", 2)
+        monkeypatch.setattr(settings, "argon2_memory_cost", 8 * 1024)
+        monkeypatch.setattr(settings, "argon2_parallelism", 1)
+        get_password_hasher.cache_clear()
+
+        # Execute
+        try:
+            hasher = get_password_hasher()
+        finally:
+            get_password_hasher.cache_clear()
+
+        # Assert
+        assert hasher is hasher_class.return_value
+        hasher_class.assert_called_once_with(
+            max_concurrency=3, time_cost=2, memory_cost=8 * 1024, parallelism=1
+        )
@@ -0,0 +1,79 @@
+"""Test suite for domain exception handlers."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.accounts.exceptions import (
+    AuthenticationError,
+    InvalidOrganizationStateError,
+    UserNotFoundError,
+)
+from app.accounts.ports.rest.exception_handlers import register_exception_handlers
+from app.common.exceptions import RepositoryError, ValidationError
+
+
+class TestExceptionHandlers:
+    """Test cases for mapping domain exceptions to HTTP responses."""
+
+    @pytest.mark.parametrize(
+        "exc, status_code",
+        [
+            (AuthenticationError("Bad credentials"), 401),
+            (ValidationError("Bad input"), 422),
+            (UserNotFoundError(identifier="a@example.com"), 404),
+            (InvalidOrganizationStateError("Already suspended"), 400),
+        ],
+    )
+    def test_domain_errors_map_to_status(self, exc, status_code):
+        """Test that each domain error family gets its status and code."""
+        # Setup
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/")
+        def route():
+            raise exc
+
+        # Execute
+        response = TestClient(app).get("/")
+
+        # Assert
+        assert response.status_code == status_code
+        assert response.json() == {"code": exc.code, "detail": str(exc)}
+
+    def test_authentication_error_sets_bearer_challenge(self):
+        """Test that authentication errors carry a WWW-Authenticate header."""
+        # Setup
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/")
+        def route():
+            raise AuthenticationError("Bad credentials")
+
+        # Execute
+        response = TestClient(app).get("/")
+
+        # Assert
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    def test_repository_error_hides_internal_message(self):
+        """Test that storage failures return a generic 500."""
+        # Setup
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/")
+        def route():
+            raise RepositoryError("Failed to create entity UserORM")
+
+        # Execute
+        response = TestClient(app).get("/")
+
+        # Assert
+        assert response.status_code == 500
+        assert response.json() == {
+            "code": "REPOSITORY_ERROR",
+            "detail": "Internal server error",
+        }
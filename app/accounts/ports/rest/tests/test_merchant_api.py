@@ -1,6 +1,6 @@
 """Test suite for the merchant API endpoints."""
 
-from uuid import UUID
+import pytest
 
 from app.common.exceptions import ValidationError
 
@@ -9,7 +9,13 @@ class TestMerchantAPI:
     """Test cases for merchant endpoints."""
 
     def test_create_merchant_success(
-        self, client, mock_merchant_service, valid_merchant_request_data, valid_merchant, valid_merchant_response_data
+        self,
+        client,
+        mock_merchant_service,
+        valid_merchant_request_data,
+        valid_merchant,
+        valid_merchant_response_data,
+        valid_org_id,
     ):
         """Test successful merchant creation."""
         # Setup
@@ -18,7 +24,7 @@ class TestMerchantAPI:
         # Execute
         response = client.post(
             f"/accounts/organizations/{valid_merchant_request_data['organization_id']}/merchants",
-            json=valid_merchant_request_data,
+            json=dict(valid_merchant_request_data),
         )
 
         # Assert
@@ -29,21 +35,39 @@ class TestMerchantAPI:
 
         # Verify service call
         mock_merchant_service.create_merchant.assert_called_once_with(
-            org_id=UUID(valid_merchant_request_data["organization_id"]),
+            org_id=valid_org_id,
             name=valid_merchant_request_data["name"],
             country_code=valid_merchant_request_data["country_code"],
             currency=valid_merchant_request_data["currency"],
         )
 
+    @pytest.mark.parametrize(
+        "query, expected_kwargs",
+        [
+            ("", {"limit": 100, "offset": 0, "status": None}),
+            (
+                "?status=ACTIVE&limit=10&offset=0",
+                {"limit": 10, "offset": 0, "status": "ACTIVE"},
+            ),
+        ],
+    )
     def test_list_merchants_success(
-        self, client, mock_merchant_service, valid_merchant, valid_org_id
+        self,
+        client,
+        mock_merchant_service,
+        valid_merchant,
+        valid_org_id,
+        query,
+        expected_kwargs,
     ):
-        """Test successful merchant listing."""
+        """Test merchant listing with default and explicit query parameters."""
         # Setup
         mock_merchant_service.list_merchants.return_value = ([valid_merchant], 1)
 
         # Execute
-        response = client.get(f"/accounts/organizations/{valid_org_id}/merchants")
+        response = client.get(
+            f"/accounts/organizations/{valid_org_id}/merchants{query}"
+        )
 
         # Assert
         assert response.status_code == 200
@@ -54,25 +78,7 @@ class TestMerchantAPI:
 
         # Verify service call
         mock_merchant_service.list_merchants.assert_called_once_with(
-            limit=100, offset=0, status=None, org_id=valid_org_id
-        )
-
-    def test_list_merchants_with_filters(
-        self, client, mock_merchant_service, valid_org_id
-    ):
-        """Test merchant listing with filters."""
-        # Setup
-        mock_merchant_service.list_merchants.return_value = ([], 0)
-
-        # Execute
-        response = client.get(
-            f"/accounts/organizations/{valid_org_id}/merchants?status=ACTIVE&limit=10&offset=0"
-        )
-
-        # Assert
-        assert response.status_code == 200
-        mock_merchant_service.list_merchants.assert_called_once_with(
-            limit=10, offset=0, status="ACTIVE", org_id=valid_org_id
+            **expected_kwargs, org_id=valid_org_id
         )
 
     def test_create_merchant_validation_error(
@@ -87,7 +93,7 @@ class TestMerchantAPI:
         # Execute
         response = client.post(
             f"/accounts/organizations/{valid_merchant_request_data['organization_id']}/merchants",
-            json=valid_merchant_request_data,
+            json=dict(valid_merchant_request_data),
         )
 
         # Assert
@@ -2,6 +2,8 @@
 
 from uuid import UUID
 
+import pytest
+
 from app.common.exceptions import ValidationError
 
 
@@ -16,7 +18,7 @@ class TestOrganizationAPI:
         mock_organization_service.create_organization.return_value = valid_organization
 
         # Execute
-        response = client.post("/accounts/organizations", json=valid_org_data)
+        response = client.post("/accounts/organizations", json=dict(valid_org_data))
 
         # Assert
         assert response.status_code == 201
@@ -39,16 +41,31 @@ class TestOrganizationAPI:
         )
 
         # Execute
-        response = client.post("/accounts/organizations", json=valid_org_data)
+        response = client.post("/accounts/organizations", json=dict(valid_org_data))
 
         # Assert
         assert response.status_code == 422
         assert "Invalid domain format" in response.json()["detail"]
 
+    @pytest.mark.parametrize(
+        "query, expected_kwargs",
+        [
+            ("", {"limit": 100, "offset": 0, "status": None}),
+            (
+                "?status=ACTIVE&limit=10&offset=0",
+                {"limit": 10, "offset": 0, "status": "ACTIVE"},
+            ),
+        ],
+    )
     def test_list_organizations_success(
-        self, client, mock_organization_service, valid_organization
+        self,
+        client,
+        mock_organization_service,
+        valid_organization,
+        query,
+        expected_kwargs,
     ):
-        """Test successful organization listing."""
+        """Test organization listing with default and explicit query parameters."""
         # Setup
         mock_organization_service.list_organizations.return_value = (
             [valid_organization],
@@ -56,7 +73,7 @@ class TestOrganizationAPI:
         )
 
         # Execute
-        response = client.get("/accounts/organizations")
+        response = client.get(f"/accounts/organizations{query}")
 
         # Assert
         assert response.status_code == 200
@@ -65,18 +82,9 @@ class TestOrganizationAPI:
         assert len(data["data"]) == 1
         assert data["data"][0]["name"] == valid_organization.name
 
-    def test_list_organizations_with_filters(self, client, mock_organization_service):
-        """Test organization listing with filters."""
-        # Setup
-        mock_organization_service.list_organizations.return_value = ([], 0)
-
-        # Execute
-        response = client.get("/accounts/organizations?status=ACTIVE&limit=10&offset=0")
-
-        # Assert
-        assert response.status_code == 200
+        # Verify service call
         mock_organization_service.list_organizations.assert_called_once_with(
-            limit=10, offset=0, status="ACTIVE"
+            **expected_kwargs
         )
 
     def test_suspend_organization_success(
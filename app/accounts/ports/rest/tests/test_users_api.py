@@ -0,0 +1,29 @@
+"""Test suite for the users API endpoints."""
+
+
+class TestUsersAPI:
+    """Test cases for user endpoints."""
+
+    def test_list_users_success(
+        self, client, mock_user_service, valid_user, valid_org_id
+    ):
+        """Test successful user listing."""
+        # Setup
+        mock_user_service.list_users.return_value = ([valid_user], 1)
+
+        # Execute
+        response = client.get(f"/accounts/organizations/{valid_org_id}/users")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["total"] == 1
+        assert data["limit"] == 100
+        assert data["data"][0]["id"] == str(valid_user.id)
+        assert "hashed_password" not in data["data"][0]
+
+        # Verify service call
+        mock_user_service.list_users.assert_called_once_with(
+            valid_org_id, limit=100, offset=0, status=None
+        )
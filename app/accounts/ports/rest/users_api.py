@@ -1,13 +1,18 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from app.accounts.ports.rest.dependencies import get_user_service
+from app.accounts.ports.rest.responses import page_response
 from app.accounts.schemas.user_schemas import UserListResponse, UserResponse
 from app.accounts.services.user_service import UserService
 
-router = APIRouter()
-router = APIRouter(prefix="/organizations/{org_id}/users", tags=["Users"])
+router = APIRouter(
+    prefix="/organizations/{org_id}/users",
+    tags=["Users"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get("/", response_model=UserListResponse)
@@ -26,16 +31,11 @@ def list_users(
             offset=offset,
             status=status,
         )
-
-        return {
-            "data": users,
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
 
+    return page_response(UserListResponse, users, total, limit, offset)
+
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(
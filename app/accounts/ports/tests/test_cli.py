@@ -0,0 +1,70 @@
+"""Test suite for the accounts CLI."""
+
+import pydantic
+import pytest
+from typer import Typer
+from typer.testing import CliRunner
+
+from app.accounts.ports.cli import schema_options
+
+
+class GreetRequest(pydantic.BaseModel):
+    """Request schema for the test command."""
+
+    name: str = pydantic.Field(..., description="Name to greet", min_length=2)
+    greeting: str = pydantic.Field("Hello", description="Greeting to use")
+
+
+@pytest.fixture
+def greet_app():
+    """Fixture providing a Typer app with one schema-derived command."""
+    app = Typer()
+
+    @app.command()
+    @schema_options(GreetRequest)
+    def greet(request: GreetRequest):
+        """Greet someone."""
+        print(f"{request.greeting}, {request.name}")
+
+    return app
+
+
+class TestSchemaOptions:
+    """Test cases for deriving command options from a request schema."""
+
+    def test_optional_option_defaults_to_field_default(self, greet_app):
+        """Test that a field with a default may be omitted."""
+        result = CliRunner().invoke(greet_app, ["--name", "Ada"])
+
+        assert result.exit_code == 0
+        assert result.output == "Hello, Ada\n"
+
+    def test_optional_option_overrides_default(self, greet_app):
+        """Test that an optional field can be set on the command line."""
+        result = CliRunner().invoke(greet_app, ["--name", "Ada", "--greeting", "Hi"])
+
+        assert result.exit_code == 0
+        assert result.output == "Hi, Ada\n"
+
+    def test_missing_required_option_is_rejected(self, greet_app):
+        """Test that a required field becomes a required option."""
+        result = CliRunner().invoke(greet_app, ["--greeting", "Hi"])
+
+        assert result.exit_code == 2
+        assert "Missing option '--name'" in result.output
+
+    def test_schema_validation_error_is_bad_parameter(self, greet_app):
+        """Test that a schema validation failure is reported as a usage error."""
+        result = CliRunner().invoke(greet_app, ["--name", "A"])
+
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
+        assert "at least 2 characters" in result.output
+
+    def test_help_lists_field_descriptions(self, greet_app):
+        """Test that field descriptions become the options' help text."""
+        result = CliRunner().invoke(greet_app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "Name to greet" in result.output
+        assert "Greeting to use" in result.output
@@ -4,7 +4,9 @@ This module provides Pydantic models for handling authentication-related
 requests and responses, including login, token generation, and validation.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field, field_validator
+
+from app.common.value_objects.email import Email
 
 
 class LoginRequest(BaseModel):
@@ -21,18 +23,34 @@ class LoginRequest(BaseModel):
         ... )
     """
 
-    email: EmailStr = Field(
+    email: str = Field(
         ...,
         description="Email address for authentication",
-        json_schema_extra={"example": "user@example.com"},  # Updated
+        json_schema_extra={"format": "email"},
     )
     password: str = Field(
         ...,
         min_length=8,
         description="User's password",
-        json_schema_extra={"example": "SecurePass123!"},  # Updated
     )
 
+    @field_validator("email")
+    def validate_email(cls, v: str) -> str:
+        """Check the email's shape with the precompiled `Email` pattern.
+
+        Login only looks the address up, so the full `EmailStr` validation
+        (IDNA and deliverability-grade syntax checks) is not worth its cost
+        on this path; an address that was never registered just fails to
+        authenticate.
+
+        Raises:
+            ValueError: If the email is not of the form local@domain.tld.
+        """
+        v = v.strip()
+        if not Email.EMAIL_PATTERN.match(v):
+            raise ValueError("Invalid email format")
+        return v
+
     model_config = {
         "json_schema_extra": {
             "example": {"email": "user@example.com", "password": "SecurePass123!"}
@@ -57,12 +75,10 @@ class TokenResponse(BaseModel):
     access_token: str = Field(
         ...,
         description="JWT access token",
-        json_schema_extra={"example": "eyJ0eXAiOiJKV1QiLCJhbGci..."},  # Updated
     )
     token_type: str = Field(
         default="bearer",
         description="Token type, always 'bearer'",
-        json_schema_extra={"example": "bearer"},  # Updated
     )
 
     model_config = {
@@ -8,7 +8,9 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.common.value_objects.domain_name import DomainName
 
 
 class OrganizationCreateRequest(BaseModel):
@@ -28,16 +30,32 @@ class OrganizationCreateRequest(BaseModel):
     name: str = Field(
         ...,
         description="Organization display name",
-        json_schema_extra={"example": "Acme Corporation"},
         min_length=1,
         max_length=100,
     )
     domain: str = Field(
         ...,
         description="Organization email domain",
-        json_schema_extra={"example": "acme.com"},
     )
 
+    @field_validator("domain")
+    def validate_domain(cls, v: str) -> str:
+        """Validate and normalize the domain with the `DomainName` value object.
+
+        Rejects malformed domains at the request boundary, before they
+        reach the service.
+
+        Returns:
+            Normalized lowercase domain name.
+
+        Raises:
+            ValueError: If the domain is too long or not a valid domain name.
+        """
+        try:
+            return DomainName(value=v).value
+        except ValueError:
+            raise ValueError("Invalid domain format") from None
+
     model_config = {
         "json_schema_extra": {
             "example": {"name": "Acme Corporation", "domain": "acme.com"}
@@ -68,27 +86,22 @@ class OrganizationResponse(BaseModel):
     id: UUID = Field(
         ...,
         description="Unique organization identifier",
-        json_schema_extra={"example": "123e4567-e89b-12d3-a456-426614174000"},
     )
     name: str = Field(
         ...,
         description="Organization display name",
-        json_schema_extra={"example": "Acme Corporation"},
     )
     domain: str = Field(
         ...,
         description="Organization domain name",
-        json_schema_extra={"example": "acme.com"},
     )
     status: str = Field(
         ...,
         description="Current organization status",
-        json_schema_extra={"example": "active"},
     )
     created_at: datetime = Field(
         ...,
         description="Organization creation timestamp",
-        json_schema_extra={"example": "2024-01-01T00:00:00Z"},
     )
 
     model_config = ConfigDict(
@@ -129,20 +142,17 @@ class OrganizationListResponse(BaseModel):
     total: int = Field(
         ...,
         description="Total number of organizations",
-        json_schema_extra={"example": 100},
         ge=0,
     )
     limit: int = Field(
         ...,
         description="Maximum items per page",
-        json_schema_extra={"example": 10},
         ge=1,
         le=1000,
     )
     offset: int = Field(
         ...,
         description="Number of items to skip",
-        json_schema_extra={"example": 0},
         ge=0,
     )
 
@@ -1,5 +1,6 @@
 """Test suite for authentication schemas."""
 
+import orjson
 import pytest
 from pydantic import ValidationError
 
@@ -73,5 +74,11 @@ class TestTokenResponse:
     def test_json_serialization(self):
         """Test JSON serialization of token response."""
         response = TokenResponse(access_token="test-token", token_type="bearer")
-        json_data = response.model_dump_json()
-        assert all(field in json_data for field in ["access_token", "token_type"])
+        json_data = orjson.dumps(response.model_dump())
+        assert orjson.loads(json_data) == {
+            "access_token": "test-token",
+            "token_type": "bearer",
+        }
+        # The login endpoints encode the token body with orjson; it must match
+        # what pydantic would produce for the documented response model.
+        assert json_data == response.model_dump_json().encode()
@@ -47,6 +47,7 @@ class TestMerchantCreateRequest:
             "USA",  # Too long
             "12",  # Numbers
             "us",  # Lowercase
+            "ZZ",  # Unassigned
         ]
 
         data = valid_merchant_request_data.copy()
@@ -64,6 +65,7 @@ class TestMerchantCreateRequest:
             "USDD",  # Too long
             "123",  # Numbers
             "usd",  # Lowercase
+            "ZZZ",  # Unassigned
         ]
 
         data = valid_merchant_request_data.copy()
@@ -37,6 +37,22 @@ class TestOrganizationCreateRequest:
             )
         assert "name" in str(exc.value)
 
+    @pytest.mark.parametrize(
+        "domain", ["", "acme", "acme.c", "-acme.com", "acme..com", "a" * 250 + ".com"]
+    )
+    def test_domain_validation(self, domain):
+        """Test that malformed domains are rejected."""
+        with pytest.raises(ValidationError) as exc:
+            OrganizationCreateRequest(name="Acme Corporation", domain=domain)
+        assert "Invalid domain format" in str(exc.value)
+
+    def test_domain_normalization(self):
+        """Test that domains are stripped and lowercased."""
+        request = OrganizationCreateRequest(
+            name="Acme Corporation", domain=" ACME.com "
+        )
+        assert request.domain == "acme.com"
+
 
 class TestOrganizationResponse:
     """Test cases for OrganizationResponse schema."""
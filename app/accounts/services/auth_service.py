@@ -78,9 +78,7 @@ class AuthService:
         user = self.user_repo.get_by_email(email)
 
         if not user:
-            raise UserNotFoundError(
-                f"User with email {email} not found", identifier=email
-            )
+            raise UserNotFoundError(identifier=email)
 
         if not self.password_hasher.verify(password, user.hashed_password):
             raise AuthenticationError("Invalid email or password")
@@ -104,17 +102,35 @@ class AuthService:
             UserNotFoundError: If user no longer exists.
             InactiveUserError: If user account is not active.
         """
+        return self.get_user_from_claims(self.token_manager.decode_token(token))
+
+    def get_user_from_claims(self, claims: Dict[str, Any]) -> User:
+        """Get the user identified by already-decoded token claims.
+
+        Lets callers that decoded the token themselves skip a second
+        signature verification.
+
+        Args:
+            claims: Claims of a verified access token.
+
+        Returns:
+            Authenticated user entity.
+
+        Raises:
+            TokenError: If the claims are malformed or name another user.
+            UserNotFoundError: If user no longer exists.
+            InactiveUserError: If user account is not active.
+        """
         try:
-            payload = self.token_manager.decode_token(token)
-            email = Email(payload.get("email"))
-            user_id = UUID(payload.get("user_id"))
-        except (ValueError, KeyError) as e:
+            email = Email.parse(claims.get("email"))
+            user_id = UUID(claims.get("user_id"))
+        except (ValueError, KeyError, TypeError) as e:
             raise TokenError(f"Invalid token payload: {str(e)}")
 
         user = self.user_repo.get_by_email(str(email))
 
         if not user:
-            raise UserNotFoundError("User not found")
+            raise UserNotFoundError(identifier=email)
 
         if user.id != user_id:
             raise TokenError("Token user ID mismatch")
@@ -9,6 +9,7 @@ from uuid import UUID
 
 from app.accounts.entities.merchant import Merchant, MerchantStatus
 from app.accounts.interfaces.merchant_repo import MerchantRepository
+from app.common.exceptions import ValidationError
 
 
 class MerchantService:
@@ -64,10 +65,7 @@ class MerchantService:
                     f"Invalid status filter. Valid values are: {valid_statuses}"
                 )
 
-        merchants = self.repo.list_all(limit=limit, offset=offset, filters=query_filter)
-        total = self.repo.count(filters=query_filter)
-
-        return merchants, total
+        return self.repo.list_page(limit=limit, offset=offset, filters=query_filter)
 
     def get_merchant(self, merchant_id: UUID) -> Merchant:
         """Retrieve a single merchant by ID.
@@ -102,6 +100,7 @@ class MerchantService:
 
         Raises:
             ValueError: If merchant creation fails validation.
+            ValidationError: If the merchant already exists.
         """
         merchant = Merchant(
             name=name,
@@ -109,7 +108,8 @@ class MerchantService:
             currency=currency.upper(),
             organization_id=org_id,
         )
-        self.repo.save(merchant)
+        if self.repo.create(merchant) is None:
+            raise ValidationError("Merchant already exists")
         return merchant
 
     def add_payment_method(self, merchant_id: UUID, payment_method: str) -> Merchant:
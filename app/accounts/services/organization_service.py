@@ -90,13 +90,7 @@ class OrganizationService:
                     f"Invalid status filter. Valid values are: {valid_statuses}"
                 )
 
-        organizations = self.repo.list_all(
-            limit=limit, offset=offset, filters=query_filter
-        )
-
-        total = self.repo.count(filters=query_filter)
-
-        return organizations, total
+        return self.repo.list_page(limit=limit, offset=offset, filters=query_filter)
 
     def get_organization(self, organization_id: UUID) -> Organization:
         """Retrieve a single organization by ID.
@@ -16,6 +16,7 @@ def mock_merchant_repo():
     """Mock merchant repository."""
     repo = Mock(spec=MerchantRepository)
     repo.list_all.return_value = []
+    repo.list_page.return_value = ([], 0)
     repo.count.return_value = 0
     return repo
 
@@ -25,6 +26,7 @@ def mock_organization_repo():
     """Mock organization repository."""
     repo = Mock(spec=OrganizationRepository)
     repo.list_all.return_value = []
+    repo.list_page.return_value = ([], 0)
     repo.count.return_value = 0
     return repo
 
@@ -34,6 +36,7 @@ def mock_user_repo():
     """Mock user repository."""
     repo = Mock(spec=UserRepository)
     repo.list_all.return_value = []
+    repo.list_page.return_value = ([], 0)
     repo.count.return_value = 0
     return repo
 
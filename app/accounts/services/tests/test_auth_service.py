@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 from unittest.mock import Mock
+from uuid import uuid4
 
 import pytest
 
@@ -9,6 +10,7 @@ from app.accounts.entities.user import UserStatus
 from app.accounts.exceptions import (
     AuthenticationError,
     InactiveUserError,
+    TokenError,
     UserNotFoundError,
 )
 from app.accounts.services.auth_service import AuthService
@@ -121,7 +123,7 @@ class TestAuthService:
 
         # Execute and Assert
         with pytest.raises(
-            UserNotFoundError, match="User with email test@example.com not found"
+            UserNotFoundError, match="User with identifier 'test@example.com' not found"
         ):
             auth_service.authenticate_user(
                 email="test@example.com", password="any_password"
@@ -140,3 +142,61 @@ class TestAuthService:
             auth_service.authenticate_user(
                 email=str(valid_user.email), password="wrong_password"
             )
+
+    def test_get_user_from_claims_success(
+        self, auth_service, mock_user_repo, valid_user
+    ):
+        """Test that matching claims resolve to the user and record the login."""
+        # Setup
+        mock_user_repo.get_by_email.return_value = valid_user
+        claims = {"email": str(valid_user.email), "user_id": str(valid_user.id)}
+
+        # Execute
+        user = auth_service.get_user_from_claims(claims)
+
+        # Assert
+        assert user == valid_user
+        mock_user_repo.update_login_time.assert_called_once_with(valid_user.id)
+
+    def test_get_user_from_claims_user_id_mismatch(
+        self, auth_service, mock_user_repo, valid_user
+    ):
+        """Test that claims naming another user's ID are rejected."""
+        # Setup
+        mock_user_repo.get_by_email.return_value = valid_user
+        claims = {"email": str(valid_user.email), "user_id": str(uuid4())}
+
+        # Execute and Assert
+        with pytest.raises(TokenError, match="Token user ID mismatch"):
+            auth_service.get_user_from_claims(claims)
+        mock_user_repo.update_login_time.assert_not_called()
+
+    def test_get_user_from_claims_inactive_user(
+        self, auth_service, mock_user_repo, valid_user
+    ):
+        """Test that claims of an inactive user are rejected."""
+        # Setup
+        inactive_user = valid_user.model_copy(update={"status": UserStatus.INACTIVE})
+        mock_user_repo.get_by_email.return_value = inactive_user
+        claims = {"email": str(valid_user.email), "user_id": str(valid_user.id)}
+
+        # Execute and Assert
+        with pytest.raises(InactiveUserError, match="User account is not active"):
+            auth_service.get_user_from_claims(claims)
+        mock_user_repo.update_login_time.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {},
+            {"email": "test@example.com"},
+            {"email": "test@example.com", "user_id": "not-a-uuid"},
+            {"email": "not-an-email", "user_id": str(uuid4())},
+        ],
+    )
+    def test_get_user_from_claims_malformed(self, auth_service, mock_user_repo, claims):
+        """Test that malformed claims are rejected before any lookup."""
+        # Execute and Assert
+        with pytest.raises(TokenError, match="Invalid token payload"):
+            auth_service.get_user_from_claims(claims)
+        mock_user_repo.get_by_email.assert_not_called()
@@ -26,8 +26,7 @@ class TestMerchantService:
     ):
         """Test successful merchant listing."""
         # Setup
-        mock_repo.list_all.return_value = [valid_merchant]
-        mock_repo.count.return_value = 1
+        mock_repo.list_page.return_value = ([valid_merchant], 1)
 
         # Execute
         merchants, total = merchant_service.list_merchants(
@@ -38,7 +37,7 @@ class TestMerchantService:
         assert len(merchants) == 1
         assert total == 1
         assert merchants[0] == valid_merchant
-        mock_repo.list_all.assert_called_once_with(
+        mock_repo.list_page.assert_called_once_with(
             limit=10, offset=0, filters={"organization_id": valid_org_id}
         )
 
@@ -47,8 +46,7 @@ class TestMerchantService:
     ):
         """Test merchant listing with status filter."""
         # Setup
-        mock_repo.list_all.return_value = [valid_merchant]
-        mock_repo.count.return_value = 1
+        mock_repo.list_page.return_value = ([valid_merchant], 1)
 
         # Execute
         merchants, total = merchant_service.list_merchants(
@@ -57,7 +55,7 @@ class TestMerchantService:
 
         # Assert
         assert len(merchants) == 1
-        mock_repo.list_all.assert_called_once_with(
+        mock_repo.list_page.assert_called_once_with(
             limit=10,
             offset=0,
             filters={"organization_id": valid_org_id, "status": MerchantStatus.ACTIVE},
@@ -106,7 +104,7 @@ class TestMerchantService:
         assert merchant.currency == "USD"
         assert merchant.organization_id == valid_org_id
         assert merchant.status == MerchantStatus.ACTIVE
-        mock_repo.save.assert_called_once_with(merchant)
+        mock_repo.create.assert_called_once_with(merchant)
 
     def test_add_payment_method_success(
         self, merchant_service, mock_repo, valid_merchant
@@ -67,18 +67,12 @@ class UserService:
             The newly created user.
 
         Raises:
-            ValueError: If a user with the given email already exists.
+            ValidationError: If a user with the given email already exists
+                in the organization.
         """
         email = Email(email_address)
         password = Password(plain_password)
 
-        existing_user = self.user_repo.find_one(
-            email.value, {"organization_id": organization_id, "email": email}
-        )
-
-        if existing_user:
-            raise ValidationError("User already exists")
-
         hashed_password = self.password_hasher.hash(password.value)
         user = User(
             email=email,
@@ -86,7 +80,9 @@ class UserService:
             status=status,
             organization_id=organization_id,
         )
-        self.user_repo.save(user)
+        # One insert that skips duplicates, rather than a lookup before it
+        if self.user_repo.create(user) is None:
+            raise ValidationError("User already exists")
         return user
 
     def list_users(
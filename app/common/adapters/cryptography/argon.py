@@ -5,6 +5,8 @@ algorithm, the winner of the Password Hashing Competition (PHC). It provides
 strong security against various attack vectors including GPU/FPGA attacks.
 """
 
+import os
+import threading
 from typing import Any, Dict, Optional
 
 from passlib.context import CryptContext
@@ -17,7 +19,9 @@ class Argon2PasswordHasher(PasswordHasher):
     """Password hasher implementation using the Argon2 algorithm.
 
     This implementation uses Passlib's Argon2 with secure defaults and
-    support for parameter tuning.
+    support for parameter tuning. Each hash or verification holds
+    ``memory_cost`` KiB while it runs, so the number running at once is
+    capped; further callers wait for a free slot.
 
     Example:
         >>> hasher = Argon2PasswordHasher()
@@ -35,13 +39,16 @@ class Argon2PasswordHasher(PasswordHasher):
         "hash_len": 32,  # Hash length in bytes
     }
 
-    def __init__(self, **kwargs):
+    def __init__(self, max_concurrency: Optional[int] = None, **kwargs):
         """Initialize the hasher with optional custom parameters.
 
         Args:
+            max_concurrency: Maximum number of hashes or verifications run at
+                once. Defaults to the number of CPUs.
             **kwargs: Optional parameter overrides for Argon2.
         """
         params = {**self.DEFAULT_PARAMS, **kwargs}
+        self._slots = threading.BoundedSemaphore(max_concurrency or os.cpu_count() or 1)
 
         self.pwd_context = CryptContext(
             schemes=["argon2"],
@@ -75,7 +82,8 @@ class Argon2PasswordHasher(PasswordHasher):
         if not plain_password or not hashed_password:
             raise ValueError("Password and hash must not be empty")
 
-        return self.pwd_context.verify(plain_password, hashed_password)
+        with self._slots:
+            return self.pwd_context.verify(plain_password, hashed_password)
 
     def hash(self, password: str, options: Optional[Dict[str, Any]] = None) -> str:
         """Hash a password using Argon2.
@@ -97,9 +105,10 @@ class Argon2PasswordHasher(PasswordHasher):
             raise ValueError("Password must not be empty")
 
         try:
-            return self.pwd_context.hash(
-                password, **({} if options is None else options)
-            )
+            with self._slots:
+                return self.pwd_context.hash(
+                    password, **({} if options is None else options)
+                )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Password hashing failed: {str(e)}")
 
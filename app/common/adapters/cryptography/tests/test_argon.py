@@ -0,0 +1,46 @@
+"""Test suite for Argon2PasswordHasher."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.common.adapters.cryptography.argon import Argon2PasswordHasher
+
+
+class TestArgon2PasswordHasher:
+    """Test cases for Argon2PasswordHasher."""
+
+    def test_hash_and_verify_round_trip(self):
+        """Test that a hash verifies against its own password only."""
+        hasher = Argon2PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+
+        hashed = hasher.hash("secret")
+
+        assert hasher.verify("secret", hashed)
+        assert not hasher.verify("wrong", hashed)
+
+    def test_max_concurrency_bounds_simultaneous_verifies(self):
+        """Test that no more than max_concurrency verifications run at once."""
+        hasher = Argon2PasswordHasher(max_concurrency=2)
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def slow_verify(plain_password, hashed_password):
+            with lock:
+                running.append(plain_password)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(plain_password)
+            return True
+
+        hasher.pwd_context.verify = slow_verify
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(lambda i: hasher.verify(f"password{i}", "hash"), range(6))
+            )
+
+        assert results == [True] * 6
+        assert max(peak) == 2
@@ -20,6 +20,8 @@ Note:
     - CI/CD environments
 """
 
+from app.common.adapters.db.in_memory.group_index import GroupIndex, SortedGroupIndex
+from app.common.adapters.db.in_memory.name_index import NameIndex
 from app.common.adapters.db.in_memory.repository import InMemoryRepository
 
-__all__ = ["InMemoryRepository"]
+__all__ = ["GroupIndex", "InMemoryRepository", "NameIndex", "SortedGroupIndex"]
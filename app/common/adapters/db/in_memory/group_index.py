@@ -0,0 +1,158 @@
+"""Equality indexes grouping in-memory entity IDs by a key value."""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, Hashable, List
+from uuid import UUID
+
+
+class GroupIndex:
+    """Secondary index mapping a key value to the IDs of entities holding it.
+
+    Turns equality filters such as ``organization_id == org_id`` into a
+    direct bucket fetch. Each bucket keeps its IDs in insertion order, and
+    an entity whose key changes is moved to the end of its new bucket.
+
+    Example:
+        >>> index = GroupIndex()
+        >>> index.add(merchant.organization_id, merchant.id)
+        >>> index.get(merchant.organization_id)
+        [UUID('...')]
+    """
+
+    __slots__ = ("_buckets", "_keys")
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._buckets: Dict[Hashable, Dict[UUID, None]] = defaultdict(dict)
+        self._keys: Dict[UUID, Hashable] = {}
+
+    def add(self, key: Hashable, id: UUID) -> None:
+        """Place an entity in the bucket for ``key``.
+
+        Args:
+            key (Hashable): The indexed value of the entity.
+            id (UUID): The entity ID.
+        """
+        previous = self._keys.get(id, key)
+        if previous != key:
+            self._discard(previous, id)
+        self._buckets[key][id] = None
+        self._keys[id] = key
+
+    def remove(self, id: UUID) -> None:
+        """Remove an entity from the index.
+
+        Args:
+            id (UUID): The entity ID.
+        """
+        if id in self._keys:
+            self._discard(self._keys.pop(id), id)
+
+    def get(
+        self, key: Hashable, limit: int | None = None, offset: int = 0
+    ) -> List[UUID]:
+        """Return the IDs in the bucket for ``key``.
+
+        Args:
+            key (Hashable): The indexed value to look up.
+            limit (int | None): Maximum number of IDs to return. Defaults to all.
+            offset (int): Number of IDs to skip. Defaults to 0.
+
+        Returns:
+            List[UUID]: Entity IDs in bucket order.
+        """
+        bucket = self._buckets.get(key, {})
+        stop = None if limit is None else offset + limit
+        return list(islice(bucket, offset, stop))
+
+    def size(self, key: Hashable) -> int:
+        """Return the number of IDs in the bucket for ``key``.
+
+        Args:
+            key (Hashable): The indexed value to look up.
+
+        Returns:
+            int: The bucket size, 0 when no entity holds the value.
+        """
+        return len(self._buckets.get(key, ()))
+
+    def _discard(self, key: Hashable, id: UUID) -> None:
+        """Remove an entity ID from a bucket, dropping the bucket once empty."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.pop(id, None)
+            if not bucket:
+                del self._buckets[key]
+
+
+class SortedGroupIndex(GroupIndex):
+    """Group index keeping each bucket sorted by entity ID.
+
+    Mirrors an ``ORDER BY id`` listing so pages can be fetched by keyset:
+    ``get(key, after=last_id)`` bisects straight to the first ID greater
+    than the cursor instead of skipping ``offset`` entries, and keeps
+    working when the cursor entity has since been deleted.
+
+    Example:
+        >>> index = SortedGroupIndex()
+        >>> index.add(merchant.organization_id, merchant.id)
+        >>> index.get(merchant.organization_id, limit=50, after=last_seen_id)
+        [UUID('...')]
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._buckets: Dict[Hashable, List[UUID]] = defaultdict(list)
+        self._keys: Dict[UUID, Hashable] = {}
+
+    def add(self, key: Hashable, id: UUID) -> None:
+        """Place an entity in the bucket for ``key``.
+
+        Args:
+            key (Hashable): The indexed value of the entity.
+            id (UUID): The entity ID.
+        """
+        if id in self._keys:
+            if self._keys[id] == key:
+                return
+            self._discard(self._keys[id], id)
+        insort(self._buckets[key], id)
+        self._keys[id] = key
+
+    def get(
+        self,
+        key: Hashable,
+        limit: int | None = None,
+        offset: int = 0,
+        after: UUID | None = None,
+    ) -> List[UUID]:
+        """Return the IDs in the bucket for ``key`` in ascending order.
+
+        Args:
+            key (Hashable): The indexed value to look up.
+            limit (int | None): Maximum number of IDs to return. Defaults to all.
+            offset (int): Number of IDs to skip. Defaults to 0.
+            after (UUID | None): Keyset cursor; only IDs greater than it are
+                returned. Defaults to the start of the bucket.
+
+        Returns:
+            List[UUID]: Entity IDs in ascending order.
+        """
+        bucket = self._buckets.get(key, [])
+        start = offset if after is None else bisect_right(bucket, after) + offset
+        stop = None if limit is None else start + limit
+        return bucket[start:stop]
+
+    def _discard(self, key: Hashable, id: UUID) -> None:
+        """Remove an entity ID from a bucket, dropping the bucket once empty."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            i = bisect_left(bucket, id)
+            if i < len(bucket) and bucket[i] == id:
+                del bucket[i]
+            if not bucket:
+                del self._buckets[key]
@@ -0,0 +1,121 @@
+"""Trigram index for case-insensitive substring search over in-memory entities."""
+
+from collections import defaultdict
+from itertools import count
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+
+class NameIndex:
+    """Inverted trigram index answering case-insensitive substring queries.
+
+    Indexed values are casefolded and split into overlapping trigrams, each
+    mapping to the set of entity IDs containing it. A query is answered by
+    intersecting the posting sets of its own trigrams and verifying the
+    surviving candidates, so only entities sharing every trigram with the
+    query are compared. Queries shorter than a trigram fall back to a scan of
+    the stored values.
+
+    Each entity's values are kept as one NUL-separated haystack, so matching
+    an entity against a query is a single substring scan whatever the number
+    of indexed fields.
+
+    Matches are returned in the order entities were first indexed, mirroring
+    the insertion order of the repository storage.
+
+    Example:
+        >>> index = NameIndex()
+        >>> index.add(merchant.id, "Acme Payments")
+        >>> index.search("PAY")
+        [UUID('...')]
+    """
+
+    __slots__ = ("_postings", "_values", "_rank", "_counter")
+
+    GRAM_SIZE = 3
+    SEPARATOR = "\x00"
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._postings: Dict[str, Set[UUID]] = defaultdict(set)
+        self._values: Dict[UUID, str] = {}
+        self._rank: Dict[UUID, int] = {}
+        self._counter = count()
+
+    def add(self, id: UUID, *values: Optional[str]) -> None:
+        """Index (or re-index) the searchable values of an entity.
+
+        Args:
+            id (UUID): The entity ID.
+            *values (Optional[str]): Values to match queries against. Empty
+                and None values are ignored.
+        """
+        haystack = self.SEPARATOR.join(value.casefold() for value in values if value)
+        previous = self._values.get(id)
+        if previous == haystack:
+            return
+        if previous is not None:
+            self._discard(id, previous)
+        else:
+            self._rank[id] = next(self._counter)
+        self._values[id] = haystack
+        for gram in self._grams(haystack):
+            self._postings[gram].add(id)
+
+    def remove(self, id: UUID) -> None:
+        """Remove an entity from the index.
+
+        Args:
+            id (UUID): The entity ID.
+        """
+        haystack = self._values.pop(id, None)
+        if haystack is not None:
+            self._discard(id, haystack)
+            del self._rank[id]
+
+    def search(self, query: str) -> List[UUID]:
+        """Find entities with a value containing the query, ignoring case.
+
+        Args:
+            query (str): Substring to search for.
+
+        Returns:
+            List[UUID]: IDs of matching entities in insertion order.
+        """
+        query = query.casefold()
+        if self.SEPARATOR in query:
+            return []
+        if len(query) < self.GRAM_SIZE:
+            return [id for id, haystack in self._values.items() if query in haystack]
+
+        postings = sorted(
+            (self._postings.get(gram, ()) for gram in self._grams(query)),
+            key=len,
+        )
+        if not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(
+            (id for id in candidates if query in self._values[id]),
+            key=self._rank.__getitem__,
+        )
+
+    def _discard(self, id: UUID, haystack: str) -> None:
+        """Remove an entity ID from the posting sets of its haystack."""
+        for gram in self._grams(haystack):
+            posting = self._postings[gram]
+            posting.discard(id)
+            if not posting:
+                del self._postings[gram]
+
+    def _grams(self, haystack: str) -> Set[str]:
+        """Split a casefolded haystack into its distinct trigrams.
+
+        Trigrams spanning a separator are skipped, as no query can contain one.
+        """
+        size = self.GRAM_SIZE
+        return {
+            value[i : i + size]
+            for value in haystack.split(self.SEPARATOR)
+            for i in range(len(value) - size + 1)
+        }
@@ -1,6 +1,19 @@
-from typing import Dict, Generic, List, Optional, TypeVar
+from itertools import islice
+from operator import attrgetter
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from uuid import UUID
 
+from app.common.adapters.db.in_memory.group_index import GroupIndex
 from app.common.exceptions import RecordNotFoundError, RepositoryError, ValidationError
 
 T = TypeVar("T")
@@ -9,12 +22,24 @@ T = TypeVar("T")
 class InMemoryRepository(Generic[T]):
     """In-memory implementation of the RepositoryInterface.
 
-    Stores entities in a dictionary for quick lookups.
+    Stores entities in a dictionary for quick lookups. Fields listed in
+    ``INDEXED_FIELDS`` additionally get an equality index, so filtered
+    queries on them only visit the entities holding the filtered value.
+    Subclasses needing an ordered view of a field, e.g. for keyset listing,
+    map it to `SortedGroupIndex` and read that same index instead of keeping
+    a second one.
     """
 
+    # Entity fields kept in an equality index for filtered queries, mapped to
+    # the factory building their index
+    INDEXED_FIELDS: Dict[str, Callable[[], GroupIndex]] = {}
+
     def __init__(self):
         """Initializes an empty in-memory repository."""
         self._storage: Dict[UUID, T] = {}
+        self._field_indexes: Dict[str, GroupIndex] = {
+            field: factory() for field, factory in self.INDEXED_FIELDS.items()
+        }
 
     def save(self, entity: T) -> T:
         """Saves an entity in the repository.
@@ -29,13 +54,30 @@ class InMemoryRepository(Generic[T]):
             RepositoryError: If an unexpected error occurs.
         """
         try:
-            self._storage[self._get_id(entity)] = entity
+            self._store(entity)
             return entity
         except Exception as e:
             raise RepositoryError(
                 f"Failed to save entity {self._get_entity_name()}"
             ) from e
 
+    def create(self, entity: T) -> Optional[T]:
+        """Stores a new entity unless its ID or a unique field is taken.
+
+        Args:
+            entity (T): The new entity to store.
+
+        Returns:
+            Optional[T]: The stored entity, or None if it conflicts with an
+                existing entity.
+
+        Raises:
+            RepositoryError: If an unexpected error occurs.
+        """
+        if self._get_id(entity) in self._storage or self._conflicts(entity):
+            return None
+        return self.save(entity)
+
     def bulk_save(self, entities: List[T]) -> List[T]:
         """Saves multiple entities in the repository.
 
@@ -50,7 +92,7 @@ class InMemoryRepository(Generic[T]):
         """
         try:
             for entity in entities:
-                self._storage[self._get_id(entity)] = entity
+                self._store(entity)
             return entities
         except Exception as e:
             raise RepositoryError(
@@ -91,10 +133,7 @@ class InMemoryRepository(Generic[T]):
         if not filters:
             raise ValidationError("Filters are required for find_one.")
 
-        for entity in self._storage.values():
-            if all(getattr(entity, key) == value for key, value in filters.items()):
-                return entity
-        return None
+        return next(self._matching(filters), None)
 
     def exists(self, filters: Dict[str, any]) -> bool:
         """Checks if any entity matches the given filters.
@@ -111,10 +150,7 @@ class InMemoryRepository(Generic[T]):
         if not filters:
             raise ValidationError("Filters are required for exists check.")
 
-        return any(
-            all(getattr(entity, key) == value for key, value in filters.items())
-            for entity in self._storage.values()
-        )
+        return next(self._matching(filters), None) is not None
 
     def delete(self, id: UUID) -> bool:
         """Deletes an entity by its ID.
@@ -133,7 +169,7 @@ class InMemoryRepository(Generic[T]):
                 entity_type=self._get_entity_name(), identifier=id
             )
         try:
-            del self._storage[id]
+            self._evict(id)
             return True
         except Exception as e:
             raise RepositoryError(
@@ -156,18 +192,14 @@ class InMemoryRepository(Generic[T]):
         if not filters:
             raise ValidationError("Filters are required for bulk delete.")
 
-        to_delete = [
-            id
-            for id, entity in self._storage.items()
-            if all(getattr(entity, key) == value for key, value in filters.items())
-        ]
+        to_delete = [self._get_id(entity) for entity in self._matching(filters)]
 
         if not to_delete:
             return 0
 
         try:
             for id in to_delete:
-                del self._storage[id]
+                self._evict(id)
             return len(to_delete)
         except Exception as e:
             raise RepositoryError(
@@ -192,19 +224,35 @@ class InMemoryRepository(Generic[T]):
         Returns:
             List[T]: A list of matching entities.
         """
-        entities = list(self._storage.values())
-
-        if filters:
-            entities = [
-                e
-                for e in entities
-                if all(getattr(e, k) == v for k, v in filters.items())
-            ]
+        entities = self._matching(filters) if filters else iter(self._storage.values())
 
         if sort_by:
-            entities.sort(key=lambda x: getattr(x, sort_by))
+            entities = sorted(entities, key=lambda x: getattr(x, sort_by))
 
-        return entities[offset : offset + limit]
+        return list(islice(entities, offset, offset + limit))
+
+    def list_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        filters: Optional[Dict[str, any]] = None,
+    ) -> Tuple[List[T], int]:
+        """Lists one page of entities together with the total number of matches.
+
+        Args:
+            limit (int): Maximum number of entities to return.
+            offset (int): Number of entities to skip.
+            sort_by (Optional[str]): Column name to sort by.
+            filters (Optional[Dict[str, any]]): Filtering conditions.
+
+        Returns:
+            Tuple[List[T], int]: The page of entities and the total match count.
+        """
+        page = self.list_all(
+            limit=limit, offset=offset, sort_by=sort_by, filters=filters
+        )
+        return page, self.count(filters=filters)
 
     def count(self, filters: Optional[Dict[str, any]] = None) -> int:
         """Counts the total number of entities matching the filters.
@@ -218,11 +266,97 @@ class InMemoryRepository(Generic[T]):
         if not filters:
             return len(self._storage)
 
-        return sum(
-            1
-            for entity in self._storage.values()
-            if all(getattr(entity, k) == v for k, v in filters.items())
-        )
+        return sum(1 for _ in self._matching(filters))
+
+    def _store(self, entity: T) -> None:
+        """Stores an entity and updates the field and subclass indexes.
+
+        Args:
+            entity (T): The entity to store.
+        """
+        id = self._get_id(entity)
+        self._storage[id] = entity
+        for field, index in self._field_indexes.items():
+            index.add(getattr(entity, field), id)
+        self._index(entity)
+
+    def _evict(self, id: UUID) -> None:
+        """Removes a stored entity and drops it from every index.
+
+        Args:
+            id (UUID): The ID of the entity to remove.
+        """
+        del self._storage[id]
+        for index in self._field_indexes.values():
+            index.remove(id)
+        self._unindex(id)
+
+    def _matching(self, filters: Dict[str, any]) -> Iterable[T]:
+        """Yields the entities matching every filter.
+
+        When some filtered fields are indexed, only the smallest of their
+        buckets is scanned, and entities come in that bucket's order rather
+        than storage order. Every filter is then checked per
+        entity with a single fused comparison.
+
+        Args:
+            filters (Dict[str, any]): Equality filtering conditions.
+
+        Returns:
+            Iterable[T]: The matching entities.
+        """
+        indexed = [
+            (self._field_indexes[field], value)
+            for field, value in filters.items()
+            if field in self._field_indexes and isinstance(value, Hashable)
+        ]
+        if indexed:
+            index, value = min(indexed, key=lambda pair: pair[0].size(pair[1]))
+            candidates = (self._storage[id] for id in index.get(value))
+        else:
+            candidates = iter(self._storage.values())
+
+        # One C-level call per entity: attrgetter fetches every filtered field
+        # (as a tuple when there are several) for a single comparison.
+        fields = attrgetter(*filters)
+        wanted = tuple(filters.values())
+        if len(wanted) == 1:
+            (wanted,) = wanted
+        return (entity for entity in candidates if fields(entity) == wanted)
+
+    def _index(self, entity: T) -> None:
+        """Updates secondary indexes after an entity is stored.
+
+        Called for both inserts and updates. Subclasses maintaining lookup
+        indexes should override this; the default is a no-op.
+
+        Args:
+            entity (T): The entity that was just stored.
+        """
+
+    def _unindex(self, id: UUID) -> None:
+        """Removes an entity from secondary indexes after it is deleted.
+
+        Subclasses maintaining lookup indexes should override this; the
+        default is a no-op.
+
+        Args:
+            id (UUID): The ID of the entity that was just deleted.
+        """
+
+    def _conflicts(self, entity: T) -> bool:
+        """Checks a new entity against uniqueness rules beyond its ID.
+
+        Subclasses mirroring a database unique constraint should override
+        this; the default reports no conflict.
+
+        Args:
+            entity (T): The entity about to be created.
+
+        Returns:
+            bool: True if an existing entity already claims its unique fields.
+        """
+        return False
 
     def _get_id(self, entity: T) -> UUID:
         """Extracts the ID from an entity.
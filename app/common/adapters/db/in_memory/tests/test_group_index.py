@@ -0,0 +1,59 @@
+"""Test suite for GroupIndex and SortedGroupIndex."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.common.adapters.db.in_memory.group_index import GroupIndex, SortedGroupIndex
+
+
+@pytest.fixture
+def ids():
+    """Fixture providing four entity IDs in ascending order."""
+    return sorted(uuid4() for _ in range(4))
+
+
+@pytest.fixture
+def index(ids):
+    """Fixture providing an index with every ID under one key, added out of order."""
+    index = SortedGroupIndex()
+    for id in reversed(ids):
+        index.add("key", id)
+    return index
+
+
+class TestSortedGroupIndex:
+    """Test cases for SortedGroupIndex."""
+
+    def test_get_orders_by_id(self, index, ids):
+        """Test buckets are returned in ascending ID order."""
+        assert index.get("key") == ids
+        assert index.get("key", limit=2, offset=1) == ids[1:3]
+        assert index.get("missing") == []
+
+    def test_get_after_cursor(self, index, ids):
+        """Test keyset pages start after the cursor, whether or not it is stored."""
+        assert index.get("key", limit=2, after=ids[0]) == ids[1:3]
+        index.remove(ids[1])
+        assert index.get("key", after=ids[1]) == ids[2:]
+
+    def test_add_moves_between_keys(self, index, ids):
+        """Test re-adding an entity under a new key moves it."""
+        index.add("other", ids[0])
+        index.add("other", ids[0])
+
+        assert index.get("key") == ids[1:]
+        assert index.get("other") == [ids[0]]
+
+
+@pytest.mark.parametrize("index_type", [GroupIndex, SortedGroupIndex])
+def test_remove_entity_indexed_under_none(index_type):
+    """Test that an ID stored under a ``None`` key is removed like any other."""
+    index = index_type()
+    id = uuid4()
+    index.add(None, id)
+
+    index.remove(id)
+
+    assert index.get(None) == []
+    assert index.size(None) == 0
@@ -0,0 +1,60 @@
+"""Test suite for NameIndex."""
+
+from uuid import uuid4
+
+import pytest
+
+from app.common.adapters.db.in_memory.name_index import NameIndex
+
+
+@pytest.fixture
+def ids():
+    """Fixture providing three distinct entity IDs."""
+    return uuid4(), uuid4(), uuid4()
+
+
+@pytest.fixture
+def index(ids):
+    """Fixture providing an index over a few sample names."""
+    index = NameIndex()
+    index.add(ids[0], "Acme Corp")
+    index.add(ids[1], "Acme Subsidiaries")
+    index.add(ids[2], "Other Corp", "corp.example")
+    return index
+
+
+class TestNameIndex:
+    """Test cases for NameIndex."""
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("acme", (0, 1)),
+            ("ACME CO", (0,)),
+            ("corp", (0, 2)),
+            ("example", (2,)),
+            ("me", (0, 1)),
+            ("", (0, 1, 2)),
+            ("missing", ()),
+            ("corp\x00corp", ()),
+        ],
+    )
+    def test_search(self, index, ids, query, expected):
+        """Test substring queries return matches in insertion order."""
+        assert index.search(query) == [ids[i] for i in expected]
+
+    def test_reindex_replaces_values(self, index, ids):
+        """Test re-adding an entity replaces its values but keeps its position."""
+        index.add(ids[0], "Initech")
+
+        assert index.search("acme") == [ids[1]]
+        assert index.search("initech") == [ids[0]]
+        assert index.search("i") == [ids[0], ids[1]]
+
+    def test_remove(self, index, ids):
+        """Test removed entities are no longer matched."""
+        index.remove(ids[1])
+        index.remove(uuid4())
+
+        assert index.search("acme") == [ids[0]]
+        assert index.search("sub") == []
@@ -21,19 +21,27 @@ def get_engine():
     Raises:
         RuntimeError: If database configuration is invalid
     """
-    # SQLite-specific connection parameters
     connect_args = {}
+    pool_args = {}
     if "sqlite" in settings.db_url:
+        # SQLite-specific connection parameters; its pools take no sizing
         connect_args["check_same_thread"] = False
+    else:
+        # Keep connections open across requests instead of reconnecting
+        pool_args = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+        }
 
     try:
         return create_engine(
             settings.db_url,
             connect_args=connect_args,
-            # pool_size=settings.db_pool_size,
-            # max_overflow=settings.db_max_overflow,
-            # pool_recycle=settings.db_pool_recycle,
-            # echo=settings.db_echo,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            echo=settings.db_echo,
+            **pool_args,
         )
     except Exception as e:
         raise RuntimeError(f"Failed to initialize database engine: {str(e)}") from e
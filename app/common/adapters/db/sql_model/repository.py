@@ -1,18 +1,68 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import DeclarativeBase
-from sqlmodel import Session, delete, func, select
+from sqlmodel import Session, delete, func, insert, select
 
+from app.common import clock
 from app.common.exceptions import RecordNotFoundError, RepositoryError, ValidationError
 
 T = TypeVar("T")  # Domain entity type
 M = TypeVar("M", bound=DeclarativeBase)  # SQLAlchemy model type
 
+# Number of distinct rows whose converted entity fields are kept per session
+ENTITY_CACHE_SIZE = 4096
+
+# Key of the per-session row conversion cache in ``Session.info``
+_ENTITY_CACHE_KEY = "sql_model_entity_fields"
+
+# Dialect INSERT constructs that support ``ON CONFLICT DO NOTHING``
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _entity_fields(
+    row_to_entity: Callable[[Mapping[str, Any]], Any],
+    row: Mapping[str, Any],
+) -> Tuple[type, Dict[str, Any]]:
+    """Converts a row and extracts the validated entity fields.
+
+    Only the fields set from the row are kept; they are all immutable
+    scalars or frozen value objects, which makes them safe to share between
+    entities.
+
+    Args:
+        row_to_entity: The repository's row conversion function.
+        row: Column values keyed by column name.
+
+    Returns:
+        Tuple[type, Dict[str, Any]]: The entity class and its validated fields.
+    """
+    entity = row_to_entity(row)
+    fields = {name: getattr(entity, name) for name in entity.model_fields_set}
+    return type(entity), fields
+
 
 class SQLModelRepository(Generic[T, M]):
     """SQLAlchemy-based repository for managing database entities."""
 
+    # Rows fetched per round trip when streaming query results
+    YIELD_PER = 256
+
     def __init__(self, session: Session, model: Type[M]):
         """Initializes the repository.
 
@@ -45,6 +95,54 @@ class SQLModelRepository(Generic[T, M]):
             self.session.rollback()
             raise RepositoryError(f"Failed to save entity {self.model.__name__}") from e
 
+    def create(self, entity: T) -> Optional[T]:
+        """Inserts a new entity unless it violates a unique constraint.
+
+        Unlike `save`, nothing is merged or refreshed: a single
+        ``INSERT ... ON CONFLICT DO NOTHING RETURNING id`` both writes the row
+        and reports a duplicate, so there is no separate existence check to
+        race with. Dialects without ``ON CONFLICT`` fall back to catching
+        the integrity error.
+
+        Args:
+            entity (T): The new entity to insert.
+
+        Returns:
+            Optional[T]: The inserted entity, or None if it conflicts with
+                an existing row.
+
+        Raises:
+            RepositoryError: If a database error occurs.
+        """
+        row = self._to_model(entity).model_dump()
+        dialect_insert = _UPSERT_INSERTS.get(self.session.get_bind().dialect.name)
+        try:
+            if dialect_insert is None:
+                self.session.execute(insert(self.model).values(**row))
+                created = True
+            else:
+                stmt = (
+                    dialect_insert(self.model)
+                    .values(**row)
+                    .on_conflict_do_nothing()
+                    .returning(self.model.id)
+                )
+                created = self.session.execute(stmt).scalar_one_or_none() is not None
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            if dialect_insert is None:
+                return None
+            raise RepositoryError(
+                f"Failed to create entity {self.model.__name__}"
+            ) from e
+        except Exception as e:
+            self.session.rollback()
+            raise RepositoryError(
+                f"Failed to create entity {self.model.__name__}"
+            ) from e
+        return entity if created else None
+
     def bulk_save(self, entities: List[T]) -> List[T]:
         """Saves multiple entities in a single transaction.
 
@@ -68,9 +166,50 @@ class SQLModelRepository(Generic[T, M]):
                 f"Failed to bulk save entities of type {self.model.__name__}"
             ) from e
 
+    def create_many(self, entities: List[T], now: Optional[datetime] = None) -> List[T]:
+        """Inserts new entities with a single executemany INSERT.
+
+        Unlike `bulk_save`, nothing is merged or flushed through the unit of
+        work, so this is only for entities that do not exist yet. The clock
+        is read once and the batch shares one ``created_at`` timestamp, which
+        also becomes ``updated_at`` on entities that track modifications.
+
+        Args:
+            entities (List[T]): The new entities to insert.
+            now (Optional[datetime]): Creation timestamp for the batch.
+                Defaults to the current request's clock.
+
+        Returns:
+            List[T]: The inserted entities, stamped with ``created_at``.
+
+        Raises:
+            RepositoryError: If a database error occurs.
+        """
+        if not entities:
+            return []
+
+        now = now or clock.now()
+        stamp = {"created_at": now}
+        if "updated_at" in type(entities[0]).model_fields:
+            stamp["updated_at"] = now
+        entities = [entity.model_copy(update=stamp) for entity in entities]
+        try:
+            rows = [self._to_model(entity).model_dump() for entity in entities]
+            self.session.execute(insert(self.model), rows)
+            self.session.commit()
+            return entities
+        except Exception as e:
+            self.session.rollback()
+            raise RepositoryError(
+                f"Failed to create entities of type {self.model.__name__}"
+            ) from e
+
     def get(self, id: UUID) -> T:
         """Retrieves an entity by its ID.
 
+        Instances already loaded in the session are served from its identity
+        map without a round trip.
+
         Args:
             id (UUID): The ID of the entity.
 
@@ -80,9 +219,7 @@ class SQLModelRepository(Generic[T, M]):
         Raises:
             RecordNotFoundError: If the entity does not exist.
         """
-        stmt = select(self.model).where(self.model.id == id)
-        result = self.session.execute(stmt)
-        db_model = result.scalar_one_or_none()
+        db_model = self.session.get(self.model, id)
         if not db_model:
             raise RecordNotFoundError(entity_type=self.model.__name__, identifier=id)
         return self._to_entity(db_model)
@@ -106,6 +243,46 @@ class SQLModelRepository(Generic[T, M]):
         results = self.session.exec(stmt).all()
         return [self._to_entity(model) for model in results]
 
+    def list_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        filters: Optional[dict] = None,
+    ) -> Tuple[List[T], int]:
+        """Lists one page of entities together with the total number of matches.
+
+        The total comes from a ``COUNT(*) OVER ()`` window on the page query,
+        so rows and count share one round trip and one scan. Only a page past
+        the last match, which carries no rows to read the total from, falls
+        back to a separate `count`.
+
+        Args:
+            limit (int): Maximum number of entities to return.
+            offset (int): Number of entities to skip.
+            sort_by (Optional[str]): Column name to sort by.
+            filters (Optional[dict]): Filtering conditions.
+
+        Returns:
+            Tuple[List[T], int]: The page of entities and the total match count.
+        """
+        stmt = (
+            select(self.model, func.count().over().label("total"))
+            .limit(limit)
+            .offset(offset)
+        )
+
+        if filters:
+            stmt = self._filter(stmt, filters)
+
+        if sort_by:
+            stmt = stmt.order_by(getattr(self.model, sort_by))
+
+        rows = self.session.execute(stmt).all()
+        if not rows:
+            return [], self.count(filters=filters) if offset else 0
+        return [self._to_entity(model) for model, _ in rows], rows[0].total
+
     def find_one(self, filters: Dict[str, Any]) -> Optional[T]:
         """Finds a single entity that matches the given filters.
 
@@ -121,10 +298,8 @@ class SQLModelRepository(Generic[T, M]):
         if not filters:
             raise ValidationError("Filters are required for find_one.")
 
-        stmt = select(self.model)
-        stmt = self._filter(stmt, filters)
-        result = self.session.exec(stmt)
-        db_model = result.first()
+        stmt = self._filter(select(self.model), filters).limit(1)
+        db_model = self.session.scalar(stmt)
         return self._to_entity(db_model) if db_model else None
 
     def exists(self, filters: Dict[str, Any]) -> bool:
@@ -142,10 +317,8 @@ class SQLModelRepository(Generic[T, M]):
         if not filters:
             raise ValidationError("Filters are required for exists check.")
 
-        stmt = select(func.count()).select_from(self.model)
-        stmt = self._filter(stmt, filters)
-        result = self.session.execute(stmt)
-        return result.scalar_one() > 0
+        stmt = self._filter(select(self.model.id), filters).limit(1)
+        return self.session.scalar(stmt) is not None
 
     def delete(self, id: UUID) -> bool:
         """Deletes an entity by its ID.
@@ -205,8 +378,66 @@ class SQLModelRepository(Generic[T, M]):
         if filters:
             stmt = self._filter(stmt, filters)
 
-        result = self.session.exec(stmt)
-        return result.one()
+        return self.session.scalar(stmt)
+
+    def _select_columns(self):
+        """Builds a Core select of the model's table columns.
+
+        Selecting columns rather than the mapped class skips ORM instance
+        hydration and identity-map bookkeeping; pair it with `_stream`.
+
+        Returns:
+            The select statement over every column of the model's table.
+        """
+        return select(*self.model.__table__.columns)
+
+    def _stream(self, stmt) -> Iterator[T]:
+        """Executes a column select and yields domain entities lazily.
+
+        Rows are fetched in batches of ``YIELD_PER`` and converted straight
+        from their column mappings by `_row_to_entity`, so no ORM instances
+        are built and the full result set is never held alongside the
+        converted entities. Conversions are memoized per row, see
+        `_cached_row_to_entity`.
+
+        Args:
+            stmt: A select statement built from `_select_columns`.
+
+        Yields:
+            T: The domain entity for each result row.
+        """
+        result = self.session.execute(stmt.execution_options(yield_per=self.YIELD_PER))
+        for row in result.mappings():
+            yield self._cached_row_to_entity(row)
+
+    def _cached_row_to_entity(self, row: Mapping[str, Any]) -> T:
+        """Converts a row to a domain entity, reusing earlier validation.
+
+        Re-reading an unchanged row skips entity validation: the cached
+        fields are assembled with ``model_construct``, which still builds
+        fresh defaults, so every caller gets its own mutable entity.
+
+        The cache is keyed by the full tuple of column values, so a changed
+        row never hits a stale entry. It lives in ``Session.info`` and is
+        dropped with the session, so converted rows, credential columns
+        included, never outlive the request that read them. At most
+        ``ENTITY_CACHE_SIZE`` rows are kept.
+
+        Args:
+            row (Mapping[str, Any]): Column values keyed by column name.
+
+        Returns:
+            T: The domain entity for the row.
+        """
+        cache = self.session.info.setdefault(_ENTITY_CACHE_KEY, {})
+        key = (self._row_to_entity, tuple(row.items()))
+        cached = cache.get(key)
+        if cached is None:
+            cached = _entity_fields(self._row_to_entity, row)
+            if len(cache) < ENTITY_CACHE_SIZE:
+                cache[key] = cached
+        entity_type, fields = cached
+        return entity_type.model_construct(_fields_set=set(fields), **fields)
 
     def _to_model(self, entity: T) -> M:
         """Converts a domain entity to an SQLAlchemy model."""
@@ -216,6 +447,11 @@ class SQLModelRepository(Generic[T, M]):
         """Converts an SQLAlchemy model to a domain entity."""
         raise NotImplementedError("Subclasses must implement `_to_entity`")
 
+    @staticmethod
+    def _row_to_entity(row: Mapping[str, Any]) -> T:
+        """Converts a mapping of table column values to a domain entity."""
+        raise NotImplementedError("Subclasses must implement `_row_to_entity`")
+
     def _filter(self, stmt, filters: Dict[str, Any]):
         """Applies filters to a query statement.
 
@@ -7,24 +7,29 @@ Provides:
 - Thread-safe session handling
 """
 
+from typing import Iterator
+
 from sqlmodel import Session, SQLModel
 
 from .config import engine
 
 
-def get_session() -> Session:
-    """Context manager for database sessions with automatic cleanup.
+def get_session() -> Iterator[Session]:
+    """Provide one database session per request.
+
+    Used as a FastAPI dependency. FastAPI caches it per request, so every
+    service factory depending on it shares the same session and connection,
+    and the session is closed once the response has been sent.
 
     Usage:
-        with get_session() as session:
-            session.add(...)
-            session.commit()
+        def get_service(session: Session = Depends(get_session)):
+            ...
 
     Yields:
         Session: Database session bound to the engine's connection pool
     """
     with Session(engine) as session:
-        return session
+        yield session
 
 
 def create_db_and_tables():
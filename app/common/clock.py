@@ -0,0 +1,55 @@
+"""Request-scoped clock shared by everything handling one request.
+
+`RequestClockMiddleware` reads the clock once when a request starts and
+publishes it through `request_now`, so timestamps stamped while serving that
+request agree with each other and skip further clock reads.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+request_now: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+Scope = Dict[str, Any]
+ASGIApp = Callable[[Scope, Callable, Callable], Awaitable[None]]
+
+
+def now() -> datetime:
+    """Return the current request's start time, or the current time.
+
+    Returns:
+        datetime: The time captured for the current request when inside one,
+            otherwise the current local time.
+    """
+    return request_now.get() or datetime.now()
+
+
+class RequestClockMiddleware:
+    """ASGI middleware capturing the request start time in `request_now`.
+
+    Implemented as plain ASGI rather than an ``@app.middleware("http")``
+    function so it adds no extra task or response wrapping per request.
+
+    Example:
+        >>> app.add_middleware(RequestClockMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initializes the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Callable, send: Callable) -> None:
+        """Serve a request with its start time published in `request_now`."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = request_now.set(datetime.now())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_now.reset(token)
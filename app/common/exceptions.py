@@ -20,12 +20,16 @@ class DomainError(Exception):
         >>> raise DomainError("Invalid operation", code="INVALID_OP")
     """
 
+    code: str | None = "DOMAIN_ERROR"
+    """Default error code; subclasses override it and callers may pass their own."""
+
     def __init__(
         self, message: str, code: str | None = None, details: dict | None = None
     ) -> None:
         super().__init__(message)
         self.message = message
-        self.code = code
+        if code is not None:
+            self.code = code
         self.details = details or {}
 
 
@@ -42,7 +46,7 @@ class ValidationError(DomainError):
         ... )
     """
 
-    pass
+    code = "VALIDATION_ERROR"
 
 
 class RepositoryError(DomainError):
@@ -57,16 +61,19 @@ class RepositoryError(DomainError):
         ... )
     """
 
-    pass
+    code = "REPOSITORY_ERROR"
 
 
 class RecordNotFoundError(RepositoryError):
     """Exception for when a requested record does not exist.
 
     Raised when attempting to retrieve, update, or delete a non-existent record.
+    Only the entity type and identifier are stored on raise; the message and
+    details are built when first read, since handlers usually only need `code`.
 
     Args:
         entity_type: Type of entity that was not found (e.g., "User", "Organization").
+            Subclasses set it as a class attribute and may omit it.
         identifier: The ID or key used in the lookup.
 
     Example:
@@ -77,19 +84,44 @@ class RecordNotFoundError(RepositoryError):
         ... )
     """
 
+    code = "RECORD_NOT_FOUND"
+    entity_type: str = "Record"
+
     def __init__(
         self,
-        entity_type: str,
-        identifier: str | int,
+        entity_type: str | None = None,
+        identifier: str | int | None = None,
         code: str | None = None,
         details: dict | None = None,
     ) -> None:
-        message = f"{entity_type} with identifier '{identifier}' not found"
-        super().__init__(
-            message=message,
-            code=code or f"{entity_type.upper()}_NOT_FOUND",
-            details=details or {"entity_type": entity_type, "identifier": identifier},
-        )
+        # Skip DomainError.__init__, which would need the formatted message.
+        Exception.__init__(self, entity_type, identifier)
+        if entity_type is not None:
+            self.entity_type = entity_type
+        self.identifier = identifier
+        if code is not None:
+            self.code = code
+        elif entity_type is not None:
+            self.code = f"{self.entity_type.upper()}_NOT_FOUND"
+        self._details = details
+
+    @property
+    def message(self) -> str:
+        """str: Human-readable description, formatted on access."""
+        return f"{self.entity_type} with identifier '{self.identifier}' not found"
+
+    @property
+    def details(self) -> dict:
+        """dict: Caller-supplied details, or the entity type and identifier."""
+        if self._details is None:
+            self._details = {
+                "entity_type": self.entity_type,
+                "identifier": self.identifier,
+            }
+        return self._details
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ApplicationError(DomainError):
@@ -105,10 +137,10 @@ class ApplicationError(DomainError):
         ... )
     """
 
-    pass
+    code = "APPLICATION_ERROR"
 
 
-class TokenError(Exception):
+class TokenError(DomainError):
     """Base exception for token-related errors.
 
     Parent class for specific token error types. Should not be raised directly,
@@ -121,6 +153,8 @@ class TokenError(Exception):
         details: Optional dictionary with error details.
     """
 
+    code = "TOKEN_ERROR"
+
     def __init__(
         self,
         message: str,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
 T = TypeVar("T")  # Domain entity type
@@ -10,6 +10,8 @@ class RepositoryInterface(Generic[T]):
     All repository implementations must adhere to this contract.
     """
 
+    __slots__ = ()
+
     def save(self, entity: T) -> T:
         """Saves an entity in the repository.
 
@@ -24,6 +26,21 @@ class RepositoryInterface(Generic[T]):
         """
         pass
 
+    def create(self, entity: T) -> Optional[T]:
+        """Inserts a new entity unless it conflicts with an existing one.
+
+        Args:
+            entity (T): The new entity to insert.
+
+        Returns:
+            Optional[T]: The inserted entity, or None if it conflicts with
+                an existing entity.
+
+        Raises:
+            RepositoryError: If an error occurs during insert.
+        """
+        pass
+
     def bulk_save(self, entities: List[T]) -> List[T]:
         """Saves multiple entities in a single transaction.
 
@@ -132,6 +149,32 @@ class RepositoryInterface(Generic[T]):
         """
         pass
 
+    def list_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[T], int]:
+        """Lists one page of entities together with the total number of matches.
+
+        Equivalent to `list_all` followed by `count` with the same filters,
+        but implementations may answer both in a single query.
+
+        Args:
+            limit (int, optional): Maximum number of entities to return. Defaults to 100.
+            offset (int, optional): Number of entities to skip. Defaults to 0.
+            sort_by (Optional[str], optional): Column name to sort by. Defaults to None.
+            filters (Optional[Dict[str, Any]], optional): Filtering conditions. Defaults to None.
+
+        Returns:
+            Tuple[List[T], int]: The page of entities and the total match count.
+
+        Raises:
+            ValidationError: If invalid filters are provided.
+        """
+        pass
+
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Counts the total number of entities matching the filters.
 
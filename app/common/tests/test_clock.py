@@ -0,0 +1,41 @@
+"""Test suite for the request-scoped clock."""
+
+import asyncio
+from datetime import datetime
+
+from app.common import clock
+from app.common.clock import RequestClockMiddleware, request_now
+
+
+class TestClock:
+    """Test cases for the request-scoped clock."""
+
+    def test_now_outside_request_reads_clock(self):
+        """Test the current time is returned when no request is active."""
+        before = datetime.now()
+
+        assert before <= clock.now() <= datetime.now()
+
+    def test_middleware_shares_one_time_per_request(self):
+        """Test every read during a request returns its start time."""
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.extend([clock.now(), clock.now(), request_now.get()])
+
+        middleware = RequestClockMiddleware(app)
+        asyncio.run(middleware({"type": "http"}, None, None))
+
+        assert seen[0] is seen[1] is seen[2]
+        assert request_now.get() is None
+
+    def test_middleware_ignores_non_http_scopes(self):
+        """Test lifespan and websocket scopes get no request time."""
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(request_now.get())
+
+        asyncio.run(RequestClockMiddleware(app)({"type": "lifespan"}, None, None))
+
+        assert seen == [None]
@@ -0,0 +1,35 @@
+from app.accounts.exceptions import InactiveUserError, UserNotFoundError
+from app.common.exceptions import (
+    DomainError,
+    RecordNotFoundError,
+    RepositoryError,
+    ValidationError,
+)
+
+
+def test_record_not_found_formats_message_on_access():
+    """Test that the message and details are built from the stored identifier."""
+    exc = RecordNotFoundError(entity_type="Merchant", identifier="123")
+
+    assert exc.code == "MERCHANT_NOT_FOUND"
+    assert exc.identifier == "123"
+    assert str(exc) == "Merchant with identifier '123' not found"
+    assert exc.details == {"entity_type": "Merchant", "identifier": "123"}
+
+
+def test_subclasses_carry_class_level_codes():
+    """Test that domain subclasses expose their code without being passed one."""
+    not_found = UserNotFoundError(identifier="user@example.com")
+
+    assert not_found.code == "USER_NOT_FOUND"
+    assert str(not_found) == "User with identifier 'user@example.com' not found"
+    assert InactiveUserError("User account is not active").code == "INACTIVE_USER"
+    assert InactiveUserError("inactive", code="CUSTOM").code == "CUSTOM"
+
+
+def test_common_base_classes_carry_codes():
+    """Test that the common base exceptions never report a null code."""
+    assert DomainError("failed").code == "DOMAIN_ERROR"
+    assert ValidationError("bad input").code == "VALIDATION_ERROR"
+    assert RepositoryError("db down").code == "REPOSITORY_ERROR"
+    assert RecordNotFoundError().code == "RECORD_NOT_FOUND"
@@ -0,0 +1,27 @@
+"""Test suite for time-ordered identifiers."""
+
+import uuid
+from unittest.mock import patch
+
+from app.common.ids import uuid7
+
+
+class TestUUID7:
+    """Test cases for uuid7."""
+
+    def test_sets_version_and_variant(self):
+        """Test generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_orders_by_creation_time(self):
+        """Test IDs from a later millisecond sort after earlier ones."""
+        with patch("app.common.ids.time.time_ns", return_value=1_700_000_000 * 10**9):
+            earlier = uuid7()
+        with patch("app.common.ids.time.time_ns", return_value=1_700_000_001 * 10**9):
+            later = uuid7()
+
+        assert earlier < later
+        assert earlier.int >> 80 == 1_700_000_000_000
@@ -23,7 +23,9 @@ class DomainName(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     # Class constants with type annotations
-    DOMAIN_PATTERN: ClassVar[str] = r"^([a-z0-9]+(-[a-z0-9]+)*\.)+[a-z]{2,}$"
+    DOMAIN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^([a-z0-9]+(-[a-z0-9]+)*\.)+[a-z]{2,}$"
+    )
     MAX_LENGTH: ClassVar[int] = 253  # RFC 1035 limit
 
     @field_validator("value", mode="before")
@@ -48,7 +50,7 @@ class DomainName(BaseModel):
         if len(domain) > cls.MAX_LENGTH:
             raise ValueError(f"Domain must be less than {cls.MAX_LENGTH} characters")
 
-        if not re.match(cls.DOMAIN_PATTERN, domain):
+        if not cls.DOMAIN_PATTERN.match(domain):
             raise ValueError(
                 "Invalid domain format. Must be a valid domain name (e.g., example.com)"
             )
@@ -1,5 +1,7 @@
 import re
-from typing import Any
+import unicodedata
+from functools import lru_cache
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
@@ -27,10 +29,65 @@ class Email(BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    EMAIL_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    )
+
     def __init__(self, value: str, **kwargs: Any) -> None:
         """Initialize Email with a string value directly."""
         super().__init__(value=value, **kwargs)
 
+    @classmethod
+    def from_trusted(cls, value: str) -> "Email":
+        """Build an Email from an address that is already normalized.
+
+        Skips validation, so it must only be used for values that went
+        through `Email` before, such as addresses read back from storage.
+
+        Args:
+            value: Previously validated and normalized email string.
+
+        Returns:
+            Email wrapping the value as-is.
+        """
+        return cls.model_construct(value=value)
+
+    @staticmethod
+    def lookup_key(address: "str | Email") -> str:
+        """Fold an address into the form used for case-insensitive lookups.
+
+        Stored alongside the address so lookups compare plain values and can
+        use an ordinary index instead of evaluating ``lower(email)``.
+
+        Args:
+            address: Email string or value object.
+
+        Returns:
+            The stripped, NFKC-normalized and casefolded address.
+        """
+        return unicodedata.normalize("NFKC", str(address).strip()).casefold()
+
+    @classmethod
+    def parse(cls, value: str) -> "Email":
+        """Build an Email from untrusted input, reusing earlier results.
+
+        Validated emails are immutable, so the most recently parsed
+        addresses are kept and shared between callers, which spares
+        re-validating the same address on every request.
+
+        Args:
+            value: Email string to validate.
+
+        Returns:
+            The validated Email.
+
+        Raises:
+            ValueError: If email format is invalid.
+        """
+        if type(value) is not str:
+            return cls(value)
+        return _parse_cached(value)
+
     @field_validator("value", mode="before")
     @classmethod
     def validate_and_normalize_email(cls, v: str) -> str:
@@ -50,8 +107,7 @@ class Email(BaseModel):
 
         v = v.strip()
 
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, v):
+        if not cls.EMAIL_PATTERN.match(v):
             raise ValueError("Invalid email format")
 
         parts = v.split("@")
@@ -66,3 +122,29 @@ class Email(BaseModel):
             Normalized email string.
         """
         return self.value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare emails by their normalized address.
+
+        Args:
+            other: Object to compare against.
+
+        Returns:
+            True if other is an Email with the same address.
+        """
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self) -> int:
+        """Hash the normalized address, which caches its own hash.
+
+        Returns:
+            Hash of the email string.
+        """
+        return hash(self.value)
+
+
+_parse_cached = lru_cache(maxsize=4096)(Email)
@@ -0,0 +1,51 @@
+"""Test suite for the Email value object."""
+
+import pytest
+
+from app.common.value_objects.email import Email
+
+
+class TestEmail:
+    """Test cases for Email value object."""
+
+    def test_normalizes_domain(self):
+        """Test the domain is lowercased while the local part keeps its case."""
+        assert Email(" John.Doe@EXAMPLE.COM ").value == "John.Doe@example.com"
+
+    def test_invalid_email(self):
+        """Test malformed addresses are rejected."""
+        with pytest.raises(ValueError):
+            Email("not-an-email")
+
+    def test_from_trusted_equals_validated(self):
+        """Test trusted construction yields an equal, hashable value object."""
+        trusted = Email.from_trusted("john@example.com")
+
+        assert trusted == Email("john@example.com")
+        assert hash(trusted) == hash(Email("john@example.com"))
+        assert str(trusted) == "john@example.com"
+
+    def test_equality_is_by_address(self):
+        """Test emails compare by normalized address and never equal plain strings."""
+        email = Email("john@EXAMPLE.com")
+
+        assert email == Email("john@example.com")
+        assert email != Email("jane@example.com")
+        assert email != "john@example.com"
+        assert {email: True}[Email("john@example.com")]
+
+    def test_parse_reuses_validated_emails(self):
+        """Test repeated parses share one instance and still reject bad input."""
+        email = Email.parse("john@EXAMPLE.com")
+
+        assert email == Email("john@example.com")
+        assert Email.parse("john@EXAMPLE.com") is email
+        with pytest.raises(ValueError):
+            Email.parse("not-an-email")
+        with pytest.raises(ValueError):
+            Email.parse(None)
+
+    def test_lookup_key_folds_case(self):
+        """Test lookup keys ignore case and accept strings or value objects."""
+        assert Email.lookup_key(Email("John.Doe@EXAMPLE.com")) == "john.doe@example.com"
+        assert Email.lookup_key(" JOHN.DOE@example.com ") == "john.doe@example.com"
@@ -15,11 +15,27 @@ Note:
    and proper security settings in a production environment.
 """
 
+from functools import lru_cache
+
+import anyio.to_thread
+import orjson
 from fastadmin import fastapi_app as admin_app
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.accounts.ports.rest.exception_handlers import register_exception_handlers
 from app.accounts.ports.rest.router import accounts_router
+from app.common.adapters.db.sql_model.config import engine
 from app.common.adapters.db.sql_model.session import create_db_and_tables
+from app.common.clock import RequestClockMiddleware
+from app.settings import settings
 
 project_description = """
    Payment Gateway microservice providing secure payment processing capabilities.
@@ -40,21 +56,43 @@ app = FastAPI(
     title="Payment Gateway API",
     description=project_description,
     version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # Served by the routes below, which reuse one serialized schema.
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    default_response_class=ORJSONResponse,
 )
 
 
+# Middleware
+app.add_middleware(RequestClockMiddleware)
+
 # API Routes
 app.mount("/admin", admin_app)
 app.include_router(accounts_router)  # Accounts Manager Router
 
+# Exception Handlers
+register_exception_handlers(app)
+
 
 @app.on_event("startup")
 def on_startup():
     create_db_and_tables()
 
 
+@app.on_event("startup")
+async def configure_threadpool():
+    """Size the worker threadpool that runs the sync endpoints.
+
+    Endpoints do blocking database and hashing work, so FastAPI runs them on
+    AnyIO's thread limiter (40 threads by default). Matching it to the
+    database pool (``db_pool_size + db_max_overflow``) lets every connection
+    be used at once without parking extra threads on the pool timeout.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.threadpool_size
+
+
 @app.get("/health")
 async def health_check():
     """Payment gateway health check endpoint.
@@ -70,3 +108,65 @@ async def health_check():
             - service: Service identifier ("payment-gateway")
     """
     return {"status": "healthy", "service": "payment-gateway"}
+
+
+@app.get("/health/db")
+def database_health_check():
+    """Database connectivity check through the engine's connection pool.
+
+    Runs ``SELECT 1`` on a pooled connection; with ``pool_pre_ping`` enabled,
+    a connection the server has dropped is replaced before the query runs.
+
+    Returns:
+        dict: Health status containing:
+            - status: "healthy" if the query succeeded, "unhealthy" otherwise
+            - service: Service identifier ("database")
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unhealthy", "service": "database"},
+        )
+    return {"status": "healthy", "service": "database"}
+
+
+# API Documentation
+@lru_cache(maxsize=1)
+def _openapi_json() -> bytes:
+    """Serialize the OpenAPI schema once, on first request.
+
+    The routes are fixed once the app has started, so the schema never
+    changes; building it lazily keeps schema generation off the import path.
+    """
+    return orjson.dumps(app.openapi())
+
+
+@app.get("/openapi.json", include_in_schema=False)
+def openapi_schema() -> Response:
+    """Serve the cached OpenAPI schema."""
+    return Response(_openapi_json(), media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+def swagger_ui() -> HTMLResponse:
+    """Serve the Swagger UI for the cached OpenAPI schema."""
+    return get_swagger_ui_html(
+        openapi_url="/openapi.json",
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url="/docs/oauth2-redirect",
+    )
+
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+def swagger_ui_redirect() -> HTMLResponse:
+    """Complete Swagger UI's OAuth2 login flow."""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", include_in_schema=False)
+def redoc() -> HTMLResponse:
+    """Serve ReDoc for the cached OpenAPI schema."""
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
@@ -11,10 +11,17 @@ class Settings(BaseSettings):
     debug: bool = False
     jwt: JWTAuthSettings
     db_url: str = "sqlite:///test.db"
-    db_pool_size: int = 1
-    db_max_overflow: int = 1
-    db_pool_recycle: int = 1
-    db_echo: int = 1
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_echo: bool = False
+    threadpool_size: int = 30  # db_pool_size + db_max_overflow
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 64 * 1024  # KiB
+    argon2_parallelism: int = 4
+    argon2_max_concurrency: int | None = None  # Defaults to the CPU count
     db_connect_args: dict = {
         "check_same_thread": False
     }  # SQLite-specific connection arguments for thread safety